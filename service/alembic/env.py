@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # 导入应用配置和模型
 from app.core.config import settings
 from app.db.base import Base
+from app.db.search import is_search_object
 from app.models import *  # 导入所有模型
 
 # 这是Alembic配置对象
@@ -34,6 +35,13 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """忽略由迁移手工维护的搜索索引和FTS虚拟表，避免自动生成时被误删"""
+    if reflected and compare_to is None and name and is_search_object(name):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """在"离线"模式下运行迁移。
 
@@ -52,6 +60,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -76,6 +85,7 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
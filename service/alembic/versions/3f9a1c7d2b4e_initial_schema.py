@@ -0,0 +1,72 @@
+"""initial schema
+
+Revision ID: 3f9a1c7d2b4e
+Revises: 
+Create Date: 2026-10-17 09:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a1c7d2b4e'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=320), nullable=False),
+    sa.Column('hashed_password', sa.String(length=1024), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('is_superuser', sa.Boolean(), nullable=False),
+    sa.Column('is_verified', sa.Boolean(), nullable=False),
+    sa.Column('username', sa.String(length=50), nullable=True, comment='用户名'),
+    sa.Column('full_name', sa.String(length=100), nullable=True, comment='全名'),
+    sa.Column('phone', sa.String(length=20), nullable=True, comment='手机号'),
+    sa.Column('avatar', sa.String(length=255), nullable=True, comment='头像URL'),
+    sa.Column('bio', sa.Text(), nullable=True, comment='个人简介'),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False, comment='是否已删除'),
+    sa.Column('last_login_at', sa.DateTime(), nullable=True, comment='最后登录时间'),
+    sa.Column('login_count', sa.Integer(), nullable=False, comment='登录次数'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='创建时间'),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, comment='更新时间'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+    op.create_table('demos',
+    sa.Column('id', sa.Integer(), nullable=False, comment='主键ID'),
+    sa.Column('name', sa.String(length=100), nullable=False, comment='名称'),
+    sa.Column('description', sa.Text(), nullable=True, comment='描述'),
+    sa.Column('status', sa.String(length=20), nullable=False, comment='状态: active, inactive, pending'),
+    sa.Column('priority', sa.Integer(), nullable=False, comment='优先级，数字越大优先级越高'),
+    sa.Column('is_featured', sa.Boolean(), nullable=False, comment='是否推荐'),
+    sa.Column('owner_id', sa.Integer(), nullable=False, comment='所有者ID'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='创建时间'),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, comment='更新时间'),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False, comment='是否已删除'),
+    sa.Column('deleted_at', sa.DateTime(), nullable=True, comment='删除时间'),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_demos_id'), 'demos', ['id'], unique=False)
+    op.create_index(op.f('ix_demos_name'), 'demos', ['name'], unique=False)
+    op.create_table('demo_counters',
+    sa.Column('name', sa.String(length=20), nullable=False, comment='统计项'),
+    sa.Column('value', sa.BigInteger(), nullable=False, comment='计数值'),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('demo_counters')
+    op.drop_index(op.f('ix_demos_name'), table_name='demos')
+    op.drop_index(op.f('ix_demos_id'), table_name='demos')
+    op.drop_table('demos')
+    op.drop_index(op.f('ix_users_username'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
@@ -0,0 +1,52 @@
+"""demo access indexes
+
+为 CRUDDemo 的查询模式添加复合/部分索引（仅覆盖未删除记录）。
+PostgreSQL 上使用 CREATE INDEX CONCURRENTLY，避免建索引期间锁住写入。
+
+Revision ID: 8c4e2a6b1d93
+Revises: 3f9a1c7d2b4e
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4e2a6b1d93'
+down_revision = '3f9a1c7d2b4e'
+branch_labels = None
+depends_on = None
+
+
+# (索引名, 列, PostgreSQL 条件, SQLite 条件)
+INDEXES = [
+    ('ix_demos_owner_id_live', ['owner_id', 'id'],
+     'is_deleted = false', 'is_deleted = 0'),
+    ('ix_demos_status_live', ['status', 'id'],
+     'is_deleted = false', 'is_deleted = 0'),
+    ('ix_demos_featured_priority', ['priority', 'id'],
+     'is_featured = true AND is_deleted = false', 'is_featured = 1 AND is_deleted = 0'),
+    ('ix_demos_priority_live', ['priority', 'id'],
+     'is_deleted = false', 'is_deleted = 0'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns, postgresql_where, sqlite_where in INDEXES:
+            op.create_index(
+                name,
+                'demos',
+                columns,
+                unique=False,
+                postgresql_where=sa.text(postgresql_where),
+                sqlite_where=sa.text(sqlite_where),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='demos', postgresql_concurrently=True)
@@ -0,0 +1,69 @@
+"""demo search
+
+Demo 名称/描述关键词搜索结构：
+PostgreSQL 启用 pg_trgm，创建三元组 GIN 索引和 tsvector 表达式索引（CONCURRENTLY）；
+SQLite 创建 FTS5 trigram 外部内容表及同步触发器，并从 demos 表重建索引内容。
+
+Revision ID: d27b5e0c4a18
+Revises: 8c4e2a6b1d93
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd27b5e0c4a18'
+down_revision = '8c4e2a6b1d93'
+branch_labels = None
+depends_on = None
+
+
+POSTGRESQL_INDEXES = [
+    ('ix_demos_name_trgm', 'USING gin (name gin_trgm_ops)'),
+    ('ix_demos_description_trgm', 'USING gin (description gin_trgm_ops)'),
+    ('ix_demos_search_vector',
+     "USING gin (to_tsvector('simple'::regconfig, "
+     "coalesce(name, '') || ' ' || coalesce(description, '')))"),
+]
+
+SQLITE_STATEMENTS = [
+    "CREATE VIRTUAL TABLE demos_fts USING fts5("
+    "name, description, content='demos', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER demos_fts_ai AFTER INSERT ON demos BEGIN "
+    "INSERT INTO demos_fts(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER demos_fts_ad AFTER DELETE ON demos BEGIN "
+    "INSERT INTO demos_fts(demos_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    "CREATE TRIGGER demos_fts_au AFTER UPDATE OF name, description ON demos BEGIN "
+    "INSERT INTO demos_fts(demos_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "INSERT INTO demos_fts(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    "INSERT INTO demos_fts(demos_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        with op.get_context().autocommit_block():
+            for name, definition in POSTGRESQL_INDEXES:
+                op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON demos {definition}')
+    elif dialect == 'sqlite':
+        for statement in SQLITE_STATEMENTS:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, _ in reversed(POSTGRESQL_INDEXES):
+                op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+    elif dialect == 'sqlite':
+        for trigger in ('demos_fts_au', 'demos_fts_ad', 'demos_fts_ai'):
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS demos_fts')
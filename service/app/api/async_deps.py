@@ -0,0 +1,161 @@
+"""
+异步API依赖注入模块
+定义异步路由使用的依赖项（基于 AsyncSession）
+"""
+
+from typing import Optional
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import security, CommonQueryParams, get_common_params
+from app.db.session import get_async_db, release_async_connection
+from app.core.security import verify_token
+from app.crud import async_user as user_crud
+from app.models.user import User
+from app.services.user_cache import user_cache
+
+__all__ = [
+    "get_async_db",
+    "release_async_connection",
+    "get_current_user",
+    "get_current_active_user",
+    "get_current_superuser",
+    "get_optional_current_user",
+    "CommonQueryParams",
+    "get_common_params",
+]
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> User:
+    """
+    获取当前登录用户
+
+    Args:
+        db: 异步数据库会话
+        credentials: 认证凭据
+
+    Returns:
+        User: 当前用户实例
+
+    Raises:
+        HTTPException: 认证失败
+    """
+    # 验证token
+    user_id = verify_token(credentials.credentials)
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="无效的认证令牌",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # 获取用户（优先读取缓存）
+    user = await user_cache.get_async(int(user_id))
+    if user is None:
+        user = await user_crud.get(db, id=int(user_id))
+        # 认证查询到此结束，不让连接一直占用到响应发送完毕
+        await release_async_connection(db)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="用户不存在"
+            )
+        await user_cache.set_async(user)
+
+    # 检查用户状态
+    if not user_crud.is_active(user):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="用户账户已被停用"
+        )
+
+    return user
+
+
+async def get_current_active_user(
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """
+    获取当前活跃用户
+
+    Args:
+        current_user: 当前用户
+
+    Returns:
+        User: 当前活跃用户实例
+
+    Raises:
+        HTTPException: 用户不活跃
+    """
+    if not user_crud.is_active(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="用户账户已被停用"
+        )
+    return current_user
+
+
+async def get_current_superuser(
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """
+    获取当前超级用户
+
+    Args:
+        current_user: 当前用户
+
+    Returns:
+        User: 当前超级用户实例
+
+    Raises:
+        HTTPException: 权限不足
+    """
+    if not user_crud.is_superuser(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="权限不足"
+        )
+    return current_user
+
+
+async def get_optional_current_user(
+    db: AsyncSession = Depends(get_async_db),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+) -> Optional[User]:
+    """
+    获取可选的当前用户（允许匿名访问）
+
+    Args:
+        db: 异步数据库会话
+        credentials: 可选的认证凭据
+
+    Returns:
+        Optional[User]: 当前用户实例或None
+    """
+    if credentials is None:
+        return None
+
+    try:
+        user_id = verify_token(credentials.credentials)
+        if user_id is None:
+            return None
+
+        user = await user_cache.get_async(int(user_id))
+        if user is None:
+            user = await user_crud.get(db, id=int(user_id))
+            await release_async_connection(db)
+            if user is None:
+                return None
+            await user_cache.set_async(user)
+
+        if not user_crud.is_active(user):
+            return None
+
+        return user
+    except Exception:
+        return None
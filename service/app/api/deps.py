@@ -8,11 +8,12 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.db.session import get_db, release_connection
 from app.core.config import settings
 from app.core.security import verify_token
 from app.crud import user as user_crud
 from app.models.user import User
+from app.services.user_cache import user_cache
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
@@ -44,13 +45,18 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # 获取用户
-    user = user_crud.get(db, id=int(user_id))
+    # 获取用户（优先读取缓存）
+    user = user_cache.get(int(user_id))
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="用户不存在"
-        )
+        user = user_crud.get(db, id=int(user_id))
+        # 认证查询到此结束，不让连接一直占用到响应发送完毕
+        release_connection(db)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="用户不存在"
+            )
+        user_cache.set(user)
     
     # 检查用户状态
     if not user_crud.is_active(user):
@@ -130,8 +136,15 @@ def get_optional_current_user(
         if user_id is None:
             return None
         
-        user = user_crud.get(db, id=int(user_id))
-        if user is None or not user_crud.is_active(user):
+        user = user_cache.get(int(user_id))
+        if user is None:
+            user = user_crud.get(db, id=int(user_id))
+            release_connection(db)
+            if user is None:
+                return None
+            user_cache.set(user)
+        
+        if not user_crud.is_active(user):
             return None
         
         return user
@@ -143,23 +156,35 @@ class CommonQueryParams:
     """
     通用查询参数类
     用于分页和排序
+    
+    传入 cursor 时使用键集分页，skip 被忽略
     """
     
     def __init__(
         self,
         skip: int = 0,
         limit: int = 20,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None
     ):
         self.skip = max(0, skip)
         self.limit = min(max(1, limit), settings.MAX_PAGE_SIZE)
         self.order_by = order_by
+        self.cursor = cursor or None
+        if self.cursor:
+            self.skip = 0
+    
+    @property
+    def page(self) -> int:
+        """当前页码（从1开始，按 skip/limit 计算）"""
+        return (self.skip // self.limit) + 1
 
 
 def get_common_params(
     skip: int = 0,
     limit: int = 20,
-    order_by: Optional[str] = None
+    order_by: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> CommonQueryParams:
     """
     获取通用查询参数
@@ -168,11 +193,12 @@ def get_common_params(
         skip: 跳过记录数
         limit: 限制记录数
         order_by: 排序字段
+        cursor: 分页游标（上一页响应中的 next_cursor）
         
     Returns:
         CommonQueryParams: 查询参数对象
     """
-    return CommonQueryParams(skip=skip, limit=limit, order_by=order_by)
+    return CommonQueryParams(skip=skip, limit=limit, order_by=order_by, cursor=cursor)
 
 
 def get_settings():
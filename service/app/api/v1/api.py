@@ -5,10 +5,20 @@ API v1 路由汇总
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, users, demos
+from app.core.config import settings
 
 api_router = APIRouter()
 
+# 启用异步数据库时，认证、用户和Demo接口使用 AsyncSession 版本的路由
+if settings.USE_ASYNC_DB:
+    from app.api.v1.endpoints import (
+        async_auth as auth,
+        async_users as users,
+        async_demos as demos,
+    )
+else:
+    from app.api.v1.endpoints import auth, users, demos
+
 # 包含所有API端点
 api_router.include_router(auth.router, prefix="/auth", tags=["认证"])
 api_router.include_router(users.router, prefix="/users", tags=["用户管理"])
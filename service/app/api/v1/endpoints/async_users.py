@@ -0,0 +1,322 @@
+"""
+用户管理API端点（异步版本）
+基于 AsyncSession 处理用户相关的CRUD操作，启用 USE_ASYNC_DB 时替代同步路由
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.async_deps import (
+    get_async_db,
+    release_async_connection,
+    get_current_active_user, 
+    get_current_superuser,
+    get_common_params,
+    CommonQueryParams
+)
+from app.core.conditional import apply_validators, is_not_modified, not_modified_response
+from app.core.response import (
+    success_response, 
+    error_response, 
+    paginated_response,
+    BusinessException,
+    NotFoundException,
+    ServiceUnavailableException,
+    ValidationException
+)
+from app.crud import async_user as user_crud
+from app.services import async_user_service
+from app.services.user_service import user_validators
+from app.schemas.user import User, UserListAdapter, UserUpdate, UserPasswordUpdate
+from app.models.user import User as UserModel
+
+router = APIRouter()
+
+
+@router.get("/", summary="获取用户列表")
+async def get_users(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    params: CommonQueryParams = Depends(get_common_params),
+    current_user: UserModel = Depends(get_current_superuser)
+) -> Any:
+    """
+    获取用户列表（仅超级用户可访问）
+    
+    - **skip**: 跳过记录数
+    - **limit**: 限制记录数
+    - **order_by**: 排序字段
+    - **cursor**: 分页游标（传入上一页的 next_cursor，按游标翻页时忽略 skip）
+    """
+    try:
+        # 获取用户列表及总数
+        users, total = await async_user_service.get_users_page(
+            db, 
+            skip=params.skip, 
+            limit=params.limit,
+            cursor=params.cursor
+        )
+        await release_async_connection(db)
+        
+        return paginated_response(
+            items=UserListAdapter.dump_python(UserListAdapter.validate_python(users), mode="json"),
+            total=total,
+            page=params.page,
+            page_size=params.limit,
+            message="获取用户列表成功",
+            next_cursor=user_crud.next_cursor(users, limit=params.limit),
+            raw=True
+        )
+        
+    except ValidationException as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="获取用户列表失败"
+        )
+
+
+@router.get("/me", summary="获取当前用户信息")
+async def get_current_user_profile(
+    request: Request,
+    current_user: UserModel = Depends(get_current_active_user)
+) -> Any:
+    """
+    获取当前用户的详细信息
+    
+    支持 If-None-Match / If-Modified-Since，未修改时返回 304
+    """
+    validators = user_validators(current_user)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    
+    response = success_response(
+        data=User.model_validate(current_user),
+        message="获取用户信息成功"
+    )
+    return apply_validators(response, validators)
+
+
+@router.put("/me", summary="更新当前用户信息")
+async def update_current_user(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    user_in: UserUpdate,
+    current_user: UserModel = Depends(get_current_active_user)
+) -> Any:
+    """
+    更新当前用户信息
+    
+    - **email**: 邮箱地址
+    - **username**: 用户名
+    - **full_name**: 全名
+    - **phone**: 手机号
+    - **avatar**: 头像URL
+    - **bio**: 个人简介
+    """
+    try:
+        updated_user = await async_user_service.update_user(
+            db,
+            user_id=current_user.id,
+            user_in=user_in
+        )
+        
+        return success_response(
+            data=User.model_validate(updated_user),
+            message="更新用户信息成功"
+        )
+        
+    except (BusinessException, NotFoundException) as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="更新用户信息失败"
+        )
+
+
+@router.put("/me/password", summary="更新当前用户密码")
+async def update_current_user_password(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    password_update: UserPasswordUpdate,
+    current_user: UserModel = Depends(get_current_active_user)
+) -> Any:
+    """
+    更新当前用户密码
+    
+    - **current_password**: 当前密码
+    - **new_password**: 新密码
+    - **confirm_password**: 确认新密码
+    """
+    try:
+        await async_user_service.update_password(
+            db,
+            user_id=current_user.id,
+            password_update=password_update
+        )
+        
+        return success_response(
+            message="密码更新成功"
+        )
+        
+    except (BusinessException, NotFoundException, ServiceUnavailableException) as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="密码更新失败"
+        )
+
+
+@router.get("/{user_id}", summary="获取指定用户信息")
+async def get_user_by_id(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    user_id: int,
+    current_user: UserModel = Depends(get_current_superuser)
+) -> Any:
+    """
+    获取指定用户信息（仅超级用户可访问）
+    
+    - **user_id**: 用户ID
+    """
+    try:
+        user = await async_user_service.get_user_by_id(db, user_id=user_id)
+        await release_async_connection(db)
+        
+        return success_response(
+            data=User.model_validate(user),
+            message="获取用户信息成功"
+        )
+        
+    except NotFoundException as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="获取用户信息失败"
+        )
+
+
+@router.put("/{user_id}", summary="更新指定用户信息")
+async def update_user_by_id(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    user_id: int,
+    user_in: UserUpdate,
+    current_user: UserModel = Depends(get_current_superuser)
+) -> Any:
+    """
+    更新指定用户信息（仅超级用户可访问）
+    
+    - **user_id**: 用户ID
+    """
+    try:
+        updated_user = await async_user_service.update_user(
+            db,
+            user_id=user_id,
+            user_in=user_in
+        )
+        
+        return success_response(
+            data=User.model_validate(updated_user),
+            message="更新用户信息成功"
+        )
+        
+    except (BusinessException, NotFoundException) as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="更新用户信息失败"
+        )
+
+
+@router.put("/{user_id}/deactivate", summary="停用用户")
+async def deactivate_user(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    user_id: int,
+    current_user: UserModel = Depends(get_current_superuser)
+) -> Any:
+    """
+    停用指定用户（仅超级用户可访问）
+    
+    - **user_id**: 用户ID
+    """
+    try:
+        updated_user = await async_user_service.deactivate_user(db, user_id=user_id)
+        
+        return success_response(
+            data=User.model_validate(updated_user),
+            message="用户已停用"
+        )
+        
+    except NotFoundException as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="停用用户失败"
+        )
+
+
+@router.put("/{user_id}/activate", summary="激活用户")
+async def activate_user(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    user_id: int,
+    current_user: UserModel = Depends(get_current_superuser)
+) -> Any:
+    """
+    激活指定用户（仅超级用户可访问）
+    
+    - **user_id**: 用户ID
+    """
+    try:
+        updated_user = await async_user_service.activate_user(db, user_id=user_id)
+        
+        return success_response(
+            data=User.model_validate(updated_user),
+            message="用户已激活"
+        )
+        
+    except NotFoundException as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="激活用户失败"
+        )
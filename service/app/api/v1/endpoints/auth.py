@@ -13,7 +13,12 @@ from sqlalchemy.orm import Session
 from app.api.deps import get_db, get_current_active_user
 from app.core.config import settings
 from app.core.security import create_access_token, create_refresh_token
-from app.core.response import success_response, error_response, BusinessException
+from app.core.response import (
+    success_response,
+    error_response,
+    BusinessException,
+    ServiceUnavailableException,
+)
 from app.services import user_service
 from app.schemas.user import User, UserLogin, UserRegister
 from app.models.user import User as UserModel
@@ -70,6 +75,12 @@ def login(
             message="登录成功"
         )
         
+    except ServiceUnavailableException as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
     except Exception as e:
         return error_response(
             error=str(e),
@@ -119,7 +130,7 @@ def register(
             status_code=status.HTTP_201_CREATED
         )
         
-    except BusinessException as e:
+    except (BusinessException, ServiceUnavailableException) as e:
         return error_response(
             error=e.error,
             message=e.message,
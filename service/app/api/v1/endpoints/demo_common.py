@@ -0,0 +1,145 @@
+"""
+Demo路由共用逻辑
+同步与异步Demo路由共用的响应缓存键和分页响应构建，异步路由只在数据库调用处增加 await
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+from fastapi import Response
+
+from app.api.deps import CommonQueryParams
+from app.core.response import paginated_response
+from app.core.response_cache import auth_scope, response_cache
+from app.crud import demo as demo_crud
+from app.schemas.demo import DemoDetail, DemoListAdapter, DemoSearch
+
+# 统计接口的响应缓存键（与用户无关）
+STATISTICS_CACHE_KEY = response_cache.key("demos:statistics")
+
+
+def list_cache_key(
+    params: CommonQueryParams,
+    search_params: DemoSearch,
+    include_owner: bool,
+    current_user: Optional[Any]
+) -> str:
+    """
+    Demo列表的响应缓存键
+
+    Args:
+        params: 分页参数
+        search_params: 搜索参数
+        include_owner: 是否附带所有者信息
+        current_user: 当前用户，匿名时为None
+    """
+    return response_cache.key(
+        "demos:list",
+        {
+            "skip": params.skip,
+            "limit": params.limit,
+            "cursor": params.cursor,
+            "name": search_params.name,
+            "status": search_params.status,
+            "is_featured": search_params.is_featured,
+            "owner_id": search_params.owner_id,
+            "include_owner": include_owner,
+        },
+        auth_scope(current_user)
+    )
+
+
+def featured_cache_key(params: CommonQueryParams) -> str:
+    """
+    推荐Demo列表的响应缓存键（与用户无关）
+
+    Args:
+        params: 分页参数
+    """
+    return response_cache.key(
+        "demos:featured",
+        {"skip": params.skip, "limit": params.limit, "cursor": params.cursor}
+    )
+
+
+def detail_cache_key(demo_id: int, include_owner: bool, current_user: Optional[Any]) -> str:
+    """
+    Demo详情的响应缓存键
+
+    Args:
+        demo_id: Demo ID
+        include_owner: 是否附带所有者信息
+        current_user: 当前用户，匿名时为None
+    """
+    return response_cache.key(
+        "demos:detail",
+        {"demo_id": demo_id, "include_owner": include_owner},
+        auth_scope(current_user)
+    )
+
+
+def demo_page_response(
+    demos: Sequence[Any],
+    total: int,
+    params: CommonQueryParams,
+    *,
+    message: str,
+    include_owner: bool = False,
+    order_by: Optional[str] = None,
+    with_cursor: bool = True
+) -> Response:
+    """
+    构建Demo分页响应
+
+    Args:
+        demos: 当前页的Demo实例或行映射（get_page_rows 的结果）
+        total: 总数
+        params: 分页参数
+        message: 响应消息
+        include_owner: 是否附带所有者信息（所有者需已预加载）
+        order_by: 查询使用的排序，用于生成下一页游标
+        with_cursor: 是否返回下一页游标（按相关度排序的搜索结果不支持游标分页）
+
+    Returns:
+        Response: 分页响应
+    """
+    if include_owner:
+        items = [DemoDetail.model_validate(demo) for demo in demos]
+    else:
+        # 整页一次校验并转换为JSON数据，行映射与搜索结果的ORM实例均适用
+        items = DemoListAdapter.dump_python(
+            DemoListAdapter.validate_python(demos, from_attributes=True), mode="json"
+        )
+    return paginated_response(
+        items=items,
+        total=total,
+        page=params.page,
+        page_size=params.limit,
+        message=message,
+        next_cursor=demo_crud.next_cursor(
+            demos, limit=params.limit, order_by=order_by
+        ) if with_cursor else None,
+        raw=not include_owner
+    )
+
+
+def page_data_response(data: Dict[str, Any], params: CommonQueryParams, *, message: str) -> Response:
+    """
+    由已序列化的分页数据（如 featured_page_data 的结果）构建分页响应
+
+    Args:
+        data: items、total、next_cursor
+        params: 分页参数
+        message: 响应消息
+
+    Returns:
+        Response: 分页响应
+    """
+    return paginated_response(
+        items=data["items"],
+        total=data["total"],
+        page=params.page,
+        page_size=params.limit,
+        message=message,
+        next_cursor=data["next_cursor"],
+        raw=True
+    )
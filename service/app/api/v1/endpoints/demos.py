@@ -3,30 +3,54 @@ Demo管理API端点
 处理Demo相关的CRUD操作
 """
 
-from typing import Any, List, Optional
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
 from app.api.deps import (
     get_db, 
+    release_connection,
     get_current_active_user,
     get_optional_current_user,
     get_common_params,
     CommonQueryParams
 )
+from app.api.v1.endpoints.demo_common import (
+    STATISTICS_CACHE_KEY,
+    demo_page_response,
+    detail_cache_key,
+    featured_cache_key,
+    list_cache_key,
+    page_data_response,
+)
+from app.core.conditional import (
+    apply_validators,
+    is_conditional,
+    is_not_modified,
+    not_modified_response,
+)
 from app.core.response import (
     success_response, 
     error_response, 
-    paginated_response,
     created_response,
     updated_response,
     deleted_response,
     BusinessException,
     NotFoundException,
-    PermissionException
+    PermissionException,
+    ValidationException
 )
+from app.core.response_cache import response_cache
 from app.services import demo_service
+from app.services.demo_service import (
+    DEMOS_FEATURED_TAG,
+    DEMOS_STATISTICS_TAG,
+    demo_validators,
+    detail_cache_tags,
+    list_cache_tags,
+    parse_include,
+)
 from app.schemas.demo import (
     Demo, 
     DemoCreate, 
@@ -35,8 +59,12 @@ from app.schemas.demo import (
     DemoSearch,
     DemoStatusUpdate,
     DemoPriorityUpdate,
-    DemoFeaturedUpdate
+    DemoFeaturedUpdate,
+    DemoBatchCreate,
+    DemoBatchUpdate,
+    DemoBatchDelete
 )
+from app.schemas.batch import BatchOperationResult
 from app.models.user import User as UserModel
 
 router = APIRouter()
@@ -83,15 +111,127 @@ def create_demo(
         )
 
 
+@router.post("/batch", summary="批量创建Demo")
+def create_demos(
+    *,
+    db: Session = Depends(get_db),
+    batch_in: DemoBatchCreate,
+    current_user: UserModel = Depends(get_current_active_user)
+) -> Any:
+    """
+    批量创建Demo（所有者为当前用户）
+    
+    - **items**: Demo创建数据列表，单次最多 BATCH_MAX_ITEMS 条
+    
+    校验未通过的记录在 failures 中以请求序号返回，其余记录在同一事务中写入
+    """
+    try:
+        demos, failures = demo_service.create_demos(
+            db,
+            demos_in=batch_in.items,
+            current_user_id=current_user.id
+        )
+        
+        result = BatchOperationResult.build(
+            [Demo.model_validate(demo) for demo in demos], failures
+        )
+        return success_response(
+            data=result.model_dump(by_alias=True),
+            message="批量创建Demo完成"
+        )
+        
+    except NotFoundException as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="批量创建Demo失败"
+        )
+
+
+@router.patch("/batch", summary="批量更新Demo")
+def update_demos(
+    *,
+    db: Session = Depends(get_db),
+    batch_in: DemoBatchUpdate,
+    current_user: UserModel = Depends(get_current_active_user)
+) -> Any:
+    """
+    批量更新Demo（只能更新自己的Demo）
+    
+    - **items**: 更新项列表，每项包含 id 和要更新的字段
+    """
+    try:
+        demos, failures = demo_service.update_demos(
+            db,
+            items=batch_in.items,
+            current_user_id=current_user.id
+        )
+        
+        result = BatchOperationResult.build(
+            [Demo.model_validate(demo) for demo in demos], failures
+        )
+        return success_response(
+            data=result.model_dump(by_alias=True),
+            message="批量更新Demo完成"
+        )
+        
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="批量更新Demo失败"
+        )
+
+
+@router.post("/batch/delete", summary="批量删除Demo")
+def delete_demos(
+    *,
+    db: Session = Depends(get_db),
+    batch_in: DemoBatchDelete,
+    current_user: UserModel = Depends(get_current_active_user)
+) -> Any:
+    """
+    批量删除Demo（软删除，只能删除自己的Demo）
+    
+    - **ids**: Demo ID列表
+    """
+    try:
+        demos, failures = demo_service.delete_demos(
+            db,
+            ids=batch_in.ids,
+            current_user_id=current_user.id
+        )
+        
+        result = BatchOperationResult.build(
+            [Demo.model_validate(demo) for demo in demos], failures
+        )
+        return success_response(
+            data=result.model_dump(by_alias=True),
+            message="批量删除Demo完成"
+        )
+        
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="批量删除Demo失败"
+        )
+
+
 @router.get("/", summary="获取Demo列表")
 def get_demos(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     params: CommonQueryParams = Depends(get_common_params),
-    name: Optional[str] = Query(None, description="名称搜索关键词"),
+    name: Optional[str] = Query(None, description="搜索关键词（匹配名称和描述）"),
     status: Optional[str] = Query(None, description="状态筛选"),
     is_featured: Optional[bool] = Query(None, description="是否只显示推荐"),
     owner_id: Optional[int] = Query(None, description="所有者ID筛选"),
+    include: Optional[str] = Query(None, description="附加关联数据，可选: owner"),
     current_user: Optional[UserModel] = Depends(get_optional_current_user)
 ) -> Any:
     """
@@ -99,12 +239,18 @@ def get_demos(
     
     - **skip**: 跳过记录数
     - **limit**: 限制记录数
-    - **name**: 名称搜索关键词
+    - **cursor**: 分页游标（传入上一页的 next_cursor，按游标翻页时忽略 skip）
+    - **name**: 搜索关键词，匹配名称和描述并按相关度排序（仅支持 skip/limit 分页）
     - **status**: 状态筛选
     - **is_featured**: 是否只显示推荐
     - **owner_id**: 所有者ID筛选
+    - **include**: 传入 owner 时每条记录附带所有者简要信息（整页只多一条查询）
+    
+    响应按查询参数缓存，Demo写入后失效
     """
     try:
+        include_owner = "owner" in parse_include(include)
+        
         # 构建搜索参数
         search_params = DemoSearch(
             name=name,
@@ -113,39 +259,41 @@ def get_demos(
             owner_id=owner_id
         )
         
-        # 搜索Demo
-        demos = demo_service.search_demos(
+        cache_key = list_cache_key(params, search_params, include_owner, current_user)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached.to_response(request)
+        pending = response_cache.start(cache_key, list_cache_tags(owner_id, include_owner))
+        
+        # 搜索Demo（列表与总数在同一条查询中获取）
+        demos, total = demo_service.search_demos_page(
             db,
             search_params=search_params,
             skip=params.skip,
-            limit=params.limit
+            limit=params.limit,
+            cursor=params.cursor,
+            include_owner=include_owner
         )
+        # 查询已完成，先归还连接再做序列化，连接不必占用到响应发送完毕
+        release_connection(db)
         
-        # 获取总数（使用相同的筛选条件）
-        from app.crud import demo as demo_crud
-        filters = {"is_deleted": False}
-        if status:
-            filters["status"] = status
-        if is_featured is not None:
-            filters["is_featured"] = is_featured
-        if owner_id:
-            filters["owner_id"] = owner_id
-        if name:
-            filters["name"] = {"like": name}
-        
-        total = demo_crud.count(db, filters=filters)
-        
-        # 计算分页信息
-        page = (params.skip // params.limit) + 1
+        response = demo_page_response(
+            demos,
+            total,
+            params,
+            message="获取Demo列表成功",
+            include_owner=include_owner,
+            order_by=demo_service.SEARCH_ORDER,
+            with_cursor=not search_params.name
+        )
+        return response_cache.store(pending, response)
         
-        return paginated_response(
-            items=[Demo.model_validate(demo) for demo in demos],
-            total=total,
-            page=page,
-            page_size=params.limit,
-            message="获取Demo列表成功"
+    except ValidationException as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
         )
-        
     except Exception as e:
         return error_response(
             error=str(e),
@@ -156,37 +304,54 @@ def get_demos(
 @router.get("/featured", summary="获取推荐Demo列表")
 def get_featured_demos(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     params: CommonQueryParams = Depends(get_common_params)
 ) -> Any:
     """
     获取推荐Demo列表
     
+    支持 If-None-Match / If-Modified-Since，列表未变化时返回 304；
+    响应按分页参数缓存，推荐列表变化后失效
+    
     - **skip**: 跳过记录数
     - **limit**: 限制记录数
+    - **cursor**: 分页游标（传入上一页的 next_cursor，按游标翻页时忽略 skip）
     """
     try:
-        demos = demo_service.get_featured_demos(
+        cache_key = featured_cache_key(params)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached.to_response(request)
+        pending = response_cache.start(cache_key, [DEMOS_FEATURED_TAG])
+        
+        # 以 max(updated_at) + count 探测列表版本，未变化时不再查询和序列化列表
+        validators = demo_service.get_featured_demos_validators(
             db,
             skip=params.skip,
-            limit=params.limit
+            limit=params.limit,
+            cursor=params.cursor
         )
+        if is_not_modified(request, validators):
+            return not_modified_response(validators)
         
-        # 获取推荐Demo总数
-        from app.crud import demo as demo_crud
-        total = demo_crud.count(db, filters={"is_featured": True, "is_deleted": False})
+        data = demo_service.get_featured_demos_data(
+            db,
+            skip=params.skip,
+            limit=params.limit,
+            cursor=params.cursor
+        )
+        release_connection(db)
         
-        # 计算分页信息
-        page = (params.skip // params.limit) + 1
+        response = page_data_response(data, params, message="获取推荐Demo列表成功")
+        return response_cache.store(pending, apply_validators(response, validators), validators)
         
-        return paginated_response(
-            items=[Demo.model_validate(demo) for demo in demos],
-            total=total,
-            page=page,
-            page_size=params.limit,
-            message="获取推荐Demo列表成功"
+    except ValidationException as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
         )
-        
     except Exception as e:
         return error_response(
             error=str(e),
@@ -206,30 +371,26 @@ def get_my_demos(
     
     - **skip**: 跳过记录数
     - **limit**: 限制记录数
+    - **cursor**: 分页游标（传入上一页的 next_cursor，按游标翻页时忽略 skip）
     """
     try:
-        demos = demo_service.get_user_demos(
+        demos, total = demo_service.get_user_demos_page(
             db,
             user_id=current_user.id,
             skip=params.skip,
-            limit=params.limit
+            limit=params.limit,
+            cursor=params.cursor
         )
+        release_connection(db)
         
-        # 获取用户Demo总数
-        from app.crud import demo as demo_crud
-        total = demo_crud.count(db, filters={"owner_id": current_user.id, "is_deleted": False})
-        
-        # 计算分页信息
-        page = (params.skip // params.limit) + 1
+        return demo_page_response(demos, total, params, message="获取我的Demo列表成功")
         
-        return paginated_response(
-            items=[Demo.model_validate(demo) for demo in demos],
-            total=total,
-            page=page,
-            page_size=params.limit,
-            message="获取我的Demo列表成功"
+    except ValidationException as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
         )
-        
     except Exception as e:
         return error_response(
             error=str(e),
@@ -240,17 +401,26 @@ def get_my_demos(
 @router.get("/statistics", summary="获取Demo统计信息")
 def get_demo_statistics(
     *,
+    request: Request,
     db: Session = Depends(get_db)
 ) -> Any:
     """
     获取Demo统计信息
+    
+    响应缓存到Demo数量、状态或推荐状态变化为止
     """
     try:
+        cached = response_cache.get(STATISTICS_CACHE_KEY)
+        if cached is not None:
+            return cached.to_response(request)
+        pending = response_cache.start(STATISTICS_CACHE_KEY, [DEMOS_STATISTICS_TAG])
+        
         stats = demo_service.get_demo_statistics(db)
+        release_connection(db)
         
-        return success_response(
-            data=stats,
-            message="获取统计信息成功"
+        return response_cache.store(
+            pending,
+            success_response(data=stats, message="获取统计信息成功")
         )
         
     except Exception as e:
@@ -263,24 +433,53 @@ def get_demo_statistics(
 @router.get("/{demo_id}", summary="获取Demo详情")
 def get_demo(
     *,
+    request: Request,
     db: Session = Depends(get_db),
     demo_id: int,
+    include: Optional[str] = Query(None, description="附加关联数据，可选: owner"),
     current_user: Optional[UserModel] = Depends(get_optional_current_user)
 ) -> Any:
     """
     获取Demo详细信息
     
+    支持 If-None-Match / If-Modified-Since，未修改时返回 304
+    
     - **demo_id**: Demo ID
+    - **include**: 传入 owner 时附带所有者简要信息（与Demo在同一条查询中加载）
+    
+    响应缓存到该Demo（包含所有者时还有所有者信息）变化为止
     """
     try:
-        demo = demo_service.get_demo_by_id(db, demo_id=demo_id)
+        include_owner = "owner" in parse_include(include)
         
-        return success_response(
-            data=Demo.model_validate(demo),
+        cache_key = detail_cache_key(demo_id, include_owner, current_user)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached.to_response(request)
+        pending = response_cache.start(cache_key, detail_cache_tags(demo_id, include_owner))
+        
+        # 条件请求先只读取 updated_at，命中时不加载整行；
+        # 包含所有者时校验器还取决于所有者，加载后再比较
+        if is_conditional(request) and not include_owner:
+            validators = demo_service.get_demo_validators(db, demo_id=demo_id)
+            if is_not_modified(request, validators):
+                return not_modified_response(validators)
+        
+        demo = demo_service.get_demo_by_id(
+            db, demo_id=demo_id, include_owner=include_owner
+        )
+        release_connection(db)
+        validators = demo_validators(demo, include_owner=include_owner)
+        if include_owner and is_not_modified(request, validators):
+            return not_modified_response(validators)
+        
+        response = success_response(
+            data=(DemoDetail if include_owner else Demo).model_validate(demo),
             message="获取Demo信息成功"
         )
+        return response_cache.store(pending, apply_validators(response, validators), validators)
         
-    except NotFoundException as e:
+    except (NotFoundException, ValidationException) as e:
         return error_response(
             error=e.error,
             message=e.message,
@@ -444,3 +643,43 @@ def set_demo_featured(
             error=str(e),
             message="更新Demo推荐状态失败"
         )
+
+
+@router.put("/{demo_id}/priority", summary="更新Demo优先级")
+def update_demo_priority(
+    *,
+    db: Session = Depends(get_db),
+    demo_id: int,
+    priority_update: DemoPriorityUpdate,
+    current_user: UserModel = Depends(get_current_active_user)
+) -> Any:
+    """
+    更新Demo优先级
+    
+    - **demo_id**: Demo ID
+    - **priority**: 优先级
+    """
+    try:
+        demo = demo_service.update_demo_priority(
+            db,
+            demo_id=demo_id,
+            priority=priority_update.priority,
+            current_user_id=current_user.id
+        )
+        
+        return updated_response(
+            data=Demo.model_validate(demo),
+            message="Demo优先级更新成功"
+        )
+        
+    except (NotFoundException, PermissionException) as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
+    except Exception as e:
+        return error_response(
+            error=str(e),
+            message="更新Demo优先级失败"
+        )
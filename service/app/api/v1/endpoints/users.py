@@ -5,25 +5,31 @@
 
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
 from app.api.deps import (
     get_db, 
+    release_connection,
     get_current_active_user, 
     get_current_superuser,
     get_common_params,
     CommonQueryParams
 )
+from app.core.conditional import apply_validators, is_not_modified, not_modified_response
 from app.core.response import (
     success_response, 
     error_response, 
     paginated_response,
     BusinessException,
-    NotFoundException
+    NotFoundException,
+    ServiceUnavailableException,
+    ValidationException
 )
+from app.crud import user as user_crud
 from app.services import user_service
-from app.schemas.user import User, UserUpdate, UserPasswordUpdate
+from app.services.user_service import user_validators
+from app.schemas.user import User, UserListAdapter, UserUpdate, UserPasswordUpdate
 from app.models.user import User as UserModel
 
 router = APIRouter()
@@ -42,29 +48,34 @@ def get_users(
     - **skip**: 跳过记录数
     - **limit**: 限制记录数
     - **order_by**: 排序字段
+    - **cursor**: 分页游标（传入上一页的 next_cursor，按游标翻页时忽略 skip）
     """
     try:
-        # 获取用户列表
-        users = user_service.get_users(
+        # 获取用户列表及总数
+        users, total = user_service.get_users_page(
             db, 
             skip=params.skip, 
-            limit=params.limit
+            limit=params.limit,
+            cursor=params.cursor
         )
-        
-        # 获取总数
-        total = user_service.count_users(db)
-        
-        # 计算分页信息
-        page = (params.skip // params.limit) + 1
+        release_connection(db)
         
         return paginated_response(
-            items=[User.model_validate(user) for user in users],
+            items=UserListAdapter.dump_python(UserListAdapter.validate_python(users), mode="json"),
             total=total,
-            page=page,
+            page=params.page,
             page_size=params.limit,
-            message="获取用户列表成功"
+            message="获取用户列表成功",
+            next_cursor=user_crud.next_cursor(users, limit=params.limit),
+            raw=True
         )
         
+    except ValidationException as e:
+        return error_response(
+            error=e.error,
+            message=e.message,
+            status_code=e.status_code
+        )
     except Exception as e:
         return error_response(
             error=str(e),
@@ -74,15 +85,23 @@ def get_users(
 
 @router.get("/me", summary="获取当前用户信息")
 def get_current_user_profile(
+    request: Request,
     current_user: UserModel = Depends(get_current_active_user)
 ) -> Any:
     """
     获取当前用户的详细信息
+    
+    支持 If-None-Match / If-Modified-Since，未修改时返回 304
     """
-    return success_response(
+    validators = user_validators(current_user)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    
+    response = success_response(
         data=User.model_validate(current_user),
         message="获取用户信息成功"
     )
+    return apply_validators(response, validators)
 
 
 @router.put("/me", summary="更新当前用户信息")
@@ -152,7 +171,7 @@ def update_current_user_password(
             message="密码更新成功"
         )
         
-    except (BusinessException, NotFoundException) as e:
+    except (BusinessException, NotFoundException, ServiceUnavailableException) as e:
         return error_response(
             error=e.error,
             message=e.message,
@@ -179,6 +198,7 @@ def get_user_by_id(
     """
     try:
         user = user_service.get_user_by_id(db, user_id=user_id)
+        release_connection(db)
         
         return success_response(
             data=User.model_validate(user),
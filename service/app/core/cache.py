@@ -0,0 +1,303 @@
+"""
+缓存后端模块
+提供进程内LRU缓存和Redis缓存两种后端，接口一致，可互相替换
+
+每个操作都有 *_async 版本供异步代码使用：进程内缓存不涉及I/O，直接复用同步实现；
+Redis后端使用 redis.asyncio 客户端，不阻塞事件循环
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    """
+    缓存后端基类
+    值统一为字符串，由调用方负责序列化
+    """
+
+    def get(self, key: str) -> Optional[str]:
+        """获取缓存值，不存在或已过期返回None"""
+        raise NotImplementedError
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """批量获取缓存值，结果与 keys 一一对应"""
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        """写入缓存值，ttl 单位为秒"""
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> None:
+        """删除缓存键"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """清空缓存"""
+        raise NotImplementedError
+
+    def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        """
+        尝试获取互斥锁（键不存在时写入 token），ttl 秒后自动释放
+
+        Returns:
+            bool: 是否获得锁
+        """
+        raise NotImplementedError
+
+    def release_lock(self, key: str, token: str) -> None:
+        """释放互斥锁，仅当锁仍由 token 持有时删除"""
+        raise NotImplementedError
+
+    async def get_async(self, key: str) -> Optional[str]:
+        """get 的异步版本"""
+        return self.get(key)
+
+    async def get_many_async(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """get_many 的异步版本"""
+        return self.get_many(keys)
+
+    async def set_async(self, key: str, value: str, ttl: int) -> None:
+        """set 的异步版本"""
+        self.set(key, value, ttl)
+
+    async def delete_async(self, *keys: str) -> None:
+        """delete 的异步版本"""
+        self.delete(*keys)
+
+    async def acquire_lock_async(self, key: str, token: str, ttl: float) -> bool:
+        """acquire_lock 的异步版本"""
+        return self.acquire_lock(key, token, ttl)
+
+    async def release_lock_async(self, key: str, token: str) -> None:
+        """release_lock 的异步版本"""
+        self.release_lock(key, token)
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    进程内TTL + LRU缓存
+    线程安全；也可在测试中代替Redis后端使用
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return False
+            self._data[key] = (time.monotonic() + ttl, token)
+            self._data.move_to_end(key)
+            return True
+
+    def release_lock(self, key: str, token: str) -> None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] == token:
+                del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis缓存后端
+    Redis不可用时降级为缓存未命中（加锁视为成功），不影响业务请求
+    """
+
+    # 比较 token 后删除，避免锁过期后误删其他进程重新获取的锁
+    _RELEASE_LOCK_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
+    def __init__(self, url: str, prefix: str = "ops:"):
+        import redis
+        import redis.asyncio
+
+        self.prefix = prefix
+        self._client_options: Dict[str, Any] = dict(
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            decode_responses=True,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+        self._url = url
+        self._client = redis.Redis.from_url(url, **self._client_options)
+        self._async_redis = redis.asyncio.Redis
+        # 异步连接绑定创建它的事件循环，每个事件循环使用各自的客户端
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._errors = (redis.RedisError,)
+
+    def _async_client(self) -> Any:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_redis.from_url(self._url, **self._client_options)
+            self._async_clients[loop] = client
+        return client
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self._client.get(self.prefix + key)
+        except self._errors as e:
+            logger.warning("Redis缓存读取失败: %s", e)
+            return None
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        if not keys:
+            return []
+        try:
+            return self._client.mget([self.prefix + key for key in keys])
+        except self._errors as e:
+            logger.warning("Redis缓存读取失败: %s", e)
+            return [None] * len(keys)
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        try:
+            self._client.set(self.prefix + key, value, ex=ttl)
+        except self._errors as e:
+            logger.warning("Redis缓存写入失败: %s", e)
+
+    def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            self._client.delete(*(self.prefix + key for key in keys))
+        except self._errors as e:
+            logger.warning("Redis缓存删除失败: %s", e)
+
+    def clear(self) -> None:
+        try:
+            for key in self._client.scan_iter(match=self.prefix + "*"):
+                self._client.delete(key)
+        except self._errors as e:
+            logger.warning("Redis缓存清空失败: %s", e)
+
+    def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        try:
+            return bool(
+                self._client.set(self.prefix + key, token, nx=True, px=max(int(ttl * 1000), 1))
+            )
+        except self._errors as e:
+            logger.warning("Redis加锁失败: %s", e)
+            return True
+
+    def release_lock(self, key: str, token: str) -> None:
+        try:
+            self._client.eval(self._RELEASE_LOCK_SCRIPT, 1, self.prefix + key, token)
+        except self._errors as e:
+            logger.warning("Redis释放锁失败: %s", e)
+
+    async def get_async(self, key: str) -> Optional[str]:
+        try:
+            return await self._async_client().get(self.prefix + key)
+        except self._errors as e:
+            logger.warning("Redis缓存读取失败: %s", e)
+            return None
+
+    async def get_many_async(self, keys: Sequence[str]) -> List[Optional[str]]:
+        if not keys:
+            return []
+        try:
+            return await self._async_client().mget([self.prefix + key for key in keys])
+        except self._errors as e:
+            logger.warning("Redis缓存读取失败: %s", e)
+            return [None] * len(keys)
+
+    async def set_async(self, key: str, value: str, ttl: int) -> None:
+        try:
+            await self._async_client().set(self.prefix + key, value, ex=ttl)
+        except self._errors as e:
+            logger.warning("Redis缓存写入失败: %s", e)
+
+    async def delete_async(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self._async_client().delete(*(self.prefix + key for key in keys))
+        except self._errors as e:
+            logger.warning("Redis缓存删除失败: %s", e)
+
+    async def acquire_lock_async(self, key: str, token: str, ttl: float) -> bool:
+        try:
+            return bool(
+                await self._async_client().set(
+                    self.prefix + key, token, nx=True, px=max(int(ttl * 1000), 1)
+                )
+            )
+        except self._errors as e:
+            logger.warning("Redis加锁失败: %s", e)
+            return True
+
+    async def release_lock_async(self, key: str, token: str) -> None:
+        try:
+            await self._async_client().eval(
+                self._RELEASE_LOCK_SCRIPT, 1, self.prefix + key, token
+            )
+        except self._errors as e:
+            logger.warning("Redis释放锁失败: %s", e)
+
+
+_shared_backends: Dict[str, CacheBackend] = {}
+
+
+def get_shared_cache(backend: str) -> Optional[CacheBackend]:
+    """
+    获取跨进程共享的缓存后端
+
+    Args:
+        backend: 后端类型，"redis" 使用 REDIS_URL，"memory" 表示不使用共享缓存
+
+    Returns:
+        Optional[CacheBackend]: 缓存后端实例，未启用共享缓存时返回None
+    """
+    if backend != "redis":
+        return None
+    if backend not in _shared_backends:
+        _shared_backends[backend] = RedisCacheBackend(settings.REDIS_URL)
+    return _shared_backends[backend]
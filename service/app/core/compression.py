@@ -0,0 +1,215 @@
+"""
+响应压缩中间件
+按 Accept-Encoding 协商 br / zstd / gzip，超过最小长度的文本类响应才压缩；
+可选按 ETag 缓存压缩结果，热点页面只压缩一次；大响应体在线程池中压缩，不阻塞事件循环
+"""
+
+import gzip
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # 可选依赖: pip install brotli
+    import brotli
+except ImportError:
+    brotli = None
+
+try:  # 可选依赖: pip install zstandard
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 可压缩的内容类型前缀
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/problem+json",
+    "image/svg+xml",
+)
+
+
+def _gzip_compressor(level: int) -> Callable[[bytes], bytes]:
+    # mtime=0 保证相同输入得到相同输出
+    return lambda data: gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def available_encoders(
+    gzip_level: int = 6,
+    brotli_quality: int = 4,
+    zstd_level: int = 3
+) -> Dict[str, Callable[[bytes], bytes]]:
+    """
+    按服务端优先级返回可用的编码器（brotli/zstd 未安装时跳过）
+
+    默认压缩级别面向动态响应，在压缩率和CPU之间折中
+
+    Returns:
+        Dict[str, Callable]: 编码名 -> 压缩函数
+    """
+    encoders: Dict[str, Callable[[bytes], bytes]] = {}
+    if brotli is not None:
+        encoders["br"] = lambda data: brotli.compress(data, quality=brotli_quality)
+    if zstandard is not None:
+        encoders["zstd"] = zstandard.ZstdCompressor(level=zstd_level).compress
+    encoders["gzip"] = _gzip_compressor(gzip_level)
+    return encoders
+
+
+def negotiate_encoding(accept_encoding: str, supported: List[str]) -> Optional[str]:
+    """
+    根据 Accept-Encoding 选择编码
+
+    q 值最高者优先，q 值相同时按服务端优先级；q=0 表示拒绝，"*" 匹配未列出的编码
+
+    Args:
+        accept_encoding: 请求头 Accept-Encoding 的值
+        supported: 服务端支持的编码（按优先级排序）
+
+    Returns:
+        Optional[str]: 选中的编码，不压缩时返回None
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for name in supported:
+        weight = weights.get(name, wildcard)
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+class CompressionMiddleware:
+    """
+    响应压缩中间件（纯ASGI实现）
+
+    只压缩一次性返回的完整响应体；流式响应（more_body）原样透传。
+    cache_size > 0 时，对带 ETag 的响应按 (路径, ETag, 编码) 缓存压缩结果：
+    ETag 相同即表示内容等价（弱校验），命中时直接发送缓存的压缩字节，
+    响应信封中的 timestamp 因此可能是首次压缩时的值。
+    threadpool_size > 0 时，不小于该字节数的响应体交给线程池压缩，
+    避免高压缩级别处理大响应时阻塞事件循环上的其他请求
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        cache_size: int = 0,
+        encoders: Optional[Dict[str, Callable[[bytes], bytes]]] = None,
+        threadpool_size: int = 0
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache_size = cache_size
+        self.threadpool_size = threadpool_size
+        self.encoders = encoders if encoders is not None else available_encoders()
+        self._supported = list(self.encoders)
+        self._cache: "OrderedDict[tuple[str, str, str], bytes]" = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept_encoding, self._supported) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if self._is_compressible(message["status"], headers):
+                    start_message = message
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if message.get("more_body", False):
+                # 流式响应不缓冲，原样发送
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if len(body) < self.minimum_size:
+                await send(start_message)
+                await send(message)
+                return
+
+            body = await self._compress(scope, headers.get("etag"), encoding, body)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _is_compressible(self, status_code: int, headers: Headers) -> bool:
+        """判断响应是否需要压缩"""
+        if status_code < 200 or status_code in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def _compress(self, scope: Scope, etag: Optional[str], encoding: str, body: bytes) -> bytes:
+        """压缩响应体，带 ETag 且启用缓存时复用之前的压缩结果"""
+        if not self.cache_size or not etag:
+            return await self._encode(encoding, body)
+
+        key = (scope["path"] + "?" + scope.get("query_string", b"").decode("latin-1"), etag, encoding)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        compressed = await self._encode(encoding, body)
+        self._cache[key] = compressed
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return compressed
+
+    async def _encode(self, encoding: str, body: bytes) -> bytes:
+        """调用编码器压缩，大响应体在线程池中执行"""
+        encoder = self.encoders[encoding]
+        if self.threadpool_size and len(body) >= self.threadpool_size:
+            return await run_in_threadpool(encoder, body)
+        return encoder(body)
@@ -0,0 +1,119 @@
+"""
+HTTP条件请求工具
+基于 updated_at 生成 ETag / Last-Modified，命中 If-None-Match / If-Modified-Since 时返回 304
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, NamedTuple, Optional
+
+from fastapi import Request, Response, status
+
+# 响应表示的版本号；响应结构变化时递增，使客户端缓存的旧 ETag 全部失效
+REPRESENTATION_VERSION = "1"
+
+
+class Validators(NamedTuple):
+    """
+    资源校验器
+    """
+    etag: str
+    last_modified: Optional[datetime]
+
+
+def build_validators(*parts: Any, last_modified: Optional[datetime] = None) -> Validators:
+    """
+    由资源标识和版本信息生成校验器
+
+    Args:
+        parts: 参与计算 ETag 的值（资源类型、ID、updated_at、列表条数、查询参数等）
+        last_modified: 资源最后修改时间（UTC，无时区）
+
+    Returns:
+        Validators: 弱 ETag 与最后修改时间
+    """
+    raw = "|".join(
+        value.isoformat() if isinstance(value, datetime) else str(value)
+        for value in (REPRESENTATION_VERSION, *parts)
+    )
+    digest = hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+    return Validators(etag=f'W/"{digest}"', last_modified=last_modified)
+
+
+def is_conditional(request: Request) -> bool:
+    """请求是否携带条件头；未携带时无需预先探测资源版本"""
+    headers = request.headers
+    return "if-none-match" in headers or "if-modified-since" in headers
+
+
+def _http_date(value: datetime) -> str:
+    """格式化为 HTTP 日期（IMF-fixdate）"""
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """
+    判断客户端缓存是否仍然有效
+
+    If-None-Match 存在时优先按弱比较匹配 ETag，忽略 If-Modified-Since（RFC 9110 13.2.2）
+
+    Args:
+        request: 请求对象
+        validators: 当前资源的校验器
+
+    Returns:
+        bool: 可以返回 304 时为True
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        current = validators.etag.removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == current
+            for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP 日期精度为秒
+    modified = validators.last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+    return modified <= since
+
+
+def apply_validators(response: Response, validators: Validators) -> Response:
+    """
+    为响应添加 ETag 和 Last-Modified 头
+
+    Args:
+        response: 响应对象
+        validators: 资源校验器
+
+    Returns:
+        Response: 同一个响应对象
+    """
+    response.headers["ETag"] = validators.etag
+    if validators.last_modified is not None:
+        response.headers["Last-Modified"] = _http_date(validators.last_modified)
+    return response
+
+
+def not_modified_response(validators: Validators) -> Response:
+    """
+    创建 304 Not Modified 响应（无响应体）
+
+    Args:
+        validators: 资源校验器
+
+    Returns:
+        Response: 304 响应
+    """
+    return apply_validators(Response(status_code=status.HTTP_304_NOT_MODIFIED), validators)
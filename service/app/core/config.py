@@ -4,12 +4,21 @@
 """
 
 import os
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import AnyHttpUrl, EmailStr, field_validator
 from pydantic_settings import BaseSettings
 
 
+def to_async_url(url: str) -> str:
+    """将同步驱动的连接字符串转换为对应的异步驱动"""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
 class Settings(BaseSettings):
     """
     应用配置类
@@ -34,6 +43,26 @@ class Settings(BaseSettings):
     DATABASE_MAX_OVERFLOW: int = 20
     DATABASE_POOL_TIMEOUT: int = 30
     DATABASE_POOL_RECYCLE: int = 3600
+    # 启用后 Demo/用户 接口使用 AsyncSession 异步处理
+    USE_ASYNC_DB: bool = False
+    # 异步驱动连接字符串，未设置时由 DATABASE_URL 推导
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # 严格加载：CRUD 查询未显式预加载的关系在访问时抛出异常，而不是逐条懒加载
+    STRICT_LOADING: bool = False
+    
+    # === SQLite嵌入式模式配置 ===
+    # 文件型SQLite启用 WAL + 读连接池 + 单写连接；关闭时沿用单连接 StaticPool
+    SQLITE_EMBEDDED_MODE: bool = True
+    SQLITE_READER_POOL_SIZE: int = 5
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"  # WAL 下 NORMAL 即可保证一致性
+    
+    # === 只读副本配置 ===
+    DATABASE_REPLICA_URLS: str = ""  # 逗号分隔的只读副本连接字符串，为空时读写都使用主库
+    REPLICA_STICKY_SECONDS: float = 5.0  # 用户写入后该时间内的读取固定使用主库
+    REPLICA_MAX_LAG_SECONDS: float = 2.0  # 复制延迟超过该值或无法连接的副本暂停使用
+    REPLICA_HEALTH_CHECK_INTERVAL: float = 5.0  # 副本健康检查间隔（秒）
+    REPLICA_STICKY_COOKIE: str = "primary_until"  # 记录主库读取截止时间的 Cookie 名称
     
     # === 安全配置 ===
     SECRET_KEY: str = "change-this-in-production-to-a-random-secret-key"
@@ -73,6 +102,40 @@ class Settings(BaseSettings):
     # === 分页配置 ===
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
+    # 无过滤条件的列表在表行数估算值超过该阈值时使用估算总数
+    ESTIMATED_COUNT_THRESHOLD: int = 100000
+    
+    # === 批量操作配置 ===
+    CRUD_BATCH_SIZE: int = 500  # 批量写入时每条语句处理的记录数
+    BATCH_MAX_ITEMS: int = 1000  # 批量接口单次请求的最大记录数
+    
+    # === Demo统计配置 ===
+    DEMO_COUNTERS_ENABLED: bool = False  # 启用后由写操作维护 demo_counters 表，统计接口直接读取计数
+    
+    # === 搜索配置 ===
+    SEARCH_BACKEND: str = "auto"  # auto: PostgreSQL 使用 pg_trgm/tsvector，SQLite 使用 FTS5; like: 始终使用 LIKE
+    
+    # === 密码哈希配置 ===
+    PASSWORD_HASH_WORKERS: int = 2  # 哈希进程池大小，0 表示在线程池中计算（开发/测试）
+    PASSWORD_HASH_MAX_PENDING: int = 64  # 每个进程允许排队的哈希任务数，超出返回503
+    
+    # === 登录统计配置 ===
+    LOGIN_STATS_MODE: str = "sync"  # sync: 登录时同步提交; write_behind: 内存累计后批量写回
+    LOGIN_STATS_FLUSH_INTERVAL: float = 5.0  # write_behind 模式的刷新间隔（秒）
+    LOGIN_STATS_MAX_BUFFER: int = 1000  # 缓冲用户数达到该值时立即刷新
+    
+    # === SQL查询统计配置 ===
+    SLOW_QUERY_THRESHOLD_MS: float = 200  # 超过该耗时的语句以指纹形式记录警告日志
+    N_PLUS_ONE_THRESHOLD: int = 5  # 同一请求中相同语句执行次数达到该值时标记为疑似 N+1
+    
+    # === 监控指标配置 ===
+    METRICS_ENABLED: bool = True  # 暴露 /metrics（多进程部署需设置环境变量 PROMETHEUS_MULTIPROC_DIR）
+    
+    # === 响应压缩配置 ===
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # 小于该字节数的响应不压缩
+    COMPRESSION_CACHE_SIZE: int = 256  # 按 ETag 缓存的压缩结果条数，0 表示不缓存
+    COMPRESSION_THREADPOOL_SIZE: int = 64 * 1024  # 不小于该字节数的响应在线程池中压缩，0 表示始终在事件循环中压缩
     
     # === 文件上传配置 ===
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
@@ -82,6 +145,25 @@ class Settings(BaseSettings):
     # === 缓存配置 ===
     CACHE_TTL: int = 300  # 5分钟
     
+    # === 认证用户缓存配置 ===
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_BACKEND: str = "memory"  # memory: 仅进程内缓存; redis: 增加 REDIS_URL 共享缓存
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_LOCAL_TTL: int = 10  # 进程内缓存TTL（秒），决定多进程间状态变更的最大延迟
+    
+    # === 热点查询合并配置 ===
+    SINGLE_FLIGHT_ENABLED: bool = True  # 进程内相同参数的并发查询只执行一次，共享结果
+    SINGLE_FLIGHT_BACKEND: str = "memory"  # memory: 仅合并进程内查询; redis: 通过 REDIS_URL 上的锁跨进程合并
+    SINGLE_FLIGHT_LOCK_TIMEOUT: float = 5.0  # 跨进程锁的有效期，也是等待其他进程结果的最长时间（秒）
+    SINGLE_FLIGHT_RESULT_TTL: int = 1  # 跨进程共享结果的保留时间（秒），即合并结果的最大陈旧度
+    
+    # === 响应缓存配置 ===
+    RESPONSE_CACHE_ENABLED: bool = True  # 缓存公开的Demo读接口响应，写操作按标签精确失效
+    RESPONSE_CACHE_BACKEND: str = "memory"  # memory: 进程内缓存; redis: 使用 REDIS_URL 共享缓存（TTL 为 CACHE_TTL）
+    RESPONSE_CACHE_MAX_SIZE: int = 10000
+    RESPONSE_CACHE_LOCAL_TTL: int = 10  # 进程内缓存TTL（秒），失效只作用于当前进程，决定多进程间的最大陈旧时间
+    RESPONSE_CACHE_BETA: float = 1.0  # 提前概率刷新系数（XFetch），越大越早刷新，0 表示不提前刷新
+    
     @property
     def is_development(self) -> bool:
         """是否为开发环境"""
@@ -103,6 +185,22 @@ class Settings(BaseSettings):
             return self.TEST_DATABASE_URL
         return self.DATABASE_URL
     
+    def get_async_database_url(self) -> str:
+        """获取异步驱动的数据库连接字符串"""
+        if self.ASYNC_DATABASE_URL:
+            return self.ASYNC_DATABASE_URL
+        return to_async_url(self.DATABASE_URL)
+    
+    def get_replica_urls(self, use_async: bool = False) -> List[str]:
+        """
+        获取只读副本连接字符串列表
+        
+        Args:
+            use_async: 是否转换为异步驱动的连接字符串
+        """
+        urls = [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+        return [to_async_url(url) for url in urls] if use_async else urls
+    
     class Config:
         """Pydantic 配置"""
         env_file = ".env"
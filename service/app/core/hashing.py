@@ -0,0 +1,157 @@
+"""
+密码哈希服务
+在独立的进程池中执行 bcrypt 计算，避免占满请求线程池，排队过多时直接拒绝请求。
+同步路由使用 hash/verify（在请求线程中等待进程池结果），异步路由使用 *_async 方法
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.response import ServiceUnavailableException
+from app.core.security import get_password_hash, verify_password
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasher:
+    """
+    密码哈希服务
+    进程池大小和排队上限均为单个应用进程内的限制；
+    耗时（含排队时间）和被拒绝次数写入 Prometheus 指标
+    """
+
+    def __init__(
+        self,
+        max_workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_pending: int = settings.PASSWORD_HASH_MAX_PENDING
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """当前正在计算或排队的哈希任务数"""
+        return self._pending
+
+    def start(self) -> None:
+        """创建进程池（应用启动时调用，避免首个请求承担进程启动开销）"""
+        if self.max_workers <= 0:
+            return
+        with self._lock:
+            if self._executor is None:
+                # 使用 spawn 避免在已有线程和事件循环的进程中 fork
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+
+    def shutdown(self) -> None:
+        """关闭进程池"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def hash(self, password: str) -> str:
+        """
+        计算密码哈希
+
+        Args:
+            password: 明文密码
+
+        Returns:
+            str: 哈希密码
+
+        Raises:
+            ServiceUnavailableException: 哈希任务排队已满
+        """
+        return self._run("hash", get_password_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        验证密码
+
+        Args:
+            plain_password: 明文密码
+            hashed_password: 哈希密码
+
+        Returns:
+            bool: 密码是否匹配
+
+        Raises:
+            ServiceUnavailableException: 哈希任务排队已满
+        """
+        return self._run("verify", verify_password, plain_password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        """计算密码哈希（异步版本，参数和返回值同 hash）"""
+        return await self._run_async("hash", get_password_hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """验证密码（异步版本，参数和返回值同 verify）"""
+        return await self._run_async(
+            "verify", verify_password, plain_password, hashed_password
+        )
+
+    def _run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        with self._slot(operation):
+            if self.max_workers <= 0:
+                return func(*args)
+            self.start()
+            return self._executor.submit(func, *args).result()
+
+    async def _run_async(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        with self._slot(operation):
+            if self.max_workers <= 0:
+                return await run_in_threadpool(func, *args)
+            self.start()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    @contextmanager
+    def _slot(self, operation: str) -> Iterator[None]:
+        """占用一个排队名额并记录耗时（含排队时间）"""
+        self._acquire()
+        start = time.perf_counter()
+        try:
+            yield
+        except BrokenProcessPool:
+            # 工作进程异常退出后进程池不可再用，丢弃后下次请求重建
+            logger.error("密码哈希进程池已损坏，将重新创建")
+            self.shutdown()
+            raise
+        finally:
+            self._release()
+            metrics.observe_password_hash(operation, time.perf_counter() - start)
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                metrics.observe_password_hash_rejected()
+                raise ServiceUnavailableException(
+                    error="认证服务繁忙",
+                    message="当前登录请求过多，请稍后重试"
+                )
+            self._pending += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+
+# 全局密码哈希服务实例
+password_hasher = PasswordHasher()
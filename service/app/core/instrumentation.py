@@ -0,0 +1,117 @@
+"""
+请求计时与访问日志中间件
+纯ASGI实现，一次计时同时用于 X-Process-Time 响应头、访问日志和 Prometheus 指标，
+并汇总请求内的SQL查询统计
+"""
+
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import metrics
+from app.db import query_stats
+
+access_logger = logging.getLogger("app.access")
+
+
+class InstrumentationMiddleware:
+    """
+    请求计时与访问日志中间件
+
+    不经过 BaseHTTPMiddleware，流式响应按原样逐块转发；
+    日志使用 % 占位符并先检查级别，被过滤时不做任何格式化。
+    访问日志的结构化字段通过 extra 提供: method, path, status_code, duration_ms, client。
+    enable_metrics 为True时按路由模板记录请求数、耗时和SQL语句数；
+    expose_db_headers 为True时（调试模式）附加 X-DB-Queries / X-DB-Time 响应头；
+    同一语句在一个请求内执行次数达到 n_plus_one_threshold 时记录疑似 N+1 警告
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        header_name: str = "x-process-time",
+        enable_metrics: bool = False,
+        expose_db_headers: bool = False,
+        n_plus_one_threshold: int = 0
+    ):
+        self.app = app
+        self.header_name = header_name.lower().encode("latin-1")
+        self.enable_metrics = enable_metrics
+        self.expose_db_headers = expose_db_headers
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        stats = query_stats.start_request()
+
+        if access_logger.isEnabledFor(logging.DEBUG):
+            access_logger.debug(
+                "📥 %s %s - %s", scope["method"], scope["path"], _client_host(scope)
+            )
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.perf_counter() - start
+                headers = [
+                    *message.get("headers", []),
+                    (self.header_name, str(process_time).encode("latin-1")),
+                ]
+                if self.expose_db_headers:
+                    headers.append((b"x-db-queries", str(stats.count).encode("latin-1")))
+                    headers.append((b"x-db-time", f"{stats.duration * 1000:.3f}".encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            duration = time.perf_counter() - start
+            if self.enable_metrics:
+                metrics.observe_request(
+                    scope["method"],
+                    metrics.route_label(scope),
+                    status_code,
+                    duration,
+                    stats.count,
+                )
+            if self.n_plus_one_threshold and stats.count >= self.n_plus_one_threshold:
+                for statement, count in stats.repeated(self.n_plus_one_threshold):
+                    access_logger.warning(
+                        "疑似N+1查询 %s %s: 同一语句执行 %d 次: %s",
+                        scope["method"],
+                        scope["path"],
+                        count,
+                        statement,
+                        extra={"route": metrics.route_label(scope), "repeat_count": count},
+                    )
+            if access_logger.isEnabledFor(logging.INFO):
+                access_logger.info(
+                    "📤 %s %s - %s - %.4fs",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    duration,
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status_code": status_code,
+                        "duration_ms": round(duration * 1000, 3),
+                        "db_queries": stats.count,
+                        "db_time_ms": round(stats.duration * 1000, 3),
+                        "client": _client_host(scope),
+                    },
+                )
+
+
+def _client_host(scope: Scope) -> str:
+    """读取客户端地址"""
+    client = scope.get("client")
+    return client[0] if client else "unknown"
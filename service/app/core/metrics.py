@@ -0,0 +1,235 @@
+"""
+Prometheus 指标
+HTTP请求、数据库连接池（含连接占用时长）、每请求查询数、密码哈希耗时和查询合并
+
+多进程部署（gunicorn/uvicorn --workers）时，在进程启动前设置环境变量
+PROMETHEUS_MULTIPROC_DIR 指向一个空目录，各进程的指标写入该目录并在 /metrics 汇总；
+gunicorn 需在 child_exit 钩子中调用 mark_process_dead(worker.pid)
+"""
+
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.types import Scope
+
+# 未匹配任何路由的请求统一使用该标签，避免任意路径造成标签基数膨胀
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP请求数",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP请求处理耗时",
+    ["method", "route"],
+    buckets=REQUEST_BUCKETS,
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "单个HTTP请求执行的SQL语句数",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "已借出的数据库连接数",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "超出 pool_size 的借出连接数",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "从连接池获取连接的耗时（含新建连接）",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_CONNECTION_HELD = Histogram(
+    "db_connection_held_seconds",
+    "数据库连接从借出到归还的占用时长",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "密码哈希耗时（含排队时间）",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "因排队已满被拒绝的密码哈希请求数",
+)
+SINGLE_FLIGHT_SHARED = Counter(
+    "single_flight_shared_total",
+    "合并到进行中的相同查询、未单独访问数据库的调用数",
+    ["name"],
+)
+
+
+def route_label(scope: Scope) -> str:
+    """
+    获取请求的路由模板（如 /api/v1/demos/{demo_id}）作为指标标签
+
+    Args:
+        scope: 已完成路由匹配的ASGI scope
+
+    Returns:
+        str: 路由模板，未匹配时为 "unmatched"
+    """
+    template = getattr(scope.get("route"), "path", None)
+    if not template:
+        return UNMATCHED_ROUTE
+
+    # 部分 FastAPI 版本中 include_router 的路由只记录相对模板（如 /{demo_id}），
+    # 前缀部分不含路径参数，按段数从实际路径中补齐
+    template_segments = template.count("/")
+    path_segments = scope["path"].split("/")
+    prefix_length = len(path_segments) - 1 - template_segments
+    if prefix_length <= 0:
+        return template
+    return "/".join(path_segments[:prefix_length + 1]) + template
+
+
+def observe_request(
+    method: str,
+    route: str,
+    status_code: int,
+    duration: float,
+    query_count: Optional[int] = None
+) -> None:
+    """
+    记录一次HTTP请求
+
+    Args:
+        method: 请求方法
+        route: 路由模板
+        status_code: 响应状态码
+        duration: 处理耗时（秒）
+        query_count: 请求内执行的SQL语句数
+    """
+    HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+    HTTP_REQUEST_DURATION.labels(method, route).observe(duration)
+    if query_count is not None:
+        DB_QUERIES_PER_REQUEST.labels(route).observe(query_count)
+
+
+def observe_password_hash(operation: str, seconds: float) -> None:
+    """记录一次密码哈希耗时"""
+    PASSWORD_HASH_DURATION.labels(operation).observe(seconds)
+
+
+def observe_password_hash_rejected() -> None:
+    """记录一次被拒绝的密码哈希请求"""
+    PASSWORD_HASH_REJECTED.inc()
+
+
+def observe_single_flight_shared(name: str) -> None:
+    """记录一次合并到进行中查询的调用"""
+    SINGLE_FLIGHT_SHARED.labels(name).inc()
+
+
+class _TimedGetMixin:
+    """记录从连接池获取连接的耗时"""
+
+    metrics_label = "sync"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.labels(self.metrics_label).observe(time.perf_counter() - start)
+
+
+class TimedQueuePool(_TimedGetMixin, QueuePool):
+    """记录获取连接耗时的 QueuePool"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedGetMixin, AsyncAdaptedQueuePool):
+    """记录获取连接耗时的 AsyncAdaptedQueuePool"""
+
+
+def instrument_engine(engine: Engine, label: str) -> None:
+    """
+    为引擎注册连接池事件
+
+    Args:
+        engine: 同步引擎（异步引擎传入 async_engine.sync_engine）
+        label: 指标中的 engine 标签
+    """
+    pool = engine.pool
+    if isinstance(pool, _TimedGetMixin):
+        pool.metrics_label = label
+    lock = threading.Lock()
+    checked_out = DB_POOL_CHECKED_OUT.labels(label)
+    overflow = DB_POOL_OVERFLOW.labels(label)
+    held = DB_CONNECTION_HELD.labels(label)
+    size = pool.size() if isinstance(pool, QueuePool) else None
+    state = {"checked_out": 0}
+
+    def update(delta: int) -> None:
+        with lock:
+            state["checked_out"] += delta
+            current = state["checked_out"]
+        checked_out.set(current)
+        if size is not None:
+            overflow.set(max(current - size, 0))
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        update(1)
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            held.observe(time.perf_counter() - checked_out_at)
+        update(-1)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    生成 Prometheus 文本格式的指标
+
+    设置了 PROMETHEUS_MULTIPROC_DIR 时汇总所有工作进程的数据
+
+    Returns:
+        Tuple[bytes, str]: (指标内容, Content-Type)
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """清理已退出工作进程的 livesum 指标（gunicorn child_exit 钩子中调用）"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
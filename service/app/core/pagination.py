@@ -0,0 +1,54 @@
+"""
+分页游标工具
+提供键集（游标）分页使用的不透明游标编码与解码
+"""
+
+import base64
+import json
+from typing import Any, Dict
+
+from app.core.response import ValidationException
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """
+    将游标内容编码为不透明字符串
+
+    Args:
+        payload: 游标内容（需可JSON序列化）
+
+    Returns:
+        str: URL安全的游标字符串
+    """
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    解码游标字符串
+
+    Args:
+        cursor: 游标字符串
+
+    Returns:
+        Dict[str, Any]: 游标内容
+
+    Raises:
+        ValidationException: 游标格式无效
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise ValidationException(
+            error="无效的分页游标",
+            message="分页游标格式错误或已损坏"
+        )
+
+    if not isinstance(payload, dict) or "id" not in payload:
+        raise ValidationException(
+            error="无效的分页游标",
+            message="分页游标格式错误或已损坏"
+        )
+    return payload
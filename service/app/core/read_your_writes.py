@@ -0,0 +1,80 @@
+"""
+写后读一致性中间件
+配合只读副本使用：客户端写入后的一段时间内，其读取固定使用主库
+"""
+
+import time
+
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db import replicas
+
+# 幂等方法的读取可以使用副本，其余方法整个请求都读取主库，避免基于旧数据修改
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+
+class ReadYourWritesMiddleware:
+    """
+    写后读一致性中间件
+
+    请求提交过写入时，响应通过 Cookie 和 X-Primary-Until 响应头下发固定令牌
+    （主库读取截止的 Unix 时间戳）。之后带着未过期令牌的请求，
+    无论通过 Cookie 还是同名请求头携带（适用于不保存 Cookie 的移动端），读取都使用主库
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sticky_seconds: float = 5.0,
+        cookie_name: str = "primary_until",
+        header_name: str = "x-primary-until"
+    ):
+        self.app = app
+        self.sticky_seconds = sticky_seconds
+        self.cookie_name = cookie_name
+        self.header_name = header_name.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        primary = scope["method"] not in SAFE_METHODS or self._sticky_until(scope) > time.time()
+        preference = replicas.start_request(primary)
+
+        async def send_with_token(message: Message) -> None:
+            if message["type"] == "http.response.start" and preference.wrote:
+                until = f"{time.time() + self.sticky_seconds:.3f}".encode("latin-1")
+                cookie = (
+                    f"{self.cookie_name}={until.decode('latin-1')}; "
+                    f"Max-Age={int(self.sticky_seconds) + 1}; Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (self.header_name, until),
+                    (b"set-cookie", cookie.encode("latin-1")),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_token)
+
+    def _sticky_until(self, scope: Scope) -> float:
+        """
+        读取请求携带的固定令牌，没有或格式错误时为0
+
+        令牌由客户端回传，截止时间最多为当前时间加 sticky_seconds，
+        避免伪造的远期令牌让请求一直读取主库
+        """
+        token = None
+        for name, value in scope["headers"]:
+            if name == self.header_name:
+                token = value.decode("latin-1")
+                break
+            if name == b"cookie":
+                token = cookie_parser(value.decode("latin-1")).get(self.cookie_name, token)
+        try:
+            until = float(token) if token else 0.0
+        except ValueError:
+            return 0.0
+        return min(until, time.time() + self.sticky_seconds)
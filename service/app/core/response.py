@@ -6,9 +6,11 @@
 from typing import Any, Dict, Optional, Union
 from datetime import datetime
 
+import orjson
 from fastapi import HTTPException, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 
 
 class APIResponse(BaseModel):
@@ -38,6 +40,90 @@ class PaginatedResponse(BaseModel):
     total_pages: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
+
+
+# orjson 选项：日期时间交给 pydantic 序列化，保证与 model_dump(mode="json") 格式一致
+# （如 UTC 时间输出 "Z" 而非 "+00:00"）；非字符串键与 json.dumps 一样转为字符串
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+# 预编码的响应信封片段，字段顺序与 APIResponse 一致
+_SUCCESS_PREFIX = b'{"success":true,"message":'
+_ERROR_PREFIX = b'{"success":false,"message":'
+_DATA_KEY = b',"data":'
+_ERROR_KEY = b',"error":'
+_TIMESTAMP_KEY = b',"timestamp":'
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    orjson 无法原生处理的对象（Pydantic模型、datetime、Decimal等）交给 pydantic 转换
+    
+    参数与原 model_dump(mode="json", exclude_none=True) 对嵌套模型的处理一致
+    """
+    return to_jsonable_python(obj, by_alias=False, exclude_none=True)
+
+
+def dump_json(content: Any) -> bytes:
+    """
+    使用 orjson 序列化为紧凑的 UTF-8 JSON
+    
+    输出与 JSONResponse（json.dumps + ensure_ascii=False + 紧凑分隔符）
+    对 APIResponse.model_dump(mode="json") 的结果逐字节一致
+    
+    Args:
+        content: 待序列化的数据
+        
+    Returns:
+        bytes: JSON 字节串
+    """
+    return orjson.dumps(content, default=_json_default, option=_ORJSON_OPTIONS)
+
+
+def render_envelope(
+    success: bool,
+    message: str,
+    data: Any = None,
+    error: Optional[str] = None,
+    timestamp: Optional[datetime] = None
+) -> bytes:
+    """
+    直接将响应信封写为字节，跳过 APIResponse 模型的构建和二次序列化
+    
+    Args:
+        success: 是否成功
+        message: 响应消息
+        data: 响应数据，为None时省略
+        error: 错误信息，为None时省略
+        timestamp: 响应时间，默认当前UTC时间
+        
+    Returns:
+        bytes: 与 APIResponse(...).model_dump(mode="json", exclude_none=True) 一致的 JSON
+    """
+    parts = [_SUCCESS_PREFIX if success else _ERROR_PREFIX, dump_json(message)]
+    if data is not None:
+        parts.append(_DATA_KEY)
+        parts.append(dump_json(data))
+    if error is not None:
+        parts.append(_ERROR_KEY)
+        parts.append(dump_json(error))
+    parts.append(_TIMESTAMP_KEY)
+    parts.append(dump_json(timestamp or datetime.utcnow()))
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    基于 orjson 的 JSON 响应，作为应用的默认响应类
+    
+    content 为已编码的字节（见 render_envelope）时原样输出
+    """
+    
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dump_json(content)
 
 
 def success_response(
@@ -56,15 +142,9 @@ def success_response(
     Returns:
         JSONResponse: 格式化的成功响应
     """
-    response = APIResponse(
-        success=True,
-        message=message,
-        data=data
-    )
-    
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status_code,
-        content=response.model_dump(mode="json", exclude_none=True)
+        content=render_envelope(True, message, data=data)
     )
 
 
@@ -86,16 +166,9 @@ def error_response(
     Returns:
         JSONResponse: 格式化的错误响应
     """
-    response = APIResponse(
-        success=False,
-        message=message,
-        error=error,
-        data=data
-    )
-    
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status_code,
-        content=response.model_dump(mode="json", exclude_none=True)
+        content=render_envelope(False, message, data=data, error=error)
     )
 
 
@@ -104,7 +177,9 @@ def paginated_response(
     total: int,
     page: int,
     page_size: int,
-    message: str = "获取数据成功"
+    message: str = "获取数据成功",
+    next_cursor: Optional[str] = None,
+    raw: bool = False
 ) -> JSONResponse:
     """
     创建分页响应
@@ -115,24 +190,30 @@ def paginated_response(
         page: 当前页码（从1开始）
         page_size: 每页大小
         message: 响应消息
+        next_cursor: 下一页游标（键集分页），没有下一页时为None
+        raw: items 是否已是 JSON 兼容数据（如 TypeAdapter.dump_python(mode="json")
+            的结果），为True时原样输出，不再逐项转换
         
     Returns:
         JSONResponse: 格式化的分页响应
     """
     total_pages = (total + page_size - 1) // page_size
     
-    pagination_data = PaginatedResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_prev=page > 1
-    )
+    # 字段与 PaginatedResponse 一致；items 一次性转换为 JSON 兼容结构（保留None字段），
+    # 不再经过 PaginatedResponse 校验和 model_dump
+    pagination_data = {
+        "items": items if raw else to_jsonable_python(list(items), by_alias=False),
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "has_next": page < total_pages or next_cursor is not None,
+        "has_prev": page > 1,
+        "next_cursor": next_cursor,
+    }
     
     return success_response(
-        data=pagination_data.model_dump(),
+        data=pagination_data,
         message=message
     )
 
@@ -224,6 +305,20 @@ class AuthenticationException(APIException):
         )
 
 
+class ServiceUnavailableException(APIException):
+    """
+    服务暂不可用异常（过载保护等）
+    """
+    
+    def __init__(self, error: str = "服务繁忙", message: str = "服务器繁忙，请稍后重试"):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error=error,
+            message=message,
+            headers={"Retry-After": "1"}
+        )
+
+
 # 常用响应快捷方法
 
 def created_response(data: Any = None, message: str = "创建成功") -> JSONResponse:
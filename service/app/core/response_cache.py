@@ -0,0 +1,378 @@
+"""
+响应缓存
+缓存公开读接口的完整响应体，键由路由、规范化后的查询参数和认证范围组成；
+每个条目带有依赖标签（如 demo:1、demos:featured），写操作提交后使相关标签失效
+
+标签失效基于版本号：缓存后端保存每个标签的当前版本，条目记录生成时各标签的版本，
+读取时任一标签版本变化即视为未命中，因此内存和 Redis 后端都只需 get/set。
+临近过期时按 XFetch 算法提前概率性刷新，避免热点条目同时过期造成的击穿
+"""
+
+import json
+import math
+import random
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from fastapi import Request, Response, status
+
+from app.core.cache import CacheBackend, MemoryCacheBackend, get_shared_cache
+from app.core.conditional import (
+    Validators,
+    apply_validators,
+    is_not_modified,
+    not_modified_response,
+)
+from app.core.config import settings
+from app.core.response import FastJSONResponse
+
+# 标明响应是否来自缓存的响应头（hit / miss）
+CACHE_STATUS_HEADER = "X-Cache"
+
+# 匿名请求的认证范围
+PUBLIC_SCOPE = "public"
+
+
+def auth_scope(user: Optional[Any]) -> str:
+    """
+    请求的认证范围，参与缓存键计算
+
+    按角色而不是按用户区分：被缓存的接口不返回针对个人的数据，
+    按用户区分只会让命中率随用户数下降
+
+    Args:
+        user: 当前用户，匿名时为None
+    """
+    if user is None:
+        return PUBLIC_SCOPE
+    return "superuser" if getattr(user, "is_superuser", False) else "user"
+
+
+def _tag_key(tag: str) -> str:
+    return f"response-tag:{tag}"
+
+
+def _new_version(invalidated_at: float) -> str:
+    """标签版本：失效时间戳 + 随机后缀"""
+    return f"{invalidated_at:.3f}-{uuid.uuid4().hex[:12]}"
+
+
+def _invalidated_at(version: str) -> float:
+    return float(version.partition("-")[0])
+
+
+class CachedResponse(NamedTuple):
+    """命中的缓存响应"""
+
+    body: bytes
+    status_code: int
+    validators: Optional[Validators]
+
+    def to_response(self, request: Request) -> Response:
+        """
+        生成响应；请求携带的条件头与缓存的校验器匹配时返回 304
+
+        Args:
+            request: 请求对象
+        """
+        if self.validators is not None and is_not_modified(request, self.validators):
+            response = not_modified_response(self.validators)
+        else:
+            response = FastJSONResponse(status_code=self.status_code, content=self.body)
+            if self.validators is not None:
+                apply_validators(response, self.validators)
+        response.headers[CACHE_STATUS_HEADER] = "hit"
+        return response
+
+
+class PendingEntry(NamedTuple):
+    """未命中时开始生成的条目：记录查询前的标签版本和开始时间"""
+
+    key: str
+    tags: Dict[str, str]
+    started: float
+    started_at: float
+
+
+class ResponseCache:
+    """
+    标签失效的响应缓存
+
+    用法：get() 未命中时先 start() 记录标签版本再查询数据库，生成响应后 store()。
+    标签版本在查询之前读取，查询期间发生的写入会使刚写入的条目立即失效。
+    缓存的响应体中的 timestamp 为生成时间。
+    异步路由使用 *_async 方法，访问后端时不阻塞事件循环
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: int = settings.CACHE_TTL,
+        beta: float = settings.RESPONSE_CACHE_BETA,
+        settle_seconds: float = 0.0,
+        enabled: bool = settings.RESPONSE_CACHE_ENABLED
+    ):
+        """
+        Args:
+            backend: 缓存后端，默认为进程内LRU
+            ttl: 条目有效期（秒）
+            beta: XFetch 提前刷新系数
+            settle_seconds: 标签失效后的这段时间内生成的响应不写入缓存
+                （使用只读副本时为最大复制延迟，避免缓存副本上的旧数据）
+            enabled: 是否启用
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend(
+            max_size=settings.RESPONSE_CACHE_MAX_SIZE
+        )
+        self.ttl = ttl
+        self.beta = beta
+        self.settle_seconds = settle_seconds
+        self.enabled = enabled
+        # 标签版本比条目保留更久；标签被淘汰时引用它的条目随之失效，不会返回旧数据
+        self.tag_ttl = ttl * 2
+
+    @staticmethod
+    def key(route: str, params: Optional[Dict[str, Any]] = None, scope: str = PUBLIC_SCOPE) -> str:
+        """
+        生成缓存键，参数按名称排序，值为None的参数忽略
+
+        Args:
+            route: 路由名称，如 "demos:featured"
+            params: 查询参数
+            scope: 认证范围（见 auth_scope）
+        """
+        query = "&".join(
+            f"{name}={value}" for name, value in sorted((params or {}).items())
+            if value is not None
+        )
+        return f"response:{route}?{query}|{scope}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        读取缓存的响应
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[CachedResponse]: 未命中、依赖的标签已失效或被选中提前刷新时返回None
+        """
+        if not self.enabled:
+            return None
+        raw = self.backend.get(key)
+        if raw is None:
+            return None
+
+        meta, body = self._parse_entry(raw)
+        tags: Dict[str, str] = meta["tags"]
+        versions = self.backend.get_many([_tag_key(tag) for tag in tags]) if tags else []
+        return self._cached_response(meta, body, versions)
+
+    async def get_async(self, key: str) -> Optional[CachedResponse]:
+        """读取缓存的响应（异步版本，参数和返回值同 get）"""
+        if not self.enabled:
+            return None
+        raw = await self.backend.get_async(key)
+        if raw is None:
+            return None
+
+        meta, body = self._parse_entry(raw)
+        tags: Dict[str, str] = meta["tags"]
+        versions = (
+            await self.backend.get_many_async([_tag_key(tag) for tag in tags]) if tags else []
+        )
+        return self._cached_response(meta, body, versions)
+
+    def start(self, key: str, tags: Iterable[str]) -> Optional[PendingEntry]:
+        """
+        开始生成条目，在查询数据库之前调用
+
+        Args:
+            key: 缓存键
+            tags: 条目依赖的标签
+
+        Returns:
+            Optional[PendingEntry]: 传给 store()；未启用时为None
+        """
+        if not self.enabled:
+            return None
+        names = list(dict.fromkeys(tags))
+        versions = self.backend.get_many([_tag_key(tag) for tag in names]) if names else []
+        snapshot, missing = self._snapshot(names, versions)
+        for tag in missing:
+            self.backend.set(_tag_key(tag), snapshot[tag], self.tag_ttl)
+        return PendingEntry(key, snapshot, time.perf_counter(), time.time())
+
+    async def start_async(self, key: str, tags: Iterable[str]) -> Optional[PendingEntry]:
+        """开始生成条目（异步版本，参数和返回值同 start）"""
+        if not self.enabled:
+            return None
+        names = list(dict.fromkeys(tags))
+        versions = (
+            await self.backend.get_many_async([_tag_key(tag) for tag in names]) if names else []
+        )
+        snapshot, missing = self._snapshot(names, versions)
+        for tag in missing:
+            await self.backend.set_async(_tag_key(tag), snapshot[tag], self.tag_ttl)
+        return PendingEntry(key, snapshot, time.perf_counter(), time.time())
+
+    def store(
+        self,
+        pending: Optional[PendingEntry],
+        response: Response,
+        validators: Optional[Validators] = None
+    ) -> Response:
+        """
+        写入生成的响应（只缓存 200 响应）
+
+        Args:
+            pending: start() 的返回值
+            response: 生成的响应
+            validators: 响应的条件请求校验器，命中时据此返回 304
+
+        Returns:
+            Response: 同一个响应对象
+        """
+        raw = self._build_entry(pending, response, validators)
+        if raw is not None:
+            self.backend.set(pending.key, raw, self.ttl)
+            response.headers[CACHE_STATUS_HEADER] = "miss"
+        return response
+
+    async def store_async(
+        self,
+        pending: Optional[PendingEntry],
+        response: Response,
+        validators: Optional[Validators] = None
+    ) -> Response:
+        """写入生成的响应（异步版本，参数和返回值同 store）"""
+        raw = self._build_entry(pending, response, validators)
+        if raw is not None:
+            await self.backend.set_async(pending.key, raw, self.ttl)
+            response.headers[CACHE_STATUS_HEADER] = "miss"
+        return response
+
+    def invalidate(self, *tags: str) -> None:
+        """
+        使带有任一标签的条目失效（写操作提交后调用）
+
+        Args:
+            tags: 失效的标签
+        """
+        if not self.enabled or not tags:
+            return
+        version = _new_version(time.time())
+        for tag in dict.fromkeys(tags):
+            self.backend.set(_tag_key(tag), version, self.tag_ttl)
+
+    async def invalidate_async(self, *tags: str) -> None:
+        """使带有任一标签的条目失效（异步版本，参数同 invalidate）"""
+        if not self.enabled or not tags:
+            return
+        version = _new_version(time.time())
+        for tag in dict.fromkeys(tags):
+            await self.backend.set_async(_tag_key(tag), version, self.tag_ttl)
+
+    @staticmethod
+    def _parse_entry(raw: str) -> Tuple[Dict[str, Any], str]:
+        """拆分条目的元数据行和响应体"""
+        header, _, body = raw.partition("\n")
+        return json.loads(header), body
+
+    def _cached_response(
+        self, meta: Dict[str, Any], body: str, versions: List[Optional[str]]
+    ) -> Optional[CachedResponse]:
+        """
+        校验条目并生成命中的响应
+
+        Args:
+            meta: 条目元数据
+            body: 响应体
+            versions: 条目依赖的标签的当前版本（与 meta["tags"] 顺序一致）
+        """
+        if versions != list(meta["tags"].values()):
+            return None
+
+        # XFetch：生成越慢的条目越早开始刷新；只有被选中的请求重新生成，其余请求继续命中
+        if self.beta and (
+            time.time() - meta["delta"] * self.beta * math.log(1.0 - random.random())
+            >= meta["expires"]
+        ):
+            return None
+
+        validators = None
+        if meta.get("etag"):
+            last_modified = meta.get("last_modified")
+            validators = Validators(
+                etag=meta["etag"],
+                last_modified=datetime.fromisoformat(last_modified) if last_modified else None
+            )
+        return CachedResponse(body.encode("utf-8"), meta["status"], validators)
+
+    @staticmethod
+    def _snapshot(
+        names: List[str], versions: List[Optional[str]]
+    ) -> Tuple[Dict[str, str], List[str]]:
+        """
+        记录标签的当前版本，尚无版本的标签补上初始版本
+
+        Returns:
+            Tuple[Dict[str, str], List[str]]: (标签版本快照, 需要写入初始版本的标签)
+        """
+        snapshot = {}
+        missing = []
+        for tag, version in zip(names, versions):
+            if version is None:
+                version = _new_version(0.0)
+                missing.append(tag)
+            snapshot[tag] = version
+        return snapshot, missing
+
+    def _build_entry(
+        self,
+        pending: Optional[PendingEntry],
+        response: Response,
+        validators: Optional[Validators]
+    ) -> Optional[str]:
+        """生成待写入的条目；不应缓存（未启用、非 200、处于失效后的稳定窗口内）时为None"""
+        if pending is None or response.status_code != status.HTTP_200_OK:
+            return None
+        if self.settle_seconds and any(
+            _invalidated_at(version) + self.settle_seconds > pending.started_at
+            for version in pending.tags.values()
+        ):
+            return None
+
+        meta = {
+            "status": response.status_code,
+            "tags": pending.tags,
+            "delta": round(time.perf_counter() - pending.started, 6),
+            "expires": time.time() + self.ttl,
+            "etag": validators.etag if validators else None,
+            "last_modified": (
+                validators.last_modified.isoformat()
+                if validators and validators.last_modified else None
+            ),
+        }
+        return json.dumps(meta, separators=(",", ":")) + "\n" + response.body.decode("utf-8")
+
+
+def _create_response_cache() -> ResponseCache:
+    """
+    按配置创建全局响应缓存：共享后端使用 CACHE_TTL；
+    进程内缓存的失效不会通知其他进程，使用较短的 RESPONSE_CACHE_LOCAL_TTL
+    """
+    shared = get_shared_cache(settings.RESPONSE_CACHE_BACKEND)
+    return ResponseCache(
+        backend=shared,
+        ttl=settings.CACHE_TTL if shared is not None else min(
+            settings.RESPONSE_CACHE_LOCAL_TTL, settings.CACHE_TTL
+        ),
+        settle_seconds=settings.REPLICA_MAX_LAG_SECONDS if settings.get_replica_urls() else 0.0
+    )
+
+
+# 全局响应缓存实例
+response_cache = _create_response_cache()
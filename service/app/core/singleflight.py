@@ -0,0 +1,299 @@
+"""
+热点查询合并（single-flight）
+同一进程内参数相同的并发调用只执行一次，其余调用等待并共享同一结果（或异常）；
+可选通过共享缓存后端上的锁跨进程合并：持锁进程执行查询并以锁令牌为键短暂发布结果，
+其他进程只读取等待期间持锁的那次执行的结果，超时后自行执行。
+写操作后调用 forget()，之后的调用不再加入写入前开始的执行
+"""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Iterable, NamedTuple, Optional, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core import metrics
+from app.core.cache import CacheBackend, get_shared_cache
+from app.core.config import settings
+
+T = TypeVar("T")
+
+# 等待其他进程结果时的轮询间隔（秒）
+POLL_INTERVAL = 0.02
+
+
+class Codec(NamedTuple):
+    """跨进程共享结果时使用的序列化方法"""
+
+    dumps: Callable[[Any], str]
+    loads: Callable[[str], Any]
+
+
+JSON_CODEC = Codec(
+    dumps=lambda value: json.dumps(jsonable_encoder(value), separators=(",", ":")),
+    loads=json.loads,
+)
+
+
+def _matches(key: str, names: Iterable[str]) -> bool:
+    """合并键是否属于其中某个查询名称"""
+    return any(key == name or key.startswith(name + "?") for name in names)
+
+
+def flight_key(name: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    由名称和按参数名排序的参数生成合并键，参数顺序不影响结果
+
+    Args:
+        name: 查询名称，如 "demos:featured"
+        params: 查询参数
+    """
+    if not params:
+        return name
+    return name + "?" + "&".join(f"{key}={params[key]}" for key in sorted(params))
+
+
+class _Call:
+    """进程内一次进行中的同步调用"""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    并发调用合并器
+
+    共享的结果会同时交给多个请求，调用方必须只读使用；返回 ORM 实例时，
+    这些实例属于首个请求的会话，只能读取已加载的列属性
+    """
+
+    def __init__(
+        self,
+        shared: Optional[CacheBackend] = None,
+        lock_timeout: float = settings.SINGLE_FLIGHT_LOCK_TIMEOUT,
+        result_ttl: int = settings.SINGLE_FLIGHT_RESULT_TTL,
+        enabled: bool = settings.SINGLE_FLIGHT_ENABLED
+    ):
+        self.shared = shared
+        self.lock_timeout = lock_timeout
+        self.result_ttl = result_ttl
+        self.enabled = enabled
+        # 代数需在旧代的锁和结果都过期后才能过期
+        self.generation_ttl = int(lock_timeout) + result_ttl + 1
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: Dict[str, asyncio.Future] = {}
+
+    def do(
+        self,
+        name: str,
+        fn: Callable[[], T],
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        codec: Optional[Codec] = None
+    ) -> T:
+        """
+        执行同步调用，相同键的并发调用共享结果
+
+        Args:
+            name: 查询名称（同时作为指标标签）
+            fn: 实际执行查询的函数
+            params: 查询参数，与名称一起组成合并键
+            codec: 结果的序列化方法，提供且配置了共享后端时跨进程合并
+
+        Returns:
+            fn 的返回值（可能来自其他请求的调用）
+        """
+        if not self.enabled:
+            return fn()
+
+        key = flight_key(name, params)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            metrics.observe_single_flight_shared(name)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = self._run_shared(name, key, fn, codec) if self._use_shared(codec) else fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                # forget() 之后同一键可能已有新的执行
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.value
+
+    async def do_async(
+        self,
+        name: str,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        codec: Optional[Codec] = None
+    ) -> T:
+        """
+        执行异步调用，相同键的并发调用共享结果（参数同 do）
+
+        首个调用被取消时，等待中的调用重新竞争执行，而不是随之失败
+        """
+        if not self.enabled:
+            return await fn()
+
+        key = flight_key(name, params)
+        while True:
+            future = self._async_calls.get(key)
+            if future is None:
+                break
+            metrics.observe_single_flight_shared(name)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        future = self._async_calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            if self._use_shared(codec):
+                value = await self._run_shared_async(name, key, fn, codec)
+            else:
+                value = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # 没有等待者时避免 "exception was never retrieved" 警告
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            if self._async_calls.get(key) is future:
+                del self._async_calls[key]
+
+    def forget(self, *names: str) -> None:
+        """
+        写操作提交后调用：之后的调用不再加入这些查询进行中的执行，
+        也不再读取其他进程在此之前开始的执行发布的结果；已在等待的调用不受影响
+
+        Args:
+            names: 查询名称（不含参数，同一名称的所有参数组合都被遗忘）
+        """
+        self._forget_local(names)
+        if self.shared is not None:
+            for name in names:
+                self.shared.set(
+                    self._generation_key(name), uuid.uuid4().hex[:12], self.generation_ttl
+                )
+
+    async def forget_async(self, *names: str) -> None:
+        """遗忘进行中的执行（异步版本，参数同 forget）"""
+        self._forget_local(names)
+        if self.shared is not None:
+            for name in names:
+                await self.shared.set_async(
+                    self._generation_key(name), uuid.uuid4().hex[:12], self.generation_ttl
+                )
+
+    def _forget_local(self, names: Iterable[str]) -> None:
+        with self._lock:
+            for key in [key for key in self._calls if _matches(key, names)]:
+                del self._calls[key]
+        # 异步调用表只在事件循环线程中修改，先复制键再遍历
+        for key in [key for key in list(self._async_calls) if _matches(key, names)]:
+            self._async_calls.pop(key, None)
+
+    def _use_shared(self, codec: Optional[Codec]) -> bool:
+        return self.shared is not None and codec is not None
+
+    @staticmethod
+    def _generation_key(name: str) -> str:
+        return f"singleflight:gen:{name}"
+
+    @staticmethod
+    def _lock_key(key: str, generation: Optional[str]) -> str:
+        """锁键；forget() 更换代数后，之后的调用使用新的锁，不再等待旧的执行"""
+        return f"singleflight:lock:{key}" + (f"@{generation}" if generation else "")
+
+    @staticmethod
+    def _result_key(key: str, token: str) -> str:
+        """结果键，以持锁令牌区分每次执行"""
+        return f"singleflight:result:{key}:{token}"
+
+    def _run_shared(self, name: str, key: str, fn: Callable[[], T], codec: Codec) -> T:
+        """
+        跨进程合并：获得锁时执行，先发布结果再释放锁；否则记下持锁令牌，
+        只读取该令牌对应的结果，锁被释放而结果未出现时重新竞争锁
+        """
+        lock_key = self._lock_key(key, self.shared.get(self._generation_key(name)))
+        token = uuid.uuid4().hex
+        leader_token = None
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            if leader_token is not None:
+                raw = self.shared.get(self._result_key(key, leader_token))
+                if raw is not None:
+                    return codec.loads(raw)
+            if self.shared.acquire_lock(lock_key, token, self.lock_timeout):
+                try:
+                    value = fn()
+                    self.shared.set(
+                        self._result_key(key, token), codec.dumps(value), self.result_ttl
+                    )
+                    return value
+                finally:
+                    self.shared.release_lock(lock_key, token)
+            leader_token = self.shared.get(lock_key) or leader_token
+            time.sleep(POLL_INTERVAL)
+        return fn()
+
+    async def _run_shared_async(
+        self, name: str, key: str, fn: Callable[[], Awaitable[T]], codec: Codec
+    ) -> T:
+        """跨进程合并（异步版本，后端访问不阻塞事件循环）"""
+        generation = await self.shared.get_async(self._generation_key(name))
+        lock_key = self._lock_key(key, generation)
+        token = uuid.uuid4().hex
+        leader_token = None
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            if leader_token is not None:
+                raw = await self.shared.get_async(self._result_key(key, leader_token))
+                if raw is not None:
+                    return codec.loads(raw)
+            if await self.shared.acquire_lock_async(lock_key, token, self.lock_timeout):
+                try:
+                    value = await fn()
+                    await self.shared.set_async(
+                        self._result_key(key, token), codec.dumps(value), self.result_ttl
+                    )
+                    return value
+                finally:
+                    await self.shared.release_lock_async(lock_key, token)
+            leader_token = await self.shared.get_async(lock_key) or leader_token
+            await asyncio.sleep(POLL_INTERVAL)
+        return await fn()
+
+
+# 全局合并器实例
+single_flight = SingleFlight(shared=get_shared_cache(settings.SINGLE_FLIGHT_BACKEND))
@@ -5,9 +5,13 @@ CRUD 包初始化文件
 
 from app.crud.crud_user import user
 from app.crud.crud_demo import demo
+from app.crud.async_crud_user import user as async_user
+from app.crud.async_crud_demo import demo as async_demo
 
 # 导出所有CRUD实例
 __all__ = [
     "user",
     "demo",
+    "async_user",
+    "async_demo",
 ]
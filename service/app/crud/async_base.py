@@ -0,0 +1,687 @@
+"""
+基础异步CRUD操作类
+基于 AsyncSession 提供与 CRUDBase 对应的数据库操作方法
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, Union
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import RowMapping, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.base import (
+    ESTIMATE_COUNT_SQL,
+    CreateSchemaType,
+    CRUDQueryMixin,
+    LoaderOptions,
+    ModelType,
+    UpdateSchemaType,
+)
+
+
+class AsyncCRUDBase(
+    CRUDQueryMixin[ModelType], Generic[ModelType, CreateSchemaType, UpdateSchemaType]
+):
+    """
+    基础异步CRUD操作类
+    方法与 CRUDBase 一一对应，查询构建逻辑共用 CRUDQueryMixin
+    """
+
+    def __init__(self, model: Type[ModelType]):
+        """
+        初始化CRUD对象
+
+        Args:
+            model: SQLAlchemy模型类
+        """
+        self.model = model
+
+    async def get(
+        self, db: AsyncSession, id: Any, *, options: LoaderOptions = None
+    ) -> Optional[ModelType]:
+        """
+        通过ID获取单个记录
+
+        异步会话不能懒加载关系，需要访问的关系必须通过 options 预加载
+
+        Args:
+            db: 异步数据库会话
+            id: 记录ID
+            options: 关系加载选项（如 joinedload(Demo.owner)）
+
+        Returns:
+            Optional[ModelType]: 模型实例或None
+        """
+        statement = self._apply_options(select(self.model), options)
+        result = await db.execute(statement.where(self.model.id == id))
+        return result.scalars().first()
+
+    async def get_many(self, db: AsyncSession, *, ids: List[Any]) -> List[ModelType]:
+        """
+        通过ID列表批量获取记录
+
+        Args:
+            db: 异步数据库会话
+            ids: 记录ID列表
+
+        Returns:
+            List[ModelType]: 存在的模型实例列表
+        """
+        if not ids:
+            return []
+        result = await db.scalars(self._select_many_statement(list(ids)))
+        return list(result)
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        options: LoaderOptions = None
+    ) -> List[ModelType]:
+        """
+        获取多个记录
+
+        Args:
+            db: 异步数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            filters: 过滤条件字典
+            order_by: 排序字段
+            cursor: 分页游标
+            options: 关系加载选项
+
+        Returns:
+            List[ModelType]: 模型实例列表
+        """
+        statement = self._apply_filters(
+            self._apply_options(select(self.model), options), filters
+        )
+
+        if cursor:
+            statement = self._apply_cursor(statement, cursor, order_by)
+            statement = self._apply_ordering(statement, order_by).limit(limit)
+        else:
+            statement = self._apply_ordering(statement, order_by).offset(skip).limit(limit)
+
+        result = await db.execute(statement)
+        return list(result.scalars().all())
+
+    async def get_multi_rows(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[RowMapping]:
+        """
+        以行映射形式获取多个记录，语义同 CRUDBase.get_multi_rows
+
+        Returns:
+            List[RowMapping]: 以列名为键的行映射列表
+        """
+        statement = self._rows_statement(
+            skip=skip, limit=limit, filters=filters, order_by=order_by, cursor=cursor
+        )
+        result = await db.execute(statement)
+        return result.mappings().all()
+
+    async def count(
+        self,
+        db: AsyncSession,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        获取记录总数
+
+        Args:
+            db: 异步数据库会话
+            filters: 过滤条件字典
+
+        Returns:
+            int: 记录总数
+        """
+        statement = self._apply_filters(
+            select(func.count()).select_from(self.model), filters
+        )
+        result = await db.execute(statement)
+        return result.scalar_one()
+
+    async def get_version(
+        self,
+        db: AsyncSession,
+        *,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        探测匹配记录的版本，语义同 CRUDBase.get_version
+
+        Returns:
+            Tuple[Optional[datetime], int]: (最后更新时间, 记录数)
+        """
+        result = await db.execute(self._version_statement(filters))
+        latest, total = result.one()
+        return latest, total
+
+    async def get_updated_at(self, db: AsyncSession, *, id: Any) -> Optional[datetime]:
+        """
+        只读取单条记录的更新时间
+
+        Returns:
+            Optional[datetime]: 更新时间，记录不存在时为None
+        """
+        return (await self.get_version(db, filters={"id": id}))[0]
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        estimate_total: bool = False,
+        options: LoaderOptions = None
+    ) -> Tuple[List[ModelType], int]:
+        """
+        在一条语句中获取当前页数据和总数，语义同 CRUDBase.get_page
+
+        Returns:
+            Tuple[List[ModelType], int]: (当前页数据, 总记录数)
+        """
+        if estimate_total:
+            estimated = await self.estimate_count(db)
+            if estimated is not None and estimated >= settings.ESTIMATED_COUNT_THRESHOLD:
+                items = await self.get_multi(
+                    db,
+                    skip=skip,
+                    limit=limit,
+                    filters=filters,
+                    order_by=order_by,
+                    cursor=cursor,
+                    options=options
+                )
+                return items, estimated
+
+        statement = self._page_statement(
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor,
+            options=options
+        )
+
+        rows = (await db.execute(statement)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+
+        # 当前页为空时窗口函数没有可携带总数的行
+        if skip or cursor:
+            return [], await self.count(db, filters=filters)
+        return [], 0
+
+    async def get_page_rows(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        estimate_total: bool = False
+    ) -> Tuple[List[RowMapping], int]:
+        """
+        以行映射形式获取当前页数据和总数，语义同 CRUDBase.get_page_rows
+
+        Returns:
+            Tuple[List[RowMapping], int]: (当前页行映射, 总记录数)
+        """
+        if estimate_total:
+            estimated = await self.estimate_count(db)
+            if estimated is not None and estimated >= settings.ESTIMATED_COUNT_THRESHOLD:
+                items = await self.get_multi_rows(
+                    db,
+                    skip=skip,
+                    limit=limit,
+                    filters=filters,
+                    order_by=order_by,
+                    cursor=cursor
+                )
+                return items, estimated
+
+        statement = self._page_statement(
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor,
+            rows=True
+        )
+
+        rows = (await db.execute(statement)).mappings().all()
+        if rows:
+            return rows, rows[0]["total"]
+
+        # 当前页为空时窗口函数没有可携带总数的行
+        if skip or cursor:
+            return [], await self.count(db, filters=filters)
+        return [], 0
+
+    async def estimate_count(self, db: AsyncSession) -> Optional[int]:
+        """
+        读取数据库统计信息估算表的行数
+
+        Args:
+            db: 异步数据库会话
+
+        Returns:
+            Optional[int]: 估算行数，数据库不支持或表尚未分析时返回None
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return None
+
+        result = await db.execute(
+            ESTIMATE_COUNT_SQL, {"table": self.model.__tablename__}
+        )
+        reltuples = result.scalar()
+        if reltuples is None or reltuples < 0:
+            return None
+        return int(reltuples)
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        """
+        创建新记录
+
+        Args:
+            db: 异步数据库会话
+            obj_in: 创建对象的数据
+
+        Returns:
+            ModelType: 创建的模型实例
+        """
+        obj_in_data = jsonable_encoder(obj_in)
+        db_obj = self.model(**obj_in_data)  # type: ignore
+        db.add(db_obj)
+        await self._commit_without_expire(db)
+        return db_obj
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        """
+        更新记录
+
+        Args:
+            db: 异步数据库会话
+            db_obj: 要更新的模型实例
+            obj_in: 更新数据
+
+        Returns:
+            ModelType: 更新后的模型实例
+        """
+        obj_data = jsonable_encoder(db_obj)
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        for field in obj_data:
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+
+        db.add(db_obj)
+        await self._commit_without_expire(db)
+        return db_obj
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: List[CreateSchemaType]
+    ) -> List[ModelType]:
+        """
+        批量创建记录
+
+        按 CRUD_BATCH_SIZE 分批执行 INSERT ... RETURNING，全部批次在同一事务中提交
+
+        Args:
+            db: 异步数据库会话
+            objs_in: 创建对象的数据列表
+
+        Returns:
+            List[ModelType]: 创建的模型实例列表（与输入顺序一致）
+        """
+        rows = [jsonable_encoder(obj_in) for obj_in in objs_in]
+        created: List[ModelType] = []
+        try:
+            for chunk in self._chunks(rows):
+                result = await db.scalars(self._insert_many_statement(), chunk)
+                created.extend(result)
+            await self._after_write_many(db, {}, created)
+            await self._commit_without_expire(db)
+        except Exception:
+            await db.rollback()
+            raise
+        return created
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        updates: Dict[Any, Union[UpdateSchemaType, Dict[str, Any]]]
+    ) -> List[ModelType]:
+        """
+        批量更新记录
+
+        每批按更新字段分组执行 executemany UPDATE，再以一条 SELECT 读回更新结果，
+        全部批次在同一事务中提交
+
+        Args:
+            db: 异步数据库会话
+            updates: {记录ID: 更新数据}
+
+        Returns:
+            List[ModelType]: 更新后的模型实例列表（按ID排序，不存在的ID被忽略）
+        """
+        rows = self._update_rows(updates)
+        updated: List[ModelType] = []
+        try:
+            for chunk in self._chunks(rows):
+                ids = [row["id"] for row in chunk]
+                before = await self._before_write_many(db, ids)
+                for statement, params in self._update_many_batches(chunk):
+                    await db.execute(statement, params)
+                objs = list(await db.scalars(self._select_many_statement(ids)))
+                await self._after_write_many(db, before, objs)
+                updated.extend(objs)
+            await self._commit_without_expire(db)
+        except Exception:
+            await db.rollback()
+            raise
+        return sorted(updated, key=lambda obj: obj.id)
+
+    async def _before_write_many(self, db: AsyncSession, ids: List[Any]) -> Dict[Any, Any]:
+        """批量写入前的钩子，返回值原样传给 _after_write_many（子类用于维护派生数据）"""
+        return {}
+
+    async def _after_write_many(
+        self, db: AsyncSession, before: Dict[Any, Any], objs: List[ModelType]
+    ) -> None:
+        """批量写入后、提交前的钩子，与写入处于同一事务"""
+
+    @staticmethod
+    async def _commit_without_expire(db: AsyncSession) -> None:
+        """
+        提交事务但不使实例过期
+
+        写入时已通过 RETURNING/eager_defaults 取得最新数据，提交后无需再 refresh
+        """
+        session = db.sync_session
+        expire_on_commit, session.expire_on_commit = session.expire_on_commit, False
+        try:
+            await db.commit()
+        finally:
+            session.expire_on_commit = expire_on_commit
+
+    async def remove(self, db: AsyncSession, *, id: int) -> Optional[ModelType]:
+        """
+        删除记录
+
+        Args:
+            db: 异步数据库会话
+            id: 记录ID
+
+        Returns:
+            Optional[ModelType]: 被删除的模型实例
+        """
+        obj = await db.get(self.model, id)
+        if obj:
+            await db.delete(obj)
+            await db.commit()
+        return obj
+
+    async def get_by_field(
+        self,
+        db: AsyncSession,
+        field_name: str,
+        field_value: Any
+    ) -> Optional[ModelType]:
+        """
+        通过指定字段获取记录
+
+        Args:
+            db: 异步数据库会话
+            field_name: 字段名
+            field_value: 字段值
+
+        Returns:
+            Optional[ModelType]: 模型实例或None
+        """
+        if not hasattr(self.model, field_name):
+            return None
+        attr = getattr(self.model, field_name)
+        result = await db.execute(select(self.model).where(attr == field_value))
+        return result.scalars().first()
+
+    async def exists(self, db: AsyncSession, **kwargs) -> bool:
+        """
+        检查记录是否存在
+
+        Args:
+            db: 异步数据库会话
+            **kwargs: 查询条件
+
+        Returns:
+            bool: 是否存在
+        """
+        statement = select(self.model.id)
+
+        for key, value in kwargs.items():
+            if hasattr(self.model, key):
+                statement = statement.where(getattr(self.model, key) == value)
+
+        result = await db.execute(statement.limit(1))
+        return result.first() is not None
+
+
+class AsyncCRUDBaseWithSoftDelete(
+    AsyncCRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]
+):
+    """
+    支持软删除的异步CRUD操作类
+    """
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_deleted: bool = False,
+        options: LoaderOptions = None
+    ) -> List[ModelType]:
+        """
+        获取多个记录（默认排除已删除的记录）
+        """
+        filters = self._exclude_deleted(filters, include_deleted)
+
+        return await super().get_multi(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor,
+            options=options
+        )
+
+    async def get_multi_rows(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_deleted: bool = False
+    ) -> List[RowMapping]:
+        """
+        以行映射形式获取多个记录（默认排除已删除的记录）
+        """
+        filters = self._exclude_deleted(filters, include_deleted)
+
+        return await super().get_multi_rows(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor
+        )
+
+    async def count(
+        self,
+        db: AsyncSession,
+        filters: Optional[Dict[str, Any]] = None,
+        include_deleted: bool = False
+    ) -> int:
+        """
+        获取记录总数（默认排除已删除的记录）
+        """
+        filters = self._exclude_deleted(filters, include_deleted)
+
+        return await super().count(db, filters=filters)
+
+    async def get_version(
+        self,
+        db: AsyncSession,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        include_deleted: bool = False
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        探测匹配记录的版本（默认排除已删除的记录）
+        """
+        filters = self._exclude_deleted(filters, include_deleted)
+
+        return await super().get_version(db, filters=filters)
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        estimate_total: bool = False,
+        include_deleted: bool = False,
+        options: LoaderOptions = None
+    ) -> Tuple[List[ModelType], int]:
+        """
+        在一条语句中获取当前页数据和总数（默认排除已删除的记录）
+        """
+        filters = self._exclude_deleted(filters, include_deleted)
+
+        return await super().get_page(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor,
+            estimate_total=estimate_total,
+            options=options
+        )
+
+    async def get_page_rows(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        estimate_total: bool = False,
+        include_deleted: bool = False
+    ) -> Tuple[List[RowMapping], int]:
+        """
+        以行映射形式获取当前页数据和总数（默认排除已删除的记录）
+        """
+        filters = self._exclude_deleted(filters, include_deleted)
+
+        return await super().get_page_rows(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor,
+            estimate_total=estimate_total
+        )
+
+    async def soft_delete(self, db: AsyncSession, *, id: int) -> Optional[ModelType]:
+        """
+        软删除记录
+
+        Args:
+            db: 异步数据库会话
+            id: 记录ID
+
+        Returns:
+            Optional[ModelType]: 被软删除的模型实例
+        """
+        result = await db.scalars(
+            self._update_by_id_statement(id, self._soft_delete_values())
+        )
+        obj = result.first()
+        await self._commit_without_expire(db)
+        return obj
+
+    async def soft_delete_many(self, db: AsyncSession, *, ids: List[Any]) -> List[ModelType]:
+        """
+        批量软删除记录
+
+        每批执行一条 UPDATE ... RETURNING，全部批次在同一事务中提交
+
+        Args:
+            db: 异步数据库会话
+            ids: 记录ID列表
+
+        Returns:
+            List[ModelType]: 被软删除的模型实例列表（按ID排序，不存在或已删除的ID被忽略）
+        """
+        deleted: List[ModelType] = []
+        try:
+            for chunk in self._chunks(list(dict.fromkeys(ids))):
+                before = await self._before_write_many(db, chunk)
+                objs = list(await db.scalars(self._soft_delete_many_statement(chunk)))
+                await self._after_write_many(db, before, objs)
+                deleted.extend(objs)
+            await self._commit_without_expire(db)
+        except Exception:
+            await db.rollback()
+            raise
+        return sorted(deleted, key=lambda obj: obj.id)
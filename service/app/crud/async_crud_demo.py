@@ -0,0 +1,488 @@
+"""
+Demo模型异步CRUD操作
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.async_base import AsyncCRUDBaseWithSoftDelete
+from app.crud.base import LoaderOptions
+from app.crud.crud_demo import CounterSnapshot, CRUDDemo, DemoStatisticsMixin
+from app.models.demo import Demo
+from app.models.demo_counter import DemoCounter
+from app.schemas.demo import DemoCreate, DemoUpdate
+
+
+class AsyncCRUDDemo(
+    DemoStatisticsMixin, AsyncCRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]
+):
+    """
+    Demo 异步CRUD操作类
+    启用 DEMO_COUNTERS_ENABLED 时，写操作在同一事务中增量维护 demo_counters
+    """
+
+    # 推荐列表排序（与同步版本保持一致，保证游标可互用）
+    FEATURED_ORDER = CRUDDemo.FEATURED_ORDER
+
+    async def create(self, db: AsyncSession, *, obj_in: DemoCreate) -> Demo:
+        """
+        创建Demo
+
+        Args:
+            db: 异步数据库会话
+            obj_in: Demo创建数据
+
+        Returns:
+            Demo: 创建的Demo实例
+        """
+        db_obj = Demo(**jsonable_encoder(obj_in))
+        db.add(db_obj)
+        await self._track_counters(db, None, db_obj)
+        await self._commit_without_expire(db)
+        return db_obj
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: Demo,
+        obj_in: Union[DemoUpdate, Dict[str, Any]]
+    ) -> Demo:
+        """
+        更新Demo
+
+        Args:
+            db: 异步数据库会话
+            db_obj: 要更新的Demo实例
+            obj_in: 更新数据
+
+        Returns:
+            Demo: 更新后的Demo实例
+        """
+        before = await self._lock_counter_snapshot(db, db_obj)
+        obj_data = jsonable_encoder(db_obj)
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        for field in obj_data:
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+
+        db.add(db_obj)
+        await self._track_counters(db, before, db_obj)
+        await self._commit_without_expire(db)
+        return db_obj
+
+    async def soft_delete(self, db: AsyncSession, *, id: int) -> Optional[Demo]:
+        """
+        软删除Demo
+
+        Args:
+            db: 异步数据库会话
+            id: Demo ID
+
+        Returns:
+            Optional[Demo]: 被软删除的Demo实例
+        """
+        return await self._update_field(db, demo_id=id, **self._soft_delete_values())
+
+    async def get_statistics(self, db: AsyncSession) -> Dict[str, int]:
+        """
+        单次扫描统计Demo数量（不含已删除记录）
+
+        Args:
+            db: 异步数据库会话
+
+        Returns:
+            Dict[str, int]: 各统计项的数量
+        """
+        row = (await db.execute(self._statistics_statement())).one()
+        return dict(row._mapping)
+
+    async def get_counters(self, db: AsyncSession) -> Optional[Dict[str, int]]:
+        """
+        读取物化计数器
+
+        Args:
+            db: 异步数据库会话
+
+        Returns:
+            Optional[Dict[str, int]]: 各统计项的数量，计数器未初始化时返回None
+        """
+        result = await db.execute(self._counters_statement())
+        return self._counters_from_rows(result.all())
+
+    async def rebuild_counters(self, db: AsyncSession) -> Dict[str, int]:
+        """
+        根据当前数据重建物化计数器（显式执行，读请求不会调用；步骤说明见 CRUDDemo）
+
+        Args:
+            db: 异步数据库会话
+
+        Returns:
+            Dict[str, int]: 重建后的统计数据
+        """
+        existing = (await db.scalars(select(DemoCounter.name))).all()
+        missing = self._missing_counter_rows(existing)
+        if missing:
+            await db.execute(insert(DemoCounter.__table__), missing)
+            await db.commit()
+
+        await db.execute(self._lock_counters_statement())
+        statistics = await self.get_statistics(db)
+        statement, rows = self._set_counters_statement(statistics)
+        await db.execute(statement, rows)
+        await db.commit()
+        return statistics
+
+    async def get_by_name(self, db: AsyncSession, *, name: str) -> Optional[Demo]:
+        """
+        通过名称获取Demo
+
+        Args:
+            db: 异步数据库会话
+            name: Demo名称
+
+        Returns:
+            Optional[Demo]: Demo实例或None
+        """
+        result = await db.execute(
+            select(Demo).where(Demo.name == name, Demo.is_deleted == False)
+        )
+        return result.scalars().first()
+
+    async def get_by_owner(
+        self,
+        db: AsyncSession,
+        *,
+        owner_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[Demo]:
+        """
+        获取指定用户的Demo列表
+
+        Args:
+            db: 异步数据库会话
+            owner_id: 所有者ID
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            List[Demo]: Demo列表
+        """
+        return await self.get_multi(
+            db,
+            skip=skip,
+            limit=limit,
+            filters={"owner_id": owner_id},
+            cursor=cursor
+        )
+
+    async def get_active(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Demo]:
+        """
+        获取活跃状态的Demo列表
+
+        Args:
+            db: 异步数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+
+        Returns:
+            List[Demo]: Demo列表
+        """
+        return await self.get_multi(
+            db, skip=skip, limit=limit, filters={"status": "active"}
+        )
+
+    async def get_featured(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[Demo]:
+        """
+        获取推荐的Demo列表
+
+        Args:
+            db: 异步数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            List[Demo]: Demo列表
+        """
+        return await self.get_multi(
+            db,
+            skip=skip,
+            limit=limit,
+            filters={"is_featured": True},
+            order_by=self.FEATURED_ORDER,
+            cursor=cursor
+        )
+
+    async def get_ids_by_names(self, db: AsyncSession, *, names: List[str]) -> Dict[str, int]:
+        """
+        批量查询名称已被占用的Demo（不含已删除记录）
+
+        Args:
+            db: 异步数据库会话
+            names: Demo名称列表
+
+        Returns:
+            Dict[str, int]: {名称: Demo ID}
+        """
+        if not names:
+            return {}
+        result = await db.execute(self._ids_by_names_statement(list(names)))
+        return dict(result.all())
+
+    async def search_by_name(
+        self,
+        db: AsyncSession,
+        *,
+        name_pattern: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Demo]:
+        """
+        通过关键词搜索Demo（匹配名称和描述）
+
+        Args:
+            db: 异步数据库会话
+            name_pattern: 搜索关键词
+            skip: 跳过记录数
+            limit: 限制记录数
+
+        Returns:
+            List[Demo]: Demo列表
+        """
+        return await self.search(db, term=name_pattern, skip=skip, limit=limit)
+
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        term: str,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Demo]:
+        """
+        按关键词搜索Demo名称和描述，按相关度排序
+
+        Args:
+            db: 异步数据库会话
+            term: 搜索关键词
+            skip: 跳过记录数
+            limit: 限制记录数
+            filters: 额外的过滤条件
+
+        Returns:
+            List[Demo]: Demo列表
+        """
+        statement, rank = self._search_statement(
+            db.get_bind().dialect.name, term=term, filters=filters
+        )
+        result = await db.execute(self._ranked(statement, rank, skip=skip, limit=limit))
+        return list(result.scalars().all())
+
+    async def search_page(
+        self,
+        db: AsyncSession,
+        *,
+        term: str,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        options: LoaderOptions = None
+    ) -> Tuple[List[Demo], int]:
+        """
+        按关键词搜索Demo，在同一条语句中返回当前页和匹配总数
+
+        Args:
+            db: 异步数据库会话
+            term: 搜索关键词
+            skip: 跳过记录数
+            limit: 限制记录数
+            filters: 额外的过滤条件
+            options: 关系加载选项
+
+        Returns:
+            Tuple[List[Demo], int]: (当前页数据, 匹配总数)
+        """
+        statement, rank = self._search_statement(
+            db.get_bind().dialect.name, term=term, filters=filters
+        )
+        page = self._apply_options(
+            statement.add_columns(func.count().over().label("total")), options
+        )
+        page = self._ranked(page, rank, skip=skip, limit=limit)
+
+        rows = (await db.execute(page)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+
+        # 当前页为空时窗口函数没有可携带总数的行
+        if skip:
+            result = await db.execute(
+                select(func.count()).select_from(statement.subquery())
+            )
+            return [], result.scalar_one()
+        return [], 0
+
+    async def count_by_status(self, db: AsyncSession, *, status: str) -> int:
+        """
+        统计指定状态的Demo数量
+
+        Args:
+            db: 异步数据库会话
+            status: 状态
+
+        Returns:
+            int: Demo数量
+        """
+        return await self.count(db, filters={"status": status})
+
+    async def update_status(
+        self,
+        db: AsyncSession,
+        *,
+        demo_id: int,
+        new_status: str,
+        owner_id: Optional[int] = None
+    ) -> Optional[Demo]:
+        """
+        更新Demo状态
+
+        Args:
+            db: 异步数据库会话
+            demo_id: Demo ID
+            new_status: 新状态
+            owner_id: 所有者ID，指定时只更新该用户拥有且未删除的Demo
+
+        Returns:
+            Optional[Demo]: 更新后的Demo实例，未命中时为None
+        """
+        return await self._update_field(
+            db, demo_id=demo_id, owner_id=owner_id, status=new_status
+        )
+
+    async def set_featured(
+        self,
+        db: AsyncSession,
+        *,
+        demo_id: int,
+        is_featured: bool = True,
+        owner_id: Optional[int] = None
+    ) -> Optional[Demo]:
+        """
+        设置Demo为推荐/取消推荐
+
+        Args:
+            db: 异步数据库会话
+            demo_id: Demo ID
+            is_featured: 是否推荐
+            owner_id: 所有者ID，指定时只更新该用户拥有且未删除的Demo
+
+        Returns:
+            Optional[Demo]: 更新后的Demo实例，未命中时为None
+        """
+        return await self._update_field(
+            db, demo_id=demo_id, owner_id=owner_id, is_featured=is_featured
+        )
+
+    async def update_priority(
+        self,
+        db: AsyncSession,
+        *,
+        demo_id: int,
+        priority: int,
+        owner_id: Optional[int] = None
+    ) -> Optional[Demo]:
+        """
+        更新Demo优先级
+
+        Args:
+            db: 异步数据库会话
+            demo_id: Demo ID
+            priority: 优先级
+            owner_id: 所有者ID，指定时只更新该用户拥有且未删除的Demo
+
+        Returns:
+            Optional[Demo]: 更新后的Demo实例，未命中时为None
+        """
+        return await self._update_field(
+            db, demo_id=demo_id, owner_id=owner_id, priority=priority
+        )
+
+    async def _update_field(
+        self, db: AsyncSession, *, demo_id: int, owner_id: Optional[int] = None, **values
+    ) -> Optional[Demo]:
+        """
+        以一条 UPDATE ... RETURNING 更新指定字段并返回更新后的Demo
+
+        启用计数器时先读取写入前的计数快照
+        """
+        before = await self._before_write_many(db, [demo_id])
+        result = await db.scalars(self._field_update_statement(demo_id, owner_id, values))
+        demo = result.first()
+        if demo:
+            await self._after_write_many(db, before, [demo])
+        await self._commit_without_expire(db)
+        return demo
+
+    async def _before_write_many(
+        self, db: AsyncSession, ids: List[int]
+    ) -> Dict[int, CounterSnapshot]:
+        """启用计数器时读取批量写入前的计数快照"""
+        if not settings.DEMO_COUNTERS_ENABLED:
+            return {}
+        rows = await db.execute(self._counter_snapshots_statement(ids))
+        return {row.id: self._counter_snapshot(row) for row in rows}
+
+    async def _after_write_many(
+        self, db: AsyncSession, before: Dict[int, CounterSnapshot], objs: List[Demo]
+    ) -> None:
+        """在批量写入的事务中增量更新计数器"""
+        if not settings.DEMO_COUNTERS_ENABLED:
+            return
+        deltas = self._batch_counter_deltas(before, objs)
+        if deltas:
+            await db.execute(self._counter_update_statement(), deltas)
+
+    async def _lock_counter_snapshot(self, db: AsyncSession, demo: Demo) -> CounterSnapshot:
+        """启用计数器时以 SELECT ... FOR UPDATE 重新读取并锁定该行，返回写入前的计数快照"""
+        if settings.DEMO_COUNTERS_ENABLED:
+            await db.refresh(demo, with_for_update=True)
+        return self._counter_snapshot(demo)
+
+    async def _track_counters(
+        self, db: AsyncSession, before: CounterSnapshot, demo: Demo
+    ) -> None:
+        """在当前事务中按写操作前后的快照增量更新计数器"""
+        if not settings.DEMO_COUNTERS_ENABLED:
+            return
+        deltas = self._counter_deltas(before, self._counter_snapshot(demo))
+        if deltas:
+            await db.execute(self._counter_update_statement(), deltas)
+
+
+demo = AsyncCRUDDemo(Demo)
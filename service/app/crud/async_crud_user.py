@@ -0,0 +1,197 @@
+"""
+用户相关异步CRUD操作
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.async_base import AsyncCRUDBase
+from app.models.user import User
+from app.schemas.user import UserCreate, UserUpdate
+from app.core.hashing import password_hasher
+
+
+class AsyncCRUDUser(AsyncCRUDBase[User, UserCreate, UserUpdate]):
+    """
+    用户异步CRUD操作类
+    密码哈希为CPU密集操作，交给哈希进程池执行以免阻塞事件循环
+    """
+
+    async def get_by_email(self, db: AsyncSession, *, email: str) -> Optional[User]:
+        """
+        通过邮箱获取用户
+
+        Args:
+            db: 异步数据库会话
+            email: 邮箱地址
+
+        Returns:
+            Optional[User]: 用户实例或None
+        """
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+
+    async def get_by_username(
+        self, db: AsyncSession, *, username: str
+    ) -> Optional[User]:
+        """
+        通过用户名获取用户
+
+        Args:
+            db: 异步数据库会话
+            username: 用户名
+
+        Returns:
+            Optional[User]: 用户实例或None
+        """
+        result = await db.execute(select(User).where(User.username == username))
+        return result.scalars().first()
+
+    async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
+        """
+        创建用户
+
+        Args:
+            db: 异步数据库会话
+            obj_in: 用户创建数据
+
+        Returns:
+            User: 创建的用户实例
+        """
+        db_obj = User(
+            email=obj_in.email,
+            username=obj_in.username,
+            full_name=obj_in.full_name,
+            phone=obj_in.phone,
+            hashed_password=await password_hasher.hash_async(obj_in.password),
+            is_active=True,
+            is_superuser=False,
+            is_verified=False,
+        )
+        db.add(db_obj)
+        await self._commit_without_expire(db)
+        return db_obj
+
+    async def update_password(
+        self, db: AsyncSession, *, db_obj: User, new_password: str
+    ) -> User:
+        """
+        更新用户密码
+
+        Args:
+            db: 异步数据库会话
+            db_obj: 用户实例
+            new_password: 新密码
+
+        Returns:
+            User: 更新后的用户实例
+        """
+        db_obj.hashed_password = await password_hasher.hash_async(new_password)
+        db.add(db_obj)
+        await self._commit_without_expire(db)
+        return db_obj
+
+    async def authenticate(
+        self, db: AsyncSession, *, email: str, password: str
+    ) -> Optional[User]:
+        """
+        验证用户登录
+
+        Args:
+            db: 异步数据库会话
+            email: 邮箱
+            password: 密码
+
+        Returns:
+            Optional[User]: 验证成功返回用户实例，失败返回None
+        """
+        user = await self.get_by_email(db, email=email)
+        if not user:
+            return None
+        if not await password_hasher.verify_async(password, user.hashed_password):
+            return None
+        return user
+
+    def is_active(self, user: User) -> bool:
+        """
+        检查用户是否激活
+
+        Args:
+            user: 用户实例
+
+        Returns:
+            bool: 是否激活
+        """
+        return user.is_active and not user.is_deleted
+
+    def is_superuser(self, user: User) -> bool:
+        """
+        检查用户是否为超级用户
+
+        Args:
+            user: 用户实例
+
+        Returns:
+            bool: 是否为超级用户
+        """
+        return user.is_superuser
+
+    async def deactivate(self, db: AsyncSession, *, user_id: int) -> Optional[User]:
+        """
+        停用用户
+
+        Args:
+            db: 异步数据库会话
+            user_id: 用户ID
+
+        Returns:
+            Optional[User]: 更新后的用户实例
+        """
+        return await self._set_active(db, user_id=user_id, is_active=False)
+
+    async def activate(self, db: AsyncSession, *, user_id: int) -> Optional[User]:
+        """
+        激活用户
+
+        Args:
+            db: 异步数据库会话
+            user_id: 用户ID
+
+        Returns:
+            Optional[User]: 更新后的用户实例
+        """
+        return await self._set_active(db, user_id=user_id, is_active=True)
+
+    async def record_login(self, db: AsyncSession, *, user_id: int) -> Optional[User]:
+        """
+        记录一次登录（登录次数原子加一并更新最后登录时间）
+
+        Args:
+            db: 异步数据库会话
+            user_id: 用户ID
+
+        Returns:
+            Optional[User]: 更新后的用户实例
+        """
+        values = {"last_login_at": datetime.utcnow(), "login_count": User.login_count + 1}
+        result = await db.scalars(self._update_by_id_statement(user_id, values))
+        user = result.first()
+        await self._commit_without_expire(db)
+        return user
+
+    async def _set_active(
+        self, db: AsyncSession, *, user_id: int, is_active: bool
+    ) -> Optional[User]:
+        """以一条 UPDATE ... RETURNING 更新用户激活状态"""
+        result = await db.scalars(
+            self._update_by_id_statement(user_id, {"is_active": is_active})
+        )
+        user = result.first()
+        await self._commit_without_expire(db)
+        return user
+
+
+user = AsyncCRUDUser(User)
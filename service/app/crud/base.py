@@ -3,21 +3,407 @@
 提供通用的数据库操作方法
 """
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from datetime import datetime
+from typing import (
+    Any, Dict, Generic, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
+)
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query, Session, raiseload
+from sqlalchemy import RowMapping, Select, and_, bindparam, func, insert, or_, select, text, update
+from sqlalchemy.sql import Insert, Update
+from sqlalchemy.sql.base import ExecutableOption
 
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.response import ValidationException
 from app.db.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+# 关系加载选项，如 selectinload(Demo.owner) / joinedload(Demo.owner)
+LoaderOptions = Optional[Sequence[ExecutableOption]]
 
+# 从PostgreSQL统计信息读取表行数估算值
+ESTIMATE_COUNT_SQL = text(
+    "SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"
+)
 
-class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+
+class CRUDQueryMixin(Generic[ModelType]):
+    """
+    CRUD查询构建混入类
+    提供同步与异步CRUD共用的过滤、排序和游标分页逻辑
+    """
+    
+    model: Type[ModelType]
+    
+    def next_cursor(
+        self,
+        items: List[Union[ModelType, RowMapping]],
+        *,
+        limit: int,
+        order_by: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        根据当前页数据生成下一页游标
+        
+        Args:
+            items: 当前页数据（模型实例或行映射）
+            limit: 每页大小
+            order_by: 与查询时一致的排序字段
+            
+        Returns:
+            Optional[str]: 下一页游标，已到最后一页或排序字段可为空（不支持游标分页）时返回None
+        """
+        if not items or len(items) < limit:
+            return None
+        
+        order_field = self._order_field(order_by)
+        if order_field and self._nullable(order_field):
+            return None
+        
+        last = items[-1]
+        payload: Dict[str, Any] = {"id": self._item_value(last, "id"), "o": order_by or ""}
+        if order_field:
+            payload["v"] = jsonable_encoder(self._item_value(last, order_field))
+        return encode_cursor(payload)
+    
+    @staticmethod
+    def _item_value(item: Union[ModelType, RowMapping], field: str) -> Any:
+        """读取模型实例属性或 get_multi_rows 行映射中的列值"""
+        if isinstance(item, Mapping):
+            return item[field]
+        return getattr(item, field)
+    
+    @staticmethod
+    def _apply_options(
+        statement: Union[Query, Select], options: LoaderOptions
+    ) -> Union[Query, Select]:
+        """
+        为查询附加关系加载选项
+        
+        启用 STRICT_LOADING 时追加 raiseload("*")：未在 options 中显式预加载的关系
+        在访问时抛出异常，避免逐条懒加载造成 N+1 查询
+        """
+        loader_options = list(options or ())
+        if settings.STRICT_LOADING:
+            loader_options.append(raiseload("*"))
+        return statement.options(*loader_options) if loader_options else statement
+    
+    def _page_statement(
+        self,
+        *,
+        skip: int,
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        order_by: Optional[str],
+        cursor: Optional[str],
+        options: LoaderOptions = None,
+        rows: bool = False
+    ) -> Select:
+        """
+        构建同时返回当前页记录和总数的查询语句
+        
+        偏移分页使用 count(*) OVER () 窗口函数；游标分页使用不受游标条件影响的
+        非关联标量子查询计数
+        
+        Args:
+            rows: 按表列读取（见 _rows_statement），此时忽略 options
+        
+        Returns:
+            Select: 每行为 (模型实例, 总数) 的查询语句，rows 时为模型全部列加 total 列
+        """
+        entities = list(self.model.__table__.columns) if rows else [self.model]
+        if cursor:
+            total_subquery = (
+                self._apply_filters(select(func.count()).select_from(self.model), filters)
+                .correlate(None)
+                .scalar_subquery()
+            )
+            statement = self._apply_filters(
+                select(*entities, total_subquery.label("total")), filters
+            )
+            if not rows:
+                statement = self._apply_options(statement, options)
+            statement = self._apply_cursor(statement, cursor, order_by)
+            return self._apply_ordering(statement, order_by).limit(limit)
+        
+        statement = self._apply_filters(
+            select(*entities, func.count().over().label("total")), filters
+        )
+        if not rows:
+            statement = self._apply_options(statement, options)
+        return self._apply_ordering(statement, order_by).offset(skip).limit(limit)
+    
+    def _rows_statement(
+        self,
+        *,
+        skip: int,
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        order_by: Optional[str],
+        cursor: Optional[str]
+    ) -> Select:
+        """
+        构建按表列读取记录的查询语句，结果不经过ORM实例化和身份映射
+        
+        Returns:
+            Select: 选取模型全部列的查询语句
+        """
+        statement = self._apply_filters(select(*self.model.__table__.columns), filters)
+        if cursor:
+            statement = self._apply_cursor(statement, cursor, order_by)
+            return self._apply_ordering(statement, order_by).limit(limit)
+        return self._apply_ordering(statement, order_by).offset(skip).limit(limit)
+    
+    def _version_statement(self, filters: Optional[Dict[str, Any]]) -> Select:
+        """
+        构建资源版本探测语句：只读取 max(updated_at) 和行数，不加载记录内容
+        
+        Returns:
+            Select: 返回 (最后更新时间, 行数) 的查询语句
+        """
+        return self._apply_filters(
+            select(func.max(self.model.updated_at), func.count()).select_from(self.model),
+            filters
+        )
+    
+    def _exclude_deleted(
+        self, 
+        filters: Optional[Dict[str, Any]], 
+        include_deleted: bool
+    ) -> Optional[Dict[str, Any]]:
+        """为支持软删除的模型追加 is_deleted = False 过滤条件"""
+        if not include_deleted and hasattr(self.model, 'is_deleted'):
+            if filters is None:
+                filters = {}
+            filters['is_deleted'] = False
+        return filters
+    
+    def _apply_filters(self, query: Query, filters: Optional[Dict[str, Any]]) -> Query:
+        """
+        应用过滤条件
+        
+        Args:
+            query: 查询对象
+            filters: 过滤条件字典
+            
+        Returns:
+            Query: 应用过滤后的查询对象
+        """
+        if not filters:
+            return query
+        
+        filter_conditions = []
+        for key, value in filters.items():
+            if hasattr(self.model, key):
+                attr = getattr(self.model, key)
+                if isinstance(value, list):
+                    filter_conditions.append(attr.in_(value))
+                elif isinstance(value, dict) and 'like' in value:
+                    filter_conditions.append(attr.like(f"%{value['like']}%"))
+                else:
+                    filter_conditions.append(attr == value)
+        
+        if filter_conditions:
+            query = query.filter(and_(*filter_conditions))
+        return query
+    
+    def _order_field(self, order_by: Optional[str]) -> Optional[str]:
+        """解析排序字段名（去掉降序前缀，忽略不存在的字段和ID）"""
+        if not order_by:
+            return None
+        field = order_by.lstrip('-')
+        if field == "id" or not hasattr(self.model, field):
+            return None
+        return field
+    
+    def _nullable(self, field: str) -> bool:
+        """
+        排序字段是否可为空
+        
+        游标条件中 NULL 的比较结果为未知，NULL 值所在的行会被跳过，
+        且各数据库对 NULL 的排序位置不同，因此只有非空字段支持游标分页
+        """
+        column = self.model.__table__.columns.get(field)
+        return column is None or column.nullable
+    
+    def _apply_ordering(self, query: Query, order_by: Optional[str]) -> Query:
+        """
+        应用排序，并始终以ID作为次级排序保证顺序稳定
+        
+        Args:
+            query: 查询对象
+            order_by: 排序字段，"-" 前缀表示降序
+            
+        Returns:
+            Query: 应用排序后的查询对象
+        """
+        descending = bool(order_by) and order_by.startswith('-')
+        order_field = self._order_field(order_by)
+        
+        if order_field:
+            attr = getattr(self.model, order_field)
+            query = query.order_by(attr.desc() if descending else attr)
+        
+        return query.order_by(self.model.id.desc() if descending else self.model.id)
+    
+    def _apply_cursor(
+        self, 
+        query: Query, 
+        cursor: str, 
+        order_by: Optional[str]
+    ) -> Query:
+        """
+        应用键集分页条件
+        
+        Args:
+            query: 查询对象
+            cursor: 分页游标
+            order_by: 排序字段
+            
+        Returns:
+            Query: 定位到游标之后的查询对象
+            
+        Raises:
+            ValidationException: 游标无效、与排序方式不匹配或排序字段可为空
+        """
+        descending = bool(order_by) and order_by.startswith('-')
+        order_field = self._order_field(order_by)
+        if order_field and self._nullable(order_field):
+            raise ValidationException(
+                error="不支持的分页方式",
+                message=f"排序字段 {order_field} 可为空，不支持游标分页，请使用 skip/limit"
+            )
+        
+        payload = decode_cursor(cursor)
+        if payload.get("o", "") != (order_by or ""):
+            raise ValidationException(
+                error="无效的分页游标",
+                message="分页游标与当前排序方式不匹配"
+            )
+        
+        id_attr = self.model.id
+        last_id = payload["id"]
+        
+        if not order_field:
+            return query.filter(id_attr < last_id if descending else id_attr > last_id)
+        
+        attr = getattr(self.model, order_field)
+        value = self._coerce_cursor_value(attr, payload.get("v"))
+        if descending:
+            condition = or_(attr < value, and_(attr == value, id_attr < last_id))
+        else:
+            condition = or_(attr > value, and_(attr == value, id_attr > last_id))
+        return query.filter(condition)
+    
+    @staticmethod
+    def _chunks(rows: List[Any]) -> Iterator[List[Any]]:
+        """按 CRUD_BATCH_SIZE 切分批量写入的数据"""
+        size = max(settings.CRUD_BATCH_SIZE, 1)
+        for start in range(0, len(rows), size):
+            yield rows[start:start + size]
+    
+    def _update_rows(
+        self, updates: Dict[Any, Union[UpdateSchemaType, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        将 {ID: 更新数据} 转换为按主键批量 UPDATE 的参数
+        
+        与 update 一致只写入模型中存在的字段，没有可更新字段的记录被忽略
+        """
+        columns = set(self.model.__table__.columns.keys()) - {"id"}
+        rows = []
+        for id, obj_in in updates.items():
+            if isinstance(obj_in, dict):
+                update_data = obj_in
+            else:
+                update_data = obj_in.model_dump(exclude_unset=True)
+            row = {field: value for field, value in update_data.items() if field in columns}
+            if row:
+                rows.append({"id": id, **row})
+        return rows
+    
+    def _update_many_batches(
+        self, rows: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[Update, List[Dict[str, Any]]]]:
+        """
+        按更新字段分组生成 executemany UPDATE 语句和参数
+        
+        使用表级语句：不存在的ID只是不匹配任何行，不会像ORM按主键更新那样报错
+        """
+        table = self.model.__table__
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            fields = tuple(sorted(field for field in row if field != "id"))
+            params = {f"b_{field}": value for field, value in row.items()}
+            groups.setdefault(fields, []).append(params)
+        for fields, params in groups.items():
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values({field: bindparam(f"b_{field}") for field in fields})
+            )
+            yield statement, params
+    
+    def _insert_many_statement(self) -> Insert:
+        """批量 INSERT ... RETURNING，生成的主键和默认值随插入结果返回"""
+        return insert(self.model).returning(self.model)
+    
+    def _select_many_statement(self, ids: List[Any]) -> Select:
+        """按ID批量读取记录，覆盖会话中已加载实例的旧值"""
+        return (
+            select(self.model)
+            .where(self.model.id.in_(ids))
+            .execution_options(populate_existing=True)
+        )
+    
+    def _update_by_id_statement(self, id: Any, values: Dict[str, Any]) -> Update:
+        """
+        按ID更新指定字段，RETURNING 返回更新后的记录
+        
+        一次往返完成更新和读取，会话中已加载的同一实例会被同步刷新
+        """
+        return (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model)
+        )
+    
+    @staticmethod
+    def _soft_delete_values() -> Dict[str, Any]:
+        return {"is_deleted": True, "deleted_at": datetime.utcnow()}
+    
+    def _soft_delete_many_statement(self, ids: List[Any]) -> Update:
+        """批量软删除未删除的记录，RETURNING 返回被删除的记录"""
+        return (
+            update(self.model)
+            .where(self.model.id.in_(ids), self.model.is_deleted == False)
+            .values(**self._soft_delete_values())
+            .returning(self.model)
+        )
+    
+    @staticmethod
+    def _coerce_cursor_value(attr: Any, value: Any) -> Any:
+        """将游标中的JSON值还原为列对应的Python类型"""
+        if isinstance(value, str):
+            try:
+                python_type = attr.type.python_type
+            except NotImplementedError:
+                return value
+            if python_type is datetime:
+                return datetime.fromisoformat(value)
+        return value
+    
+
+
+class CRUDBase(
+    CRUDQueryMixin[ModelType], Generic[ModelType, CreateSchemaType, UpdateSchemaType]
+):
     """
     基础CRUD操作类
     提供标准的创建、读取、更新、删除操作
@@ -32,18 +418,35 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
     
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
+    def get(self, db: Session, id: Any, *, options: LoaderOptions = None) -> Optional[ModelType]:
         """
         通过ID获取单个记录
         
         Args:
             db: 数据库会话
             id: 记录ID
+            options: 关系加载选项（如 joinedload(Demo.owner)）
             
         Returns:
             Optional[ModelType]: 模型实例或None
         """
-        return db.query(self.model).filter(self.model.id == id).first()
+        query = self._apply_options(db.query(self.model), options)
+        return query.filter(self.model.id == id).first()
+    
+    def get_many(self, db: Session, *, ids: List[Any]) -> List[ModelType]:
+        """
+        通过ID列表批量获取记录
+        
+        Args:
+            db: 数据库会话
+            ids: 记录ID列表
+            
+        Returns:
+            List[ModelType]: 存在的模型实例列表
+        """
+        if not ids:
+            return []
+        return list(db.scalars(self._select_many_statement(list(ids))))
     
     def get_multi(
         self, 
@@ -52,52 +455,66 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         skip: int = 0, 
         limit: int = 100,
         filters: Optional[Dict[str, Any]] = None,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        options: LoaderOptions = None
     ) -> List[ModelType]:
         """
         获取多个记录
         
+        传入 cursor 时使用键集分页（按 排序字段+ID 定位），忽略 skip
+        
         Args:
             db: 数据库会话
             skip: 跳过记录数
             limit: 限制记录数
             filters: 过滤条件字典
             order_by: 排序字段
+            cursor: 分页游标（上一页返回的 next_cursor）
+            options: 关系加载选项（列表建议 selectinload，查询数与页大小无关）
             
         Returns:
             List[ModelType]: 模型实例列表
         """
-        query = db.query(self.model)
+        query = self._apply_filters(self._apply_options(db.query(self.model), options), filters)
         
-        # 应用过滤条件
-        if filters:
-            filter_conditions = []
-            for key, value in filters.items():
-                if hasattr(self.model, key):
-                    attr = getattr(self.model, key)
-                    if isinstance(value, list):
-                        filter_conditions.append(attr.in_(value))
-                    elif isinstance(value, dict) and 'like' in value:
-                        filter_conditions.append(attr.like(f"%{value['like']}%"))
-                    else:
-                        filter_conditions.append(attr == value)
-            
-            if filter_conditions:
-                query = query.filter(and_(*filter_conditions))
-        
-        # 应用排序
-        if order_by:
-            if order_by.startswith('-'):
-                # 降序
-                order_field = order_by[1:]
-                if hasattr(self.model, order_field):
-                    query = query.order_by(getattr(self.model, order_field).desc())
-            else:
-                # 升序
-                if hasattr(self.model, order_by):
-                    query = query.order_by(getattr(self.model, order_by))
+        if cursor:
+            query = self._apply_cursor(query, cursor, order_by)
+            return self._apply_ordering(query, order_by).limit(limit).all()
+        
+        return self._apply_ordering(query, order_by).offset(skip).limit(limit).all()
+    
+    def get_multi_rows(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[RowMapping]:
+        """
+        以行映射形式获取多个记录，参数语义同 get_multi
+        
+        不构造ORM实例，适合只读列表接口：配合 TypeAdapter(List[Schema]) 一次性校验，
+        再以 paginated_response(raw=True) 输出
         
-        return query.offset(skip).limit(limit).all()
+        Args:
+            db: 数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            filters: 过滤条件字典
+            order_by: 排序字段
+            cursor: 分页游标
+            
+        Returns:
+            List[RowMapping]: 以列名为键的行映射列表
+        """
+        statement = self._rows_statement(
+            skip=skip, limit=limit, filters=filters, order_by=order_by, cursor=cursor
+        )
+        return db.execute(statement).mappings().all()
     
     def count(
         self, 
@@ -114,25 +531,174 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             int: 记录总数
         """
-        query = db.query(self.model)
+        return self._apply_filters(db.query(self.model), filters).count()
+    
+    def get_version(
+        self,
+        db: Session,
+        *,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        探测匹配记录的版本，用于生成 ETag / Last-Modified
         
-        # 应用过滤条件
-        if filters:
-            filter_conditions = []
-            for key, value in filters.items():
-                if hasattr(self.model, key):
-                    attr = getattr(self.model, key)
-                    if isinstance(value, list):
-                        filter_conditions.append(attr.in_(value))
-                    elif isinstance(value, dict) and 'like' in value:
-                        filter_conditions.append(attr.like(f"%{value['like']}%"))
-                    else:
-                        filter_conditions.append(attr == value)
+        Args:
+            db: 数据库会话
+            filters: 过滤条件字典
+            
+        Returns:
+            Tuple[Optional[datetime], int]: (最后更新时间, 记录数)，无匹配记录时为 (None, 0)
+        """
+        latest, total = db.execute(self._version_statement(filters)).one()
+        return latest, total
+    
+    def get_updated_at(self, db: Session, *, id: Any) -> Optional[datetime]:
+        """
+        只读取单条记录的更新时间
+        
+        Args:
+            db: 数据库会话
+            id: 记录ID
+            
+        Returns:
+            Optional[datetime]: 更新时间，记录不存在时为None
+        """
+        return self.get_version(db, filters={"id": id})[0]
+    
+    def get_page(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        estimate_total: bool = False,
+        options: LoaderOptions = None
+    ) -> Tuple[List[ModelType], int]:
+        """
+        在一条语句中获取当前页数据和总数
+        
+        偏移分页使用 count(*) OVER () 窗口函数，游标分页使用不受游标条件影响的
+        标量子查询计数。estimate_total 仅适用于无业务过滤条件的全表列表：
+        PostgreSQL 上读取 pg_class.reltuples，表足够大时用估算值代替精确计数。
+        
+        Args:
+            db: 数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            filters: 过滤条件字典
+            order_by: 排序字段
+            cursor: 分页游标
+            estimate_total: 是否允许使用估算总数
+            options: 关系加载选项
+            
+        Returns:
+            Tuple[List[ModelType], int]: (当前页数据, 总记录数)
+        """
+        if estimate_total:
+            estimated = self.estimate_count(db)
+            if estimated is not None and estimated >= settings.ESTIMATED_COUNT_THRESHOLD:
+                items = self.get_multi(
+                    db, 
+                    skip=skip, 
+                    limit=limit, 
+                    filters=filters, 
+                    order_by=order_by, 
+                    cursor=cursor,
+                    options=options
+                )
+                return items, estimated
+        
+        statement = self._page_statement(
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor,
+            options=options
+        )
+        
+        rows = db.execute(statement).all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        
+        # 当前页为空时窗口函数没有可携带总数的行
+        if skip or cursor:
+            return [], self.count(db, filters=filters)
+        return [], 0
+    
+    def get_page_rows(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        estimate_total: bool = False
+    ) -> Tuple[List[RowMapping], int]:
+        """
+        以行映射形式获取当前页数据和总数，参数语义同 get_page
+        
+        与 get_multi_rows 一样不构造ORM实例，总数仍在同一条语句中获取；
+        行映射中多出的 total 列在按输出模式校验时被忽略
+        
+        Returns:
+            Tuple[List[RowMapping], int]: (当前页行映射, 总记录数)
+        """
+        if estimate_total:
+            estimated = self.estimate_count(db)
+            if estimated is not None and estimated >= settings.ESTIMATED_COUNT_THRESHOLD:
+                items = self.get_multi_rows(
+                    db,
+                    skip=skip,
+                    limit=limit,
+                    filters=filters,
+                    order_by=order_by,
+                    cursor=cursor
+                )
+                return items, estimated
+        
+        statement = self._page_statement(
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor,
+            rows=True
+        )
+        
+        rows = db.execute(statement).mappings().all()
+        if rows:
+            return rows, rows[0]["total"]
+        
+        # 当前页为空时窗口函数没有可携带总数的行
+        if skip or cursor:
+            return [], self.count(db, filters=filters)
+        return [], 0
+    
+    def estimate_count(self, db: Session) -> Optional[int]:
+        """
+        读取数据库统计信息估算表的行数
+        
+        Args:
+            db: 数据库会话
             
-            if filter_conditions:
-                query = query.filter(and_(*filter_conditions))
+        Returns:
+            Optional[int]: 估算行数，数据库不支持或表尚未分析时返回None
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return None
         
-        return query.count()
+        reltuples = db.execute(
+            ESTIMATE_COUNT_SQL, {"table": self.model.__tablename__}
+        ).scalar()
+        if reltuples is None or reltuples < 0:
+            return None
+        return int(reltuples)
     
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """
@@ -148,8 +714,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)  # type: ignore
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._commit_without_expire(db)
         return db_obj
     
     def update(
@@ -181,10 +746,97 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 setattr(db_obj, field, update_data[field])
         
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._commit_without_expire(db)
         return db_obj
     
+    def create_many(
+        self, 
+        db: Session, 
+        *, 
+        objs_in: List[CreateSchemaType]
+    ) -> List[ModelType]:
+        """
+        批量创建记录
+        
+        按 CRUD_BATCH_SIZE 分批执行 INSERT ... RETURNING，全部批次在同一事务中提交
+        
+        Args:
+            db: 数据库会话
+            objs_in: 创建对象的数据列表
+            
+        Returns:
+            List[ModelType]: 创建的模型实例列表（与输入顺序一致）
+        """
+        rows = [jsonable_encoder(obj_in) for obj_in in objs_in]
+        created: List[ModelType] = []
+        try:
+            for chunk in self._chunks(rows):
+                created.extend(db.scalars(self._insert_many_statement(), chunk))
+            self._after_write_many(db, {}, created)
+            self._commit_without_expire(db)
+        except Exception:
+            db.rollback()
+            raise
+        return created
+    
+    def update_many(
+        self,
+        db: Session,
+        *,
+        updates: Dict[Any, Union[UpdateSchemaType, Dict[str, Any]]]
+    ) -> List[ModelType]:
+        """
+        批量更新记录
+        
+        每批按更新字段分组执行 executemany UPDATE，再以一条 SELECT 读回更新结果，
+        全部批次在同一事务中提交
+        
+        Args:
+            db: 数据库会话
+            updates: {记录ID: 更新数据}
+            
+        Returns:
+            List[ModelType]: 更新后的模型实例列表（按ID排序，不存在的ID被忽略）
+        """
+        rows = self._update_rows(updates)
+        updated: List[ModelType] = []
+        try:
+            for chunk in self._chunks(rows):
+                ids = [row["id"] for row in chunk]
+                before = self._before_write_many(db, ids)
+                for statement, params in self._update_many_batches(chunk):
+                    db.execute(statement, params)
+                objs = list(db.scalars(self._select_many_statement(ids)))
+                self._after_write_many(db, before, objs)
+                updated.extend(objs)
+            self._commit_without_expire(db)
+        except Exception:
+            db.rollback()
+            raise
+        return sorted(updated, key=lambda obj: obj.id)
+    
+    def _before_write_many(self, db: Session, ids: List[Any]) -> Dict[Any, Any]:
+        """批量写入前的钩子，返回值原样传给 _after_write_many（子类用于维护派生数据）"""
+        return {}
+    
+    def _after_write_many(
+        self, db: Session, before: Dict[Any, Any], objs: List[ModelType]
+    ) -> None:
+        """批量写入后、提交前的钩子，与写入处于同一事务"""
+    
+    @staticmethod
+    def _commit_without_expire(db: Session) -> None:
+        """
+        提交事务但不使实例过期
+        
+        写入时已通过 RETURNING/eager_defaults 取得最新数据，提交后无需再 refresh
+        """
+        expire_on_commit, db.expire_on_commit = db.expire_on_commit, False
+        try:
+            db.commit()
+        finally:
+            db.expire_on_commit = expire_on_commit
+    
     def remove(self, db: Session, *, id: int) -> ModelType:
         """
         删除记录
@@ -257,18 +909,48 @@ class CRUDBaseWithSoftDelete(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaT
         limit: int = 100,
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[str] = None,
-        include_deleted: bool = False
+        cursor: Optional[str] = None,
+        include_deleted: bool = False,
+        options: LoaderOptions = None
     ) -> List[ModelType]:
         """
         获取多个记录（默认排除已删除的记录）
         """
-        if not include_deleted and hasattr(self.model, 'is_deleted'):
-            if filters is None:
-                filters = {}
-            filters['is_deleted'] = False
+        filters = self._exclude_deleted(filters, include_deleted)
         
         return super().get_multi(
-            db, skip=skip, limit=limit, filters=filters, order_by=order_by
+            db, 
+            skip=skip, 
+            limit=limit, 
+            filters=filters, 
+            order_by=order_by, 
+            cursor=cursor,
+            options=options
+        )
+    
+    def get_multi_rows(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_deleted: bool = False
+    ) -> List[RowMapping]:
+        """
+        以行映射形式获取多个记录（默认排除已删除的记录）
+        """
+        filters = self._exclude_deleted(filters, include_deleted)
+        
+        return super().get_multi_rows(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor
         )
     
     def count(
@@ -280,13 +962,80 @@ class CRUDBaseWithSoftDelete(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaT
         """
         获取记录总数（默认排除已删除的记录）
         """
-        if not include_deleted and hasattr(self.model, 'is_deleted'):
-            if filters is None:
-                filters = {}
-            filters['is_deleted'] = False
+        filters = self._exclude_deleted(filters, include_deleted)
         
         return super().count(db, filters=filters)
     
+    def get_version(
+        self,
+        db: Session,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        include_deleted: bool = False
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        探测匹配记录的版本（默认排除已删除的记录）
+        """
+        filters = self._exclude_deleted(filters, include_deleted)
+        
+        return super().get_version(db, filters=filters)
+    
+    def get_page(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        estimate_total: bool = False,
+        include_deleted: bool = False,
+        options: LoaderOptions = None
+    ) -> Tuple[List[ModelType], int]:
+        """
+        在一条语句中获取当前页数据和总数（默认排除已删除的记录）
+        """
+        filters = self._exclude_deleted(filters, include_deleted)
+        
+        return super().get_page(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor,
+            estimate_total=estimate_total,
+            options=options
+        )
+    
+    def get_page_rows(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        estimate_total: bool = False,
+        include_deleted: bool = False
+    ) -> Tuple[List[RowMapping], int]:
+        """
+        以行映射形式获取当前页数据和总数（默认排除已删除的记录）
+        """
+        filters = self._exclude_deleted(filters, include_deleted)
+        
+        return super().get_page_rows(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=order_by,
+            cursor=cursor,
+            estimate_total=estimate_total
+        )
+    
     def soft_delete(self, db: Session, *, id: int) -> ModelType:
         """
         软删除记录
@@ -298,10 +1047,32 @@ class CRUDBaseWithSoftDelete(CRUDBase[ModelType, CreateSchemaType, UpdateSchemaT
         Returns:
             ModelType: 被软删除的模型实例
         """
-        obj = db.query(self.model).get(id)
-        if obj and hasattr(obj, 'soft_delete'):
-            obj.soft_delete()
-            db.add(obj)
-            db.commit()
-            db.refresh(obj)
+        obj = db.scalars(self._update_by_id_statement(id, self._soft_delete_values())).first()
+        self._commit_without_expire(db)
         return obj
+    
+    def soft_delete_many(self, db: Session, *, ids: List[Any]) -> List[ModelType]:
+        """
+        批量软删除记录
+        
+        每批执行一条 UPDATE ... RETURNING，全部批次在同一事务中提交
+        
+        Args:
+            db: 数据库会话
+            ids: 记录ID列表
+            
+        Returns:
+            List[ModelType]: 被软删除的模型实例列表（按ID排序，不存在或已删除的ID被忽略）
+        """
+        deleted: List[ModelType] = []
+        try:
+            for chunk in self._chunks(list(dict.fromkeys(ids))):
+                before = self._before_write_many(db, chunk)
+                objs = list(db.scalars(self._soft_delete_many_statement(chunk)))
+                self._after_write_many(db, before, objs)
+                deleted.extend(objs)
+            self._commit_without_expire(db)
+        except Exception:
+            db.rollback()
+            raise
+        return sorted(deleted, key=lambda obj: obj.id)
@@ -2,19 +2,362 @@
 Demo模型CRUD操作
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from app.crud.base import CRUDBaseWithSoftDelete
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.sql import Select, Update
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import settings
+from app.crud.base import CRUDBaseWithSoftDelete, LoaderOptions
+from app.crud.search import get_search_backend
 from app.models.demo import Demo
+from app.models.demo_counter import DemoCounter
 from app.schemas.demo import DemoCreate, DemoUpdate
 
+# 计数快照：(状态, 是否推荐)，已删除或不存在的记录为None
+CounterSnapshot = Optional[Tuple[str, bool]]
+
+
+class DemoStatisticsMixin:
+    """
+    Demo统计与搜索查询构建
+    同步和异步CRUD共用的聚合语句、计数器增量计算、关键词搜索语句和关系加载选项
+    """
+    
+    # 单条Demo连同所有者在一条 JOIN 查询中取回
+    OWNER_OPTIONS = (joinedload(Demo.owner),)
+    # 列表页的所有者以一条 IN 查询批量加载，查询数与页大小无关
+    OWNER_LIST_OPTIONS = (selectinload(Demo.owner),)
+    
+    # 统计项，与 demo_counters.name 一致
+    STATISTICS_KEYS = ("total", "active", "inactive", "pending", "featured")
+    STATUS_KEYS = ("active", "inactive", "pending")
+    
+    def _statistics_statement(self) -> Select:
+        """一次扫描计算全部统计项的 FILTER 聚合语句"""
+        return select(
+            func.count().label("total"),
+            *(
+                func.count().filter(Demo.status == status).label(status)
+                for status in self.STATUS_KEYS
+            ),
+            func.count().filter(Demo.is_featured == True).label("featured"),
+        ).where(Demo.is_deleted == False)
+    
+    def _counters_statement(self) -> Select:
+        return select(DemoCounter.name, DemoCounter.value)
+    
+    def _counters_from_rows(self, rows) -> Optional[Dict[str, int]]:
+        """计数器行转为统计字典，计数器未初始化时返回None"""
+        counters = {name: int(value) for name, value in rows}
+        if any(key not in counters for key in self.STATISTICS_KEYS):
+            return None
+        return {key: counters[key] for key in self.STATISTICS_KEYS}
+    
+    def _missing_counter_rows(self, existing: List[str]) -> List[Dict[str, Any]]:
+        """尚不存在的计数器行（值为0），重建前插入"""
+        return [{"name": key, "value": 0} for key in self.STATISTICS_KEYS if key not in existing]
+    
+    @staticmethod
+    def _lock_counters_statement() -> Select:
+        """锁定全部计数器行：重建期间并发写入的增量等待重建提交后再累加"""
+        return select(DemoCounter.name).with_for_update()
+    
+    def _set_counters_statement(
+        self, statistics: Dict[str, int]
+    ) -> Tuple[Update, List[Dict[str, Any]]]:
+        """按统计结果覆盖计数器值的 executemany 语句和参数"""
+        table = DemoCounter.__table__
+        statement = (
+            update(table)
+            .where(table.c.name == bindparam("counter_name"))
+            .values(value=bindparam("counter_value"))
+        )
+        rows = [
+            {"counter_name": key, "counter_value": statistics[key]}
+            for key in self.STATISTICS_KEYS
+        ]
+        return statement, rows
+    
+    @staticmethod
+    def _counter_snapshot(demo: Optional[Demo]) -> CounterSnapshot:
+        if demo is None or demo.is_deleted:
+            return None
+        return demo.status, bool(demo.is_featured)
+    
+    def _counter_deltas(
+        self, before: CounterSnapshot, after: CounterSnapshot
+    ) -> List[Dict[str, Any]]:
+        """计算写操作前后各计数器的变化量，只返回非零项"""
+        return self._counter_deltas_many([(before, after)])
+    
+    def _counter_deltas_many(
+        self, changes: List[Tuple[CounterSnapshot, CounterSnapshot]]
+    ) -> List[Dict[str, Any]]:
+        """合并多条记录写操作前后的计数器变化量，只返回非零项"""
+        deltas: Dict[str, int] = {}
+        for before, after in changes:
+            for snapshot, sign in ((before, -1), (after, 1)):
+                if snapshot is None:
+                    continue
+                status, is_featured = snapshot
+                keys = ["total"]
+                if status in self.STATUS_KEYS:
+                    keys.append(status)
+                if is_featured:
+                    keys.append("featured")
+                for key in keys:
+                    deltas[key] = deltas.get(key, 0) + sign
+        return [
+            {"counter_name": key, "delta": delta}
+            for key, delta in deltas.items() if delta
+        ]
+    
+    def _field_update_statement(
+        self, demo_id: int, owner_id: Optional[int], values: Dict[str, Any]
+    ) -> Update:
+        """
+        单个Demo的字段更新语句
+        
+        指定 owner_id 时所有权和软删除检查与更新在同一条语句中完成，不存在先读后写的竞态
+        """
+        statement = self._update_by_id_statement(demo_id, values)
+        if owner_id is not None:
+            statement = statement.where(Demo.owner_id == owner_id, Demo.is_deleted == False)
+        return statement
+    
+    @staticmethod
+    def _counter_snapshots_statement(ids: List[int]) -> Select:
+        """
+        批量写入前读取计数快照所需的列
+        
+        SELECT ... FOR UPDATE 锁定这些行直到事务结束：并发写入同一行时后者等待前者提交，
+        读到的是最新值，两个事务不会基于同一个旧快照各自计算增量
+        """
+        return (
+            select(Demo.id, Demo.status, Demo.is_featured, Demo.is_deleted)
+            .where(Demo.id.in_(ids))
+            .with_for_update()
+        )
+    
+    def _batch_counter_deltas(
+        self, before: Dict[int, CounterSnapshot], demos: List[Demo]
+    ) -> List[Dict[str, Any]]:
+        """批量写入后各计数器的变化量"""
+        return self._counter_deltas_many(
+            [(before.get(demo.id), self._counter_snapshot(demo)) for demo in demos]
+        )
+    
+    @staticmethod
+    def _ids_by_names_statement(names: List[str]) -> Select:
+        return select(Demo.name, Demo.id).where(Demo.name.in_(names), Demo.is_deleted == False)
+    
+    def _search_statement(
+        self, dialect_name: str, *, term: str, filters: Optional[Dict[str, Any]]
+    ) -> Tuple[Select, ColumnElement]:
+        """关键词搜索语句（不含已删除记录）及其相关度表达式"""
+        statement = self._apply_filters(
+            select(Demo), self._exclude_deleted(dict(filters or {}), False)
+        )
+        return get_search_backend(dialect_name).apply(statement, term)
+    
+    @staticmethod
+    def _ranked(statement: Select, rank: ColumnElement, *, skip: int, limit: int) -> Select:
+        """按相关度降序分页，相关度相同时按ID降序"""
+        return statement.order_by(rank.desc(), Demo.id.desc()).offset(skip).limit(limit)
+    
+    @staticmethod
+    def _counter_update_statement() -> Update:
+        # 使用 Core 表对象，使参数列表按 executemany 执行而非ORM批量更新
+        table = DemoCounter.__table__
+        return (
+            update(table)
+            .where(table.c.name == bindparam("counter_name"))
+            .values(value=table.c.value + bindparam("delta"))
+        )
+
 
-class CRUDDemo(CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
+class CRUDDemo(DemoStatisticsMixin, CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
     """
     Demo CRUD操作类
+    启用 DEMO_COUNTERS_ENABLED 时，写操作在同一事务中增量维护 demo_counters
     """
     
+    # 推荐列表排序（优先级降序）
+    FEATURED_ORDER = "-priority"
+    
+    def create(self, db: Session, *, obj_in: DemoCreate) -> Demo:
+        """
+        创建Demo
+        
+        Args:
+            db: 数据库会话
+            obj_in: Demo创建数据
+            
+        Returns:
+            Demo: 创建的Demo实例
+        """
+        db_obj = Demo(**jsonable_encoder(obj_in))
+        db.add(db_obj)
+        self._track_counters(db, None, db_obj)
+        self._commit_without_expire(db)
+        return db_obj
+    
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Demo,
+        obj_in: Union[DemoUpdate, Dict[str, Any]]
+    ) -> Demo:
+        """
+        更新Demo
+        
+        Args:
+            db: 数据库会话
+            db_obj: 要更新的Demo实例
+            obj_in: 更新数据
+            
+        Returns:
+            Demo: 更新后的Demo实例
+        """
+        before = self._lock_counter_snapshot(db, db_obj)
+        obj_data = jsonable_encoder(db_obj)
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        
+        for field in obj_data:
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+        
+        db.add(db_obj)
+        self._track_counters(db, before, db_obj)
+        self._commit_without_expire(db)
+        return db_obj
+    
+    def soft_delete(self, db: Session, *, id: int) -> Optional[Demo]:
+        """
+        软删除Demo
+        
+        Args:
+            db: 数据库会话
+            id: Demo ID
+            
+        Returns:
+            Optional[Demo]: 被软删除的Demo实例
+        """
+        return self._update_field(db, demo_id=id, **self._soft_delete_values())
+    
+    def get_statistics(self, db: Session) -> Dict[str, int]:
+        """
+        单次扫描统计Demo数量（不含已删除记录）
+        
+        Args:
+            db: 数据库会话
+            
+        Returns:
+            Dict[str, int]: 各统计项的数量
+        """
+        row = db.execute(self._statistics_statement()).one()
+        return dict(row._mapping)
+    
+    def get_counters(self, db: Session) -> Optional[Dict[str, int]]:
+        """
+        读取物化计数器
+        
+        Args:
+            db: 数据库会话
+            
+        Returns:
+            Optional[Dict[str, int]]: 各统计项的数量，计数器未初始化时返回None
+        """
+        return self._counters_from_rows(db.execute(self._counters_statement()).all())
+    
+    def rebuild_counters(self, db: Session) -> Dict[str, int]:
+        """
+        根据当前数据重建物化计数器
+        
+        启用计数器前或修复漂移时由 scripts/rebuild_demo_counters.py 显式执行，读请求不会调用。
+        先补齐缺失的计数器行并提交，此后并发写入的增量都有行可记；再在一个写事务中
+        锁定计数器行、统计并覆盖：加锁前已提交的写入计入统计，之后的写入等待锁释放，
+        在重建后的值上继续累加
+        
+        Args:
+            db: 数据库会话
+            
+        Returns:
+            Dict[str, int]: 重建后的统计数据
+        """
+        existing = db.scalars(select(DemoCounter.name)).all()
+        missing = self._missing_counter_rows(existing)
+        if missing:
+            db.execute(insert(DemoCounter.__table__), missing)
+            db.commit()
+        
+        db.execute(self._lock_counters_statement())
+        statistics = self.get_statistics(db)
+        statement, rows = self._set_counters_statement(statistics)
+        db.execute(statement, rows)
+        db.commit()
+        return statistics
+    
+    def _lock_counter_snapshot(self, db: Session, demo: Demo) -> CounterSnapshot:
+        """
+        启用计数器时以 SELECT ... FOR UPDATE 重新读取并锁定该行，返回写入前的计数快照
+        
+        实例可能是事务开始前从读连接加载的，直接用它的值会基于过期快照计算增量
+        """
+        if settings.DEMO_COUNTERS_ENABLED:
+            db.refresh(demo, with_for_update=True)
+        return self._counter_snapshot(demo)
+    
+    def _track_counters(
+        self, db: Session, before: CounterSnapshot, demo: Demo
+    ) -> None:
+        """在当前事务中按写操作前后的快照增量更新计数器"""
+        if not settings.DEMO_COUNTERS_ENABLED:
+            return
+        deltas = self._counter_deltas(before, self._counter_snapshot(demo))
+        if deltas:
+            db.execute(self._counter_update_statement(), deltas)
+    
+    def _update_field(
+        self, db: Session, *, demo_id: int, owner_id: Optional[int] = None, **values
+    ) -> Optional[Demo]:
+        """
+        以一条 UPDATE ... RETURNING 更新指定字段并返回更新后的Demo
+        
+        启用计数器时先读取写入前的计数快照
+        """
+        before = self._before_write_many(db, [demo_id])
+        demo = db.scalars(self._field_update_statement(demo_id, owner_id, values)).first()
+        if demo:
+            self._after_write_many(db, before, [demo])
+        self._commit_without_expire(db)
+        return demo
+    
+    def _before_write_many(self, db: Session, ids: List[int]) -> Dict[int, CounterSnapshot]:
+        """启用计数器时读取批量写入前的计数快照"""
+        if not settings.DEMO_COUNTERS_ENABLED:
+            return {}
+        rows = db.execute(self._counter_snapshots_statement(ids))
+        return {row.id: self._counter_snapshot(row) for row in rows}
+    
+    def _after_write_many(
+        self, db: Session, before: Dict[int, CounterSnapshot], objs: List[Demo]
+    ) -> None:
+        """在批量写入的事务中增量更新计数器"""
+        if not settings.DEMO_COUNTERS_ENABLED:
+            return
+        deltas = self._batch_counter_deltas(before, objs)
+        if deltas:
+            db.execute(self._counter_update_statement(), deltas)
+    
     def get_by_name(self, db: Session, *, name: str) -> Optional[Demo]:
         """
         通过名称获取Demo
@@ -37,7 +380,8 @@ class CRUDDemo(CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
         *, 
         owner_id: int, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Demo]:
         """
         获取指定用户的Demo列表
@@ -47,14 +391,18 @@ class CRUDDemo(CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
             owner_id: 所有者ID
             skip: 跳过记录数
             limit: 限制记录数
+            cursor: 分页游标
             
         Returns:
             List[Demo]: Demo列表
         """
-        return db.query(Demo).filter(
-            Demo.owner_id == owner_id,
-            Demo.is_deleted == False
-        ).offset(skip).limit(limit).all()
+        return self.get_multi(
+            db,
+            skip=skip,
+            limit=limit,
+            filters={"owner_id": owner_id},
+            cursor=cursor
+        )
     
     def get_active(
         self, 
@@ -84,7 +432,8 @@ class CRUDDemo(CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
         db: Session, 
         *, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Demo]:
         """
         获取推荐的Demo列表
@@ -93,14 +442,34 @@ class CRUDDemo(CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
             db: 数据库会话
             skip: 跳过记录数
             limit: 限制记录数
+            cursor: 分页游标
             
         Returns:
             List[Demo]: Demo列表
         """
-        return db.query(Demo).filter(
-            Demo.is_featured == True,
-            Demo.is_deleted == False
-        ).order_by(Demo.priority.desc()).offset(skip).limit(limit).all()
+        return self.get_multi(
+            db,
+            skip=skip,
+            limit=limit,
+            filters={"is_featured": True},
+            order_by=self.FEATURED_ORDER,
+            cursor=cursor
+        )
+    
+    def get_ids_by_names(self, db: Session, *, names: List[str]) -> Dict[str, int]:
+        """
+        批量查询名称已被占用的Demo（不含已删除记录）
+        
+        Args:
+            db: 数据库会话
+            names: Demo名称列表
+            
+        Returns:
+            Dict[str, int]: {名称: Demo ID}
+        """
+        if not names:
+            return {}
+        return dict(db.execute(self._ids_by_names_statement(list(names))).all())
     
     def search_by_name(
         self, 
@@ -111,21 +480,87 @@ class CRUDDemo(CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
         limit: int = 100
     ) -> List[Demo]:
         """
-        通过名称模糊搜索Demo
+        通过关键词搜索Demo（匹配名称和描述）
         
         Args:
             db: 数据库会话
-            name_pattern: 名称搜索模式
+            name_pattern: 搜索关键词
             skip: 跳过记录数
             limit: 限制记录数
             
         Returns:
             List[Demo]: Demo列表
         """
-        return db.query(Demo).filter(
-            Demo.name.like(f"%{name_pattern}%"),
-            Demo.is_deleted == False
-        ).offset(skip).limit(limit).all()
+        return self.search(db, term=name_pattern, skip=skip, limit=limit)
+    
+    def search(
+        self, 
+        db: Session, 
+        *, 
+        term: str, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Demo]:
+        """
+        按关键词搜索Demo名称和描述，按相关度排序
+        
+        Args:
+            db: 数据库会话
+            term: 搜索关键词
+            skip: 跳过记录数
+            limit: 限制记录数
+            filters: 额外的过滤条件
+            
+        Returns:
+            List[Demo]: Demo列表
+        """
+        statement, rank = self._search_statement(
+            db.get_bind().dialect.name, term=term, filters=filters
+        )
+        return list(db.execute(self._ranked(statement, rank, skip=skip, limit=limit)).scalars())
+    
+    def search_page(
+        self, 
+        db: Session, 
+        *, 
+        term: str, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        options: LoaderOptions = None
+    ) -> Tuple[List[Demo], int]:
+        """
+        按关键词搜索Demo，在同一条语句中返回当前页和匹配总数
+        
+        Args:
+            db: 数据库会话
+            term: 搜索关键词
+            skip: 跳过记录数
+            limit: 限制记录数
+            filters: 额外的过滤条件
+            options: 关系加载选项
+            
+        Returns:
+            Tuple[List[Demo], int]: (当前页数据, 匹配总数)
+        """
+        statement, rank = self._search_statement(
+            db.get_bind().dialect.name, term=term, filters=filters
+        )
+        page = self._apply_options(
+            statement.add_columns(func.count().over().label("total")), options
+        )
+        page = self._ranked(page, rank, skip=skip, limit=limit)
+        
+        rows = db.execute(page).all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        
+        # 当前页为空时窗口函数没有可携带总数的行
+        if skip:
+            total = db.execute(select(func.count()).select_from(statement.subquery())).scalar_one()
+            return [], total
+        return [], 0
     
     def count_by_status(self, db: Session, *, status: str) -> int:
         """
@@ -148,7 +583,8 @@ class CRUDDemo(CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
         db: Session, 
         *, 
         demo_id: int, 
-        new_status: str
+        new_status: str,
+        owner_id: Optional[int] = None
     ) -> Optional[Demo]:
         """
         更新Demo状态
@@ -157,24 +593,22 @@ class CRUDDemo(CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
             db: 数据库会话
             demo_id: Demo ID
             new_status: 新状态
+            owner_id: 所有者ID，指定时只更新该用户拥有且未删除的Demo
             
         Returns:
-            Optional[Demo]: 更新后的Demo实例
+            Optional[Demo]: 更新后的Demo实例，未命中时为None
         """
-        demo = self.get(db, id=demo_id)
-        if demo:
-            demo.status = new_status
-            db.add(demo)
-            db.commit()
-            db.refresh(demo)
-        return demo
+        return self._update_field(
+            db, demo_id=demo_id, owner_id=owner_id, status=new_status
+        )
     
     def set_featured(
         self, 
         db: Session, 
         *, 
         demo_id: int, 
-        is_featured: bool = True
+        is_featured: bool = True,
+        owner_id: Optional[int] = None
     ) -> Optional[Demo]:
         """
         设置Demo为推荐/取消推荐
@@ -183,24 +617,22 @@ class CRUDDemo(CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
             db: 数据库会话
             demo_id: Demo ID
             is_featured: 是否推荐
+            owner_id: 所有者ID，指定时只更新该用户拥有且未删除的Demo
             
         Returns:
-            Optional[Demo]: 更新后的Demo实例
+            Optional[Demo]: 更新后的Demo实例，未命中时为None
         """
-        demo = self.get(db, id=demo_id)
-        if demo:
-            demo.is_featured = is_featured
-            db.add(demo)
-            db.commit()
-            db.refresh(demo)
-        return demo
+        return self._update_field(
+            db, demo_id=demo_id, owner_id=owner_id, is_featured=is_featured
+        )
     
     def update_priority(
         self, 
         db: Session, 
         *, 
         demo_id: int, 
-        priority: int
+        priority: int,
+        owner_id: Optional[int] = None
     ) -> Optional[Demo]:
         """
         更新Demo优先级
@@ -209,17 +641,14 @@ class CRUDDemo(CRUDBaseWithSoftDelete[Demo, DemoCreate, DemoUpdate]):
             db: 数据库会话
             demo_id: Demo ID
             priority: 优先级
+            owner_id: 所有者ID，指定时只更新该用户拥有且未删除的Demo
             
         Returns:
-            Optional[Demo]: 更新后的Demo实例
+            Optional[Demo]: 更新后的Demo实例，未命中时为None
         """
-        demo = self.get(db, id=demo_id)
-        if demo:
-            demo.priority = priority
-            db.add(demo)
-            db.commit()
-            db.refresh(demo)
-        return demo
+        return self._update_field(
+            db, demo_id=demo_id, owner_id=owner_id, priority=priority
+        )
 
 
 demo = CRUDDemo(Demo)
@@ -2,13 +2,14 @@
 用户相关CRUD操作
 """
 
+from datetime import datetime
 from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.hashing import password_hasher
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
@@ -44,7 +45,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     
     def create(self, db: Session, *, obj_in: UserCreate) -> User:
         """
-        创建用户
+        创建用户（密码哈希在哈希进程池中计算）
         
         Args:
             db: 数据库会话
@@ -58,21 +59,20 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             username=obj_in.username,
             full_name=obj_in.full_name,
             phone=obj_in.phone,
-            hashed_password=get_password_hash(obj_in.password),
+            hashed_password=password_hasher.hash(obj_in.password),
             is_active=True,
             is_superuser=False,
             is_verified=False,
         )
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._commit_without_expire(db)
         return db_obj
     
     def update_password(
         self, db: Session, *, db_obj: User, new_password: str
     ) -> User:
         """
-        更新用户密码
+        更新用户密码（密码哈希在哈希进程池中计算）
         
         Args:
             db: 数据库会话
@@ -82,10 +82,9 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User: 更新后的用户实例
         """
-        db_obj.hashed_password = get_password_hash(new_password)
+        db_obj.hashed_password = password_hasher.hash(new_password)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._commit_without_expire(db)
         return db_obj
     
     def authenticate(
@@ -105,7 +104,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         user = self.get_by_email(db, email=email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        if not password_hasher.verify(password, user.hashed_password):
             return None
         return user
     
@@ -133,6 +132,22 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         """
         return user.is_superuser
     
+    def record_login(self, db: Session, *, user_id: int) -> Optional[User]:
+        """
+        记录一次登录（登录次数原子加一并更新最后登录时间）
+        
+        Args:
+            db: 数据库会话
+            user_id: 用户ID
+            
+        Returns:
+            Optional[User]: 更新后的用户实例
+        """
+        values = {"last_login_at": datetime.utcnow(), "login_count": User.login_count + 1}
+        user = db.scalars(self._update_by_id_statement(user_id, values)).first()
+        self._commit_without_expire(db)
+        return user
+    
     def deactivate(self, db: Session, *, user_id: int) -> User:
         """
         停用用户
@@ -144,12 +159,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User: 更新后的用户实例
         """
-        user = self.get(db, id=user_id)
-        if user:
-            user.is_active = False
-            db.add(user)
-            db.commit()
-            db.refresh(user)
+        user = db.scalars(self._update_by_id_statement(user_id, {"is_active": False})).first()
+        self._commit_without_expire(db)
         return user
     
     def activate(self, db: Session, *, user_id: int) -> User:
@@ -163,12 +174,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User: 更新后的用户实例
         """
-        user = self.get(db, id=user_id)
-        if user:
-            user.is_active = True
-            db.add(user)
-            db.commit()
-            db.refresh(user)
+        user = db.scalars(self._update_by_id_statement(user_id, {"is_active": True})).first()
+        self._commit_without_expire(db)
         return user
 
 
@@ -0,0 +1,137 @@
+"""
+Demo搜索后端
+按数据库类型把关键词搜索转换为可走索引的查询条件和相关度表达式
+"""
+
+from typing import Dict, Tuple
+
+from sqlalchemy import case, func, literal_column, or_, select, text
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import settings
+from app.db.search import DEMO_FTS_TABLE, TS_CONFIG, demo_search_vector
+from app.models.demo import Demo
+
+
+def like_pattern(term: str) -> str:
+    """
+    构建包含匹配的 LIKE 模式（转义通配符）
+
+    Args:
+        term: 搜索关键词
+
+    Returns:
+        str: LIKE 模式，转义符为反斜杠
+    """
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class SearchBackend:
+    """
+    搜索后端基类
+    apply 返回附加了匹配条件的语句和相关度表达式（值越大越相关）
+    """
+
+    def apply(self, statement: Select, term: str) -> Tuple[Select, ColumnElement]:
+        """
+        为查询语句附加关键词匹配条件
+
+        Args:
+            statement: 以 Demo 为主表的查询语句
+            term: 搜索关键词
+
+        Returns:
+            Tuple[Select, ColumnElement]: (附加条件后的语句, 相关度表达式)
+        """
+        raise NotImplementedError
+
+
+class LikeSearchBackend(SearchBackend):
+    """
+    LIKE 包含匹配（无全文索引时的通用实现）
+    名称命中排在仅描述命中之前
+    """
+
+    def apply(self, statement: Select, term: str) -> Tuple[Select, ColumnElement]:
+        pattern = like_pattern(term)
+        name_match = Demo.name.ilike(pattern, escape="\\")
+        statement = statement.where(
+            or_(name_match, Demo.description.ilike(pattern, escape="\\"))
+        )
+        return statement, case((name_match, 1), else_=0)
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    PostgreSQL：ILIKE 由 pg_trgm GIN 索引支持，分词匹配由 tsvector GIN 索引支持
+    相关度取名称三元组相似度与 ts_rank 的较大值
+    """
+
+    def apply(self, statement: Select, term: str) -> Tuple[Select, ColumnElement]:
+        pattern = like_pattern(term)
+        vector = demo_search_vector(Demo.name, Demo.description)
+        query = func.plainto_tsquery(TS_CONFIG, term)
+        statement = statement.where(
+            or_(
+                Demo.name.ilike(pattern, escape="\\"),
+                Demo.description.ilike(pattern, escape="\\"),
+                vector.op("@@")(query),
+            )
+        )
+        rank = func.greatest(func.similarity(Demo.name, term), func.ts_rank(vector, query))
+        return statement, rank
+
+
+class SQLiteFTSSearchBackend(SearchBackend):
+    """
+    SQLite：FTS5 trigram 分词的外部内容表，按 bm25 排序
+    trigram 分词要求关键词至少3个字符，更短的关键词退回 LIKE
+    """
+
+    MIN_TERM_LENGTH = 3
+
+    def __init__(self):
+        self.fallback = LikeSearchBackend()
+
+    def apply(self, statement: Select, term: str) -> Tuple[Select, ColumnElement]:
+        if len(term) < self.MIN_TERM_LENGTH:
+            return self.fallback.apply(statement, term)
+
+        # 整体作为短语匹配，双引号转义后不会被解析为FTS查询语法
+        phrase = '"' + term.replace('"', '""') + '"'
+        matches = (
+            select(
+                literal_column("rowid").label("demo_id"),
+                literal_column(f"bm25({DEMO_FTS_TABLE})").label("score"),
+            )
+            .select_from(text(DEMO_FTS_TABLE))
+            .where(text(f"{DEMO_FTS_TABLE} MATCH :fts_phrase").bindparams(fts_phrase=phrase))
+            .subquery("fts")
+        )
+        statement = statement.join(matches, matches.c.demo_id == Demo.id)
+        # bm25 越小越相关
+        return statement, -matches.c.score
+
+
+_backends: Dict[str, SearchBackend] = {
+    "postgresql": PostgresSearchBackend(),
+    "sqlite": SQLiteFTSSearchBackend(),
+}
+_like_backend = LikeSearchBackend()
+
+
+def get_search_backend(dialect_name: str) -> SearchBackend:
+    """
+    根据数据库类型获取搜索后端
+
+    Args:
+        dialect_name: SQLAlchemy 方言名
+
+    Returns:
+        SearchBackend: 搜索后端，SEARCH_BACKEND=like 或数据库不支持时为 LIKE 实现
+    """
+    if settings.SEARCH_BACKEND == "like":
+        return _like_backend
+    return _backends.get(dialect_name, _like_backend)
@@ -31,6 +31,9 @@ class TimestampMixin:
     时间戳混入类
     为模型添加创建时间和更新时间字段
     """
+    # 写入时通过 RETURNING 取回数据库生成的值，提交后无需再 refresh
+    __mapper_args__ = {"eager_defaults": True}
+    
     created_at = Column(
         DateTime, 
         default=datetime.utcnow, 
@@ -0,0 +1,131 @@
+"""
+SQL查询统计
+通过引擎的 cursor execute 事件统计每个请求的查询数和数据库耗时，
+记录慢查询，并把同一请求内重复执行的相同语句标记为疑似 N+1 查询
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_PARAMETER = re.compile(r"%\(\w+\)s|(?<!:):\w+|\$\d+|%s|\?")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """
+    生成语句指纹：去掉字面量和参数差异，只保留语句结构
+
+    例如 "SELECT ... WHERE id IN (?, ?, ?)" 与 "... IN (?, ?)" 得到相同指纹
+
+    Args:
+        statement: SQL语句
+
+    Returns:
+        str: 规范化后的语句
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?+)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class RequestQueryStats:
+    """
+    单个请求的查询统计
+    """
+
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        """记录一条已执行的语句"""
+        self.count += 1
+        self.duration += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        获取执行次数达到阈值的语句（疑似 N+1 查询）
+
+        Args:
+            threshold: 次数阈值
+
+        Returns:
+            List[Tuple[str, int]]: (语句指纹, 次数) 列表，按次数降序
+        """
+        counts: Counter = Counter()
+        for statement, count in self.statements.items():
+            counts[fingerprint(statement)] += count
+        return [(text, count) for text, count in counts.most_common() if count >= threshold]
+
+
+_current: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def start_request() -> RequestQueryStats:
+    """
+    为当前请求开启查询统计
+
+    同步路由在线程池中执行时会复制上下文，统计对象本身被共享，累加结果对请求可见
+
+    Returns:
+        RequestQueryStats: 当前请求的统计对象
+    """
+    stats = RequestQueryStats()
+    _current.set(stats)
+    return stats
+
+
+def current_stats() -> Optional[RequestQueryStats]:
+    """获取当前请求的查询统计，不在请求上下文中时为None"""
+    return _current.get()
+
+
+def instrument_queries(engine: Engine) -> None:
+    """
+    为引擎注册查询计时事件
+
+    Args:
+        engine: 同步引擎（异步引擎传入 async_engine.sync_engine）
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        if elapsed * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+            logger.warning("慢查询 %.1fms: %s", elapsed * 1000, fingerprint(statement))
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        # 执行失败时 after_cursor_execute 不会触发，丢弃对应的开始时间
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start_time"):
+            connection.info["query_start_time"].pop()
@@ -0,0 +1,233 @@
+"""
+只读副本路由
+会话中的查询按轮询分配到健康的只读副本，写入和写入后的读取使用主库；
+后台任务定期检查副本的连通性和复制延迟，延迟过大的副本暂停使用
+"""
+
+import asyncio
+import itertools
+import logging
+from contextvars import ContextVar
+from typing import Any, List, Optional, Sequence, Union
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.sqlite import WriteRoutingSession
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL 副本的复制延迟（秒）：已接收的 WAL 全部重放完成时视为无延迟，
+# 避免主库空闲时 pg_last_xact_replay_timestamp() 持续变旧造成误判
+PG_REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+PING_SQL = text("SELECT 0")
+
+
+class ReadPreference:
+    """
+    单个请求的读取偏好
+    primary 为True时本请求的读取全部使用主库；请求内提交过写入时 wrote 置为True
+    """
+
+    __slots__ = ("primary", "wrote")
+
+    def __init__(self, primary: bool = False):
+        self.primary = primary
+        self.wrote = False
+
+
+_current: ContextVar[Optional[ReadPreference]] = ContextVar("read_preference", default=None)
+
+
+def start_request(primary: bool = False) -> ReadPreference:
+    """
+    为当前请求设置读取偏好
+
+    Args:
+        primary: 是否从主库读取（写请求或处于写后固定窗口内）
+
+    Returns:
+        ReadPreference: 当前请求的读取偏好
+    """
+    preference = ReadPreference(primary)
+    _current.set(preference)
+    return preference
+
+
+def current_preference() -> Optional[ReadPreference]:
+    """获取当前请求的读取偏好，不在请求上下文中时为None"""
+    return _current.get()
+
+
+class Replica:
+    """只读副本及其健康状态"""
+
+    __slots__ = ("name", "engine", "healthy", "lag")
+
+    def __init__(self, name: str, engine: Union[Engine, AsyncEngine]):
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        self.lag: Optional[float] = None
+
+    @property
+    def bind(self) -> Engine:
+        """会话绑定使用的同步引擎"""
+        return getattr(self.engine, "sync_engine", self.engine)
+
+
+class ReplicaSet:
+    """
+    只读副本集合
+    choose() 在健康副本间轮询；全部不可用时返回None，由调用方回退到主库
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Union[Engine, AsyncEngine]],
+        max_lag: float = settings.REPLICA_MAX_LAG_SECONDS,
+        check_interval: float = settings.REPLICA_HEALTH_CHECK_INTERVAL
+    ):
+        self.replicas: List[Replica] = [
+            Replica(engine.url.render_as_string(hide_password=True), engine)
+            for engine in engines
+        ]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._counter = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Optional[Engine]:
+        """
+        选择一个健康的副本
+
+        Returns:
+            Optional[Engine]: 副本的同步引擎，没有可用副本时为None
+        """
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)].bind
+
+    async def check(self) -> None:
+        """检查全部副本的连通性和复制延迟，更新健康状态"""
+        for replica in self.replicas:
+            try:
+                if isinstance(replica.engine, AsyncEngine):
+                    async with replica.engine.connect() as conn:
+                        lag = await conn.run_sync(measure_lag)
+                else:
+                    lag = await run_in_threadpool(self._probe, replica.engine)
+            except Exception as exc:
+                self._update(replica, None, exc)
+            else:
+                self._update(replica, lag)
+
+    def start(self) -> None:
+        """启动定期健康检查任务（需在事件循环中调用）"""
+        if self.replicas and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """停止健康检查任务并关闭副本连接池"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for replica in self.replicas:
+            if isinstance(replica.engine, AsyncEngine):
+                await replica.engine.dispose()
+            else:
+                replica.engine.dispose()
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.check_interval)
+
+    @staticmethod
+    def _probe(engine: Engine) -> float:
+        with engine.connect() as conn:
+            return measure_lag(conn)
+
+    def _update(
+        self, replica: Replica, lag: Optional[float], error: Optional[Exception] = None
+    ) -> None:
+        healthy = lag is not None and lag <= self.max_lag
+        if healthy != replica.healthy:
+            if healthy:
+                logger.info("只读副本恢复使用: %s (延迟 %.2fs)", replica.name, lag)
+            elif error is not None:
+                logger.warning("只读副本无法连接，暂停使用: %s (%s)", replica.name, error)
+            else:
+                logger.warning("只读副本延迟 %.2fs 超过阈值，暂停使用: %s", lag, replica.name)
+        replica.healthy = healthy
+        replica.lag = lag
+
+
+def measure_lag(conn: Connection) -> float:
+    """
+    读取副本的复制延迟（秒），非 PostgreSQL 数据库只检查连通性
+
+    Args:
+        conn: 副本连接
+    """
+    if conn.dialect.name == "postgresql":
+        return float(conn.execute(PG_REPLICA_LAG_SQL).scalar() or 0)
+    conn.execute(PING_SQL)
+    return 0.0
+
+
+class ReplicaRoutingSession(WriteRoutingSession):
+    """
+    读写分离会话（主库 + 只读副本）
+
+    会话创建时为读取选择一个健康副本；当前请求要求读主库（写请求、处于写后
+    固定窗口内）或没有可用副本时读取主库。写入路由规则同 WriteRoutingSession，
+    提交过写入后本会话余下的读取也改用主库，并通知请求设置固定窗口
+    """
+
+    def __init__(self, *args: Any, replicas: ReplicaSet, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.primary_reader = self.reader
+        preference = current_preference()
+        if preference is None or not preference.primary:
+            self.reader = replicas.choose() or self.primary_reader
+
+
+@event.listens_for(ReplicaRoutingSession, "do_orm_execute")
+def _track_statement_writes(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(ReplicaRoutingSession, "after_flush")
+def _track_flush_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(ReplicaRoutingSession, "after_commit")
+def _stick_to_primary(session):
+    """提交了写入：本会话和该客户端随后的读取改用主库"""
+    if session.info.pop("has_writes", False):
+        session.reader = session.primary_reader
+        preference = current_preference()
+        if preference is not None:
+            preference.wrote = True
+
+
+@event.listens_for(ReplicaRoutingSession, "after_rollback")
+def _discard_writes(session):
+    session.info.pop("has_writes", None)
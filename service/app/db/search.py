@@ -0,0 +1,101 @@
+"""
+全文搜索数据库结构
+定义Demo名称/描述搜索所需的索引和虚拟表：
+PostgreSQL 使用 pg_trgm + tsvector 的 GIN 索引，SQLite 使用 FTS5（trigram 分词）
+"""
+
+from sqlalchemy import DDL, Table, event, func, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+# 全文检索配置；以字面量写入SQL，保证查询表达式与表达式索引一致
+TS_CONFIG = literal_column("'simple'::regconfig")
+
+# SQLite FTS5 虚拟表名
+DEMO_FTS_TABLE = "demos_fts"
+
+# 不由模型元数据管理的搜索对象（迁移自动生成时忽略）
+SEARCH_OBJECT_NAMES = {
+    "ix_demos_name_trgm",
+    "ix_demos_description_trgm",
+    "ix_demos_search_vector",
+}
+SEARCH_OBJECT_PREFIXES = (DEMO_FTS_TABLE,)
+
+
+def demo_search_vector(name: ColumnElement, description: ColumnElement) -> ColumnElement:
+    """
+    构建名称+描述的 tsvector 表达式（与 ix_demos_search_vector 表达式索引一致）
+
+    Args:
+        name: 名称列
+        description: 描述列
+
+    Returns:
+        ColumnElement: tsvector 表达式
+    """
+    document = (
+        func.coalesce(name, literal_column("''"))
+        .op("||")(literal_column("' '"))
+        .op("||")(func.coalesce(description, literal_column("''")))
+    )
+    return func.to_tsvector(TS_CONFIG, document)
+
+
+def is_search_object(name: str) -> bool:
+    """
+    判断数据库对象是否为搜索结构（供 Alembic include_object 使用）
+
+    Args:
+        name: 表或索引名
+
+    Returns:
+        bool: 是否为搜索对象
+    """
+    return name in SEARCH_OBJECT_NAMES or name.startswith(SEARCH_OBJECT_PREFIXES)
+
+
+POSTGRESQL_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_demos_name_trgm ON demos USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_demos_description_trgm "
+    "ON demos USING gin (description gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_demos_search_vector ON demos USING gin "
+    "(to_tsvector('simple'::regconfig, "
+    "coalesce(name, '') || ' ' || coalesce(description, '')))",
+]
+
+SQLITE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {DEMO_FTS_TABLE} USING fts5("
+    "name, description, content='demos', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {DEMO_FTS_TABLE}_ai AFTER INSERT ON demos BEGIN "
+    f"INSERT INTO {DEMO_FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {DEMO_FTS_TABLE}_ad AFTER DELETE ON demos BEGIN "
+    f"INSERT INTO {DEMO_FTS_TABLE}({DEMO_FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {DEMO_FTS_TABLE}_au AFTER UPDATE OF name, description "
+    "ON demos BEGIN "
+    f"INSERT INTO {DEMO_FTS_TABLE}({DEMO_FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    f"INSERT INTO {DEMO_FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+]
+
+
+def register_search_ddl(table: Table) -> None:
+    """
+    在 create_all/drop_all 时同步创建/删除搜索结构（测试和开发环境）
+    生产环境由 Alembic 迁移创建
+
+    Args:
+        table: demos 表
+    """
+    for statement in POSTGRESQL_SEARCH_DDL:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+    for statement in SQLITE_SEARCH_DDL:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {DEMO_FTS_TABLE}").execute_if(dialect="sqlite")
+    )
@@ -1,20 +1,48 @@
 """
 数据库会话管理模块
 配置数据库引擎和会话工厂
+
+文件型 SQLite 默认使用嵌入式模式（见 app.db.sqlite）：engine 为 WAL 读连接池，
+writer_engine 为单个写连接，会话按语句类型自动路由；其他数据库两者为同一引擎。
+配置 DATABASE_REPLICA_URLS 时会话的读取再分配到只读副本（见 app.db.replicas）
 """
 
+from typing import AsyncGenerator, List, Optional, Tuple, Type
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
+from app.core.metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool, instrument_engine
+from app.db.query_stats import instrument_queries
+from app.db.replicas import ReplicaRoutingSession, ReplicaSet
+from app.db.sqlite import (
+    WriteRoutingSession,
+    configure_connection,
+    embedded_mode_enabled,
+    reader_engine_kwargs,
+    writer_engine_kwargs,
+)
 
 
 # 根据数据库URL判断数据库类型并设置相应参数
-def get_engine_kwargs():
-    """获取数据库引擎参数"""
-    if settings.DATABASE_URL.startswith("sqlite"):
-        # SQLite 配置
+def get_engine_kwargs(poolclass=None, url: Optional[str] = None):
+    """
+    获取数据库引擎参数
+    
+    Args:
+        poolclass: 非SQLite数据库使用的连接池类（启用指标时为带计时的连接池）
+        url: 数据库连接字符串，默认为 DATABASE_URL
+    """
+    if (url or settings.DATABASE_URL).startswith("sqlite"):
+        # SQLite 单连接配置（内存数据库或关闭 SQLITE_EMBEDDED_MODE 时）
         return {
             "poolclass": StaticPool,
             "connect_args": {
@@ -24,34 +52,151 @@ def get_engine_kwargs():
         }
     else:
         # PostgreSQL 配置
-        return {
+        kwargs = {
             "pool_size": settings.DATABASE_POOL_SIZE,
             "max_overflow": settings.DATABASE_MAX_OVERFLOW,
             "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
             "pool_recycle": settings.DATABASE_POOL_RECYCLE,
             "echo": settings.DEBUG,
         }
+        if poolclass is not None:
+            kwargs["poolclass"] = poolclass
+        return kwargs
+
+
+def create_engines(url: str, create, label: str, poolclass=None):
+    """
+    创建读、写引擎并注册统计事件
+    
+    Args:
+        url: 数据库连接字符串
+        create: create_engine 或 create_async_engine
+        label: 指标中的 engine 标签，写引擎追加 _writer 后缀
+        poolclass: 启用指标时使用的带计时连接池类
+        
+    Returns:
+        tuple: (读引擎, 写引擎)，非嵌入式模式下两者相同
+    """
+    if not embedded_mode_enabled(url):
+        reader = writer = create(url, **get_engine_kwargs(poolclass))
+        engines = [(reader, label)]
+    else:
+        reader = create(url, **reader_engine_kwargs(poolclass))
+        writer = create(url, **writer_engine_kwargs(poolclass))
+        configure_connection(_sync_engine(reader))
+        configure_connection(_sync_engine(writer), writer=True)
+        engines = [(reader, label), (writer, f"{label}_writer")]
+    
+    for created, engine_label in engines:
+        instrument_queries(_sync_engine(created))
+        if settings.METRICS_ENABLED:
+            instrument_engine(_sync_engine(created), engine_label)
+    return reader, writer
 
 
-# 创建数据库引擎
-engine = create_engine(
+def _sync_engine(created):
+    """异步引擎取其底层同步引擎用于注册事件"""
+    return getattr(created, "sync_engine", created)
+
+
+def create_replicas(urls: List[str], create, label: str, poolclass=None) -> ReplicaSet:
+    """
+    创建只读副本引擎
+    
+    Args:
+        urls: 副本连接字符串列表
+        create: create_engine 或 create_async_engine
+        label: 指标中的 engine 标签前缀
+        poolclass: 启用指标时使用的带计时连接池类
+    """
+    engines = []
+    for index, url in enumerate(urls):
+        replica = create(url, **get_engine_kwargs(poolclass, url))
+        instrument_queries(_sync_engine(replica))
+        if settings.METRICS_ENABLED:
+            instrument_engine(_sync_engine(replica), f"{label}_replica{index}")
+        engines.append(replica)
+    return ReplicaSet(engines)
+
+
+def session_options(reader, writer, replicas: ReplicaSet) -> Tuple[Type[Session], dict]:
+    """
+    会话类及其绑定参数
+    
+    Returns:
+        Tuple[Type[Session], dict]: 配置了副本时按主库/副本路由，
+            嵌入式模式下按读写连接路由，否则绑定单个引擎
+    """
+    if not replicas and reader is writer:
+        return Session, {"bind": reader}
+    kwargs = {"reader": _sync_engine(reader), "writer": _sync_engine(writer)}
+    if not replicas:
+        return WriteRoutingSession, kwargs
+    return ReplicaRoutingSession, {**kwargs, "replicas": replicas}
+
+
+# 创建数据库引擎（writer_engine 用于不经过会话的直接写入）
+engine, writer_engine = create_engines(
     settings.DATABASE_URL,
-    **get_engine_kwargs()
+    create_engine,
+    "sync",
+    TimedQueuePool if settings.METRICS_ENABLED else None
+)
+replicas = create_replicas(
+    settings.get_replica_urls(),
+    create_engine,
+    "sync",
+    TimedQueuePool if settings.METRICS_ENABLED else None
 )
 
 # 创建会话工厂
+session_class, session_binds = session_options(engine, writer_engine, replicas)
 SessionLocal = sessionmaker(
+    class_=session_class,
     autocommit=False,
     autoflush=False,
-    bind=engine
+    **session_binds
 )
 
 
+# 异步引擎和会话工厂（仅在启用 USE_ASYNC_DB 时创建，避免未安装异步驱动时导入失败）
+async_engine: Optional[AsyncEngine] = None
+async_writer_engine: Optional[AsyncEngine] = None
+async_replicas = ReplicaSet([])
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+if settings.USE_ASYNC_DB:
+    async_engine, async_writer_engine = create_engines(
+        settings.get_async_database_url(),
+        create_async_engine,
+        "async",
+        TimedAsyncAdaptedQueuePool if settings.METRICS_ENABLED else None
+    )
+    async_replicas = create_replicas(
+        settings.get_replica_urls(use_async=True),
+        create_async_engine,
+        "async",
+        TimedAsyncAdaptedQueuePool if settings.METRICS_ENABLED else None
+    )
+    async_session_class, async_session_binds = session_options(
+        async_engine, async_writer_engine, async_replicas
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        sync_session_class=async_session_class,
+        autoflush=False,
+        expire_on_commit=False,
+        **async_session_binds
+    )
+
+
 def get_db():
     """
     数据库会话依赖注入函数
     用于FastAPI路由中获取数据库会话
     
+    会话在第一次查询时才借出连接（命中用户缓存的请求可能完全不占用连接）；
+    只读接口在服务调用返回后调用 release_connection 提前归还连接
+    
     Yields:
         Session: 数据库会话对象
     """
@@ -62,6 +207,61 @@ def get_db():
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    异步数据库会话依赖注入函数
+    用于异步路由中获取数据库会话
+    
+    Yields:
+        AsyncSession: 异步数据库会话对象
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("未启用异步数据库，请设置 USE_ASYNC_DB=true")
+    
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def release_connection(db: Session) -> None:
+    """
+    结束只读事务并立即把连接归还连接池
+    
+    会话在第一次查询时才借出连接，但只读事务要到请求结束关闭会话时才释放，
+    连接占用会覆盖响应的序列化和发送。服务调用返回后调用本函数，连接只在
+    执行查询期间被占用；已加载的实例保持可用（不会过期），之后如再次查询
+    会重新借出连接。会话中有未提交的修改时不做处理，由调用方提交或回滚
+    
+    Args:
+        db: 数据库会话
+    """
+    if not db.in_transaction() or db.new or db.dirty or db.deleted:
+        return
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+
+
+async def release_async_connection(db: AsyncSession) -> None:
+    """
+    结束只读事务并立即把连接归还连接池（异步版本，说明见 release_connection）
+    
+    Args:
+        db: 异步数据库会话
+    """
+    if not db.in_transaction() or db.new or db.dirty or db.deleted:
+        return
+    sync_session = db.sync_session
+    expire_on_commit = sync_session.expire_on_commit
+    sync_session.expire_on_commit = False
+    try:
+        await db.commit()
+    finally:
+        sync_session.expire_on_commit = expire_on_commit
+
+
 # 测试数据库配置
 def get_test_engine():
     """获取测试数据库引擎"""
@@ -0,0 +1,132 @@
+"""
+SQLite 嵌入式部署模式
+文件型 SQLite 使用 WAL 日志：读连接池中的连接并发读取，
+所有写入经由单个写连接串行执行，避免 "database is locked"
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Delete, Insert, Select, Update
+
+from app.core.config import settings
+
+
+def is_file_sqlite(url: str) -> bool:
+    """
+    是否为文件型 SQLite 数据库（内存数据库只能使用单连接）
+
+    Args:
+        url: 数据库连接字符串
+
+    Returns:
+        bool: 文件型 SQLite 时为True
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return False
+    database = parsed.database or ""
+    return bool(database) and database != ":memory:" and not database.startswith("file::memory:")
+
+
+def embedded_mode_enabled(url: str) -> bool:
+    """是否对该数据库启用嵌入式模式"""
+    return settings.SQLITE_EMBEDDED_MODE and is_file_sqlite(url)
+
+
+def reader_engine_kwargs(poolclass=None) -> dict:
+    """
+    读连接池参数
+
+    Args:
+        poolclass: 连接池类（启用指标时为带计时的连接池）
+    """
+    kwargs = {
+        "pool_size": settings.SQLITE_READER_POOL_SIZE,
+        "max_overflow": 0,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "connect_args": {"check_same_thread": False},
+        "echo": settings.DEBUG,
+    }
+    if poolclass is not None:
+        kwargs["poolclass"] = poolclass
+    return kwargs
+
+
+def writer_engine_kwargs(poolclass=None) -> dict:
+    """
+    写连接参数：连接池只有一个连接且不允许溢出，
+    并发写请求在连接池上排队（等待超过 DATABASE_POOL_TIMEOUT 时报错）
+
+    Args:
+        poolclass: 连接池类（启用指标时为带计时的连接池）
+    """
+    kwargs = reader_engine_kwargs(poolclass)
+    kwargs["pool_size"] = 1
+    return kwargs
+
+
+def configure_connection(engine: Engine, *, writer: bool = False) -> None:
+    """
+    注册连接事件：新建连接时设置 WAL 相关 PRAGMA；
+    写连接改为由 SQLAlchemy 显式发出 BEGIN IMMEDIATE，事务开始即获取写锁，
+    避免读事务升级为写事务时因锁冲突直接失败（busy_timeout 对此无效）
+
+    Args:
+        engine: 同步引擎（异步引擎传入 async_engine.sync_engine）
+        writer: 是否为写连接
+    """
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        if writer:
+            # 关闭驱动自带的事务管理，由 begin 事件发出 BEGIN IMMEDIATE
+            dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+            cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        finally:
+            cursor.close()
+
+    if writer:
+        @event.listens_for(engine, "begin")
+        def begin_immediate(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+class WriteRoutingSession(Session):
+    """
+    读写分离会话
+
+    查询使用读连接池；flush、INSERT/UPDATE/DELETE 和 SELECT ... FOR UPDATE 使用写连接，
+    并且当前事务一旦写入，后续查询也使用写连接，保证读到本事务的修改。
+    提交或回滚后重新回到读连接池，写连接尽早归还给排队的写请求
+    """
+
+    def __init__(self, *args: Any, reader: Engine, writer: Engine, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.reader = reader
+        self.writer = writer
+        self._write_transaction: Optional[Any] = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._write_transaction is not None and self._write_transaction is self.get_transaction():
+            return self.writer
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            return self.writer
+        # 加锁读取是写事务的一部分：在写连接上开始事务，读到的值到提交为止不会被其他写入改变
+        if isinstance(clause, Select) and clause._for_update_arg is not None:
+            return self.writer
+        return self.reader
+
+
+@event.listens_for(WriteRoutingSession, "after_begin")
+def _track_write_transaction(session, transaction, connection):
+    """写连接加入事务时记录该事务，事务结束前的查询都路由到写连接"""
+    if connection.engine is session.writer:
+        session._write_transaction = session.get_transaction()
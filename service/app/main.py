@@ -6,14 +6,21 @@ FastAPI主应用入口文件
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 import time
 import logging
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.core.response import error_response, APIException
+from app.core.instrumentation import InstrumentationMiddleware
+from app.core.metrics import render_metrics
+from app.core.read_your_writes import ReadYourWritesMiddleware
+from app.core.response import error_response, APIException, FastJSONResponse
 from app.api.v1.api import api_router
+from app.core.hashing import password_hasher
+from app.db.session import async_engine, async_replicas, replicas
+from app.services.login_stats import login_stats
 
 # 配置日志
 logging.basicConfig(
@@ -36,12 +43,21 @@ async def lifespan(app: FastAPI):
     logger.info(f"📊 数据库: {settings.DATABASE_URL.split('://')[-1].split('@')[-1] if '@' in settings.DATABASE_URL else settings.DATABASE_URL}")
     
     # 这里可以添加数据库连接检查、缓存初始化等
+    password_hasher.start()
+    login_stats.start()
+    replicas.start()
+    async_replicas.start()
     
     yield
     
     # 关闭时的操作
     logger.info("📴 应用正在关闭...")
-    # 这里可以添加资源清理操作
+    password_hasher.shutdown()
+    await login_stats.stop()
+    await replicas.stop()
+    await async_replicas.stop()
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 # 创建FastAPI应用实例
@@ -51,6 +67,7 @@ app = FastAPI(
     description=settings.DESCRIPTION,
     debug=settings.DEBUG,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     openapi_url=f"/api/v1/openapi.json" if settings.DEBUG else None,
     docs_url=f"/docs" if settings.DEBUG else None,
     redoc_url=f"/redoc" if settings.DEBUG else None,
@@ -69,6 +86,23 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+# 响应压缩中间件（按 Accept-Encoding 协商 br / zstd / gzip）
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        cache_size=settings.COMPRESSION_CACHE_SIZE,
+        threadpool_size=settings.COMPRESSION_THREADPOOL_SIZE,
+    )
+
+# 写后读一致性中间件（配置只读副本时，写入后的读取在固定窗口内使用主库）
+if settings.get_replica_urls():
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        sticky_seconds=settings.REPLICA_STICKY_SECONDS,
+        cookie_name=settings.REPLICA_STICKY_COOKIE,
+    )
+
 # 可信主机中间件（生产环境推荐）
 if settings.is_production:
     app.add_middleware(
@@ -79,35 +113,13 @@ if settings.is_production:
 
 # === 请求处理中间件 ===
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """
-    添加请求处理时间头
-    """
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
-
-
-@app.middleware("http")
-async def logging_middleware(request: Request, call_next):
-    """
-    请求日志中间件
-    """
-    start_time = time.time()
-    
-    # 记录请求
-    logger.info(f"📥 {request.method} {request.url.path} - {request.client.host if request.client else 'unknown'}")
-    
-    response = await call_next(request)
-    
-    # 记录响应
-    process_time = time.time() - start_time
-    logger.info(f"📤 {request.method} {request.url.path} - {response.status_code} - {process_time:.4f}s")
-    
-    return response
+# 计时与访问日志中间件（最后添加，位于最外层，计时覆盖其余中间件）
+app.add_middleware(
+    InstrumentationMiddleware,
+    enable_metrics=settings.METRICS_ENABLED,
+    expose_db_headers=settings.DEBUG,
+    n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD,
+)
 
 
 # === 异常处理 ===
@@ -166,6 +178,17 @@ async def health_check():
     }
 
 
+# Prometheus 指标端点
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics_endpoint():
+        """
+        Prometheus 指标
+        """
+        content, content_type = render_metrics()
+        return Response(content=content, media_type=content_type)
+
+
 # 根路径
 @app.get("/", tags=["根路径"])
 async def root():
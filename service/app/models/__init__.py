@@ -6,10 +6,12 @@
 from app.db.base import Base
 from app.models.user import User
 from app.models.demo import Demo
+from app.models.demo_counter import DemoCounter
 
 # 导出所有模型
 __all__ = [
     "Base",
     "User", 
     "Demo",
+    "DemoCounter",
 ]
@@ -3,10 +3,11 @@
 演示业务模型的实现方式
 """
 
-from sqlalchemy import Column, String, Text, Boolean, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, Integer, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 
 from app.db.base import BaseModelWithSoftDelete
+from app.db.search import register_search_ddl
 
 
 class Demo(BaseModelWithSoftDelete):
@@ -15,6 +16,35 @@ class Demo(BaseModelWithSoftDelete):
     演示基础CRUD操作和业务逻辑实现
     """
     
+    # 查询均带 is_deleted = false 条件，因此索引只覆盖未删除的记录；
+    # 排序列后追加 id，与 CRUDBase 的稳定排序和游标分页条件一致
+    __table_args__ = (
+        # 所有者的Demo列表
+        Index(
+            "ix_demos_owner_id_live", "owner_id", "id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # 按状态筛选和统计
+        Index(
+            "ix_demos_status_live", "status", "id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # 推荐列表（按优先级降序）
+        Index(
+            "ix_demos_featured_priority", "priority", "id",
+            postgresql_where=text("is_featured = true AND is_deleted = false"),
+            sqlite_where=text("is_featured = 1 AND is_deleted = 0"),
+        ),
+        # 搜索结果（按优先级降序）
+        Index(
+            "ix_demos_priority_live", "priority", "id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+    )
+    
     name = Column(
         String(100), 
         nullable=False, 
@@ -75,3 +105,7 @@ class Demo(BaseModelWithSoftDelete):
     def deactivate(self):
         """停用"""
         self.status = "inactive"
+
+
+# 名称/描述全文搜索结构（FTS5 虚拟表或 GIN 索引）
+register_search_ddl(Demo.__table__)
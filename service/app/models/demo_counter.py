@@ -0,0 +1,33 @@
+"""
+Demo计数器模型
+物化的Demo统计计数，由CRUD写操作增量维护
+"""
+
+from sqlalchemy import BigInteger, Column, String
+
+from app.db.base import Base
+
+
+class DemoCounter(Base):
+    """
+    Demo计数器模型
+    每个统计项一行：total, active, inactive, pending, featured（均不含已删除记录）
+    """
+    
+    __tablename__ = "demo_counters"
+    
+    name = Column(
+        String(20), 
+        primary_key=True,
+        comment="统计项"
+    )
+    
+    value = Column(
+        BigInteger, 
+        default=0, 
+        nullable=False,
+        comment="计数值"
+    )
+    
+    def __repr__(self):
+        return f"<DemoCounter(name='{self.name}', value={self.value})>"
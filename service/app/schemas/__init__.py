@@ -5,6 +5,7 @@ Schemas 包初始化文件
 
 from app.schemas.user import (
     User,
+    UserListAdapter,
     UserCreate, 
     UserUpdate,
     UserBrief,
@@ -15,6 +16,7 @@ from app.schemas.user import (
 
 from app.schemas.demo import (
     Demo,
+    DemoListAdapter,
     DemoCreate,
     DemoUpdate,
     DemoDetail,
@@ -22,13 +24,20 @@ from app.schemas.demo import (
     DemoSearch,
     DemoStatusUpdate,
     DemoPriorityUpdate,
-    DemoFeaturedUpdate
+    DemoFeaturedUpdate,
+    DemoBatchCreate,
+    DemoBatchUpdate,
+    DemoBatchUpdateItem,
+    DemoBatchDelete
 )
 
+from app.schemas.batch import BatchFailure, BatchOperationResult
+
 # 导出所有模式
 __all__ = [
     # 用户相关
     "User",
+    "UserListAdapter",
     "UserCreate", 
     "UserUpdate",
     "UserBrief",
@@ -38,6 +47,7 @@ __all__ = [
     
     # Demo相关
     "Demo",
+    "DemoListAdapter",
     "DemoCreate",
     "DemoUpdate", 
     "DemoDetail",
@@ -46,4 +56,12 @@ __all__ = [
     "DemoStatusUpdate",
     "DemoPriorityUpdate",
     "DemoFeaturedUpdate",
+    "DemoBatchCreate",
+    "DemoBatchUpdate",
+    "DemoBatchUpdateItem",
+    "DemoBatchDelete",
+    
+    # 批量操作
+    "BatchFailure",
+    "BatchOperationResult",
 ]
@@ -0,0 +1,61 @@
+"""
+批量操作相关数据模式
+定义批量接口通用的结果结构
+"""
+
+from typing import Any, List, Union
+
+from pydantic import BaseModel, Field
+from pydantic.alias_generators import to_camel
+
+
+# === 批量操作失败项 ===
+
+class BatchFailure(BaseModel):
+    """批量操作中单条记录的失败信息"""
+    id: Union[int, str] = Field(..., description="记录ID（批量创建时为请求中的序号）")
+    error: str = Field(..., description="失败原因")
+
+
+# === 批量操作结果 ===
+
+class BatchOperationResult(BaseModel):
+    """
+    批量操作结果
+    字段以驼峰命名输出，与客户端的 BatchOperationResult 类型一致
+    """
+    success_count: int = Field(..., description="成功数量")
+    failure_count: int = Field(..., description="失败数量")
+    failures: List[BatchFailure] = Field(default_factory=list, description="失败明细")
+    items: List[Any] = Field(default_factory=list, description="成功处理的记录")
+
+    class Config:
+        alias_generator = to_camel
+        populate_by_name = True
+        json_schema_extra = {
+            "example": {
+                "successCount": 2,
+                "failureCount": 1,
+                "failures": [{"id": 3, "error": "只有Demo的所有者可以删除Demo"}],
+                "items": []
+            }
+        }
+
+    @classmethod
+    def build(cls, items: List[Any], failures: List[BatchFailure]) -> "BatchOperationResult":
+        """
+        根据成功记录和失败明细构建结果
+
+        Args:
+            items: 成功处理的记录
+            failures: 失败明细
+
+        Returns:
+            BatchOperationResult: 批量操作结果
+        """
+        return cls(
+            success_count=len(items),
+            failure_count=len(failures),
+            failures=failures,
+            items=items
+        )
@@ -3,11 +3,12 @@ Demo相关数据模式
 定义Demo的输入输出数据结构
 """
 
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from app.core.config import settings
 from app.schemas.user import UserBrief
 
 
@@ -63,6 +64,51 @@ class DemoUpdate(BaseModel):
         }
 
 
+# === Demo批量操作模式 ===
+
+class DemoBatchCreate(BaseModel):
+    """Demo批量创建模式"""
+    items: List[DemoCreate] = Field(
+        ..., min_length=1, max_length=settings.BATCH_MAX_ITEMS, description="要创建的Demo列表"
+    )
+
+
+class DemoBatchUpdateItem(DemoUpdate):
+    """Demo批量更新项"""
+    id: int = Field(..., description="Demo ID")
+
+
+class DemoBatchUpdate(BaseModel):
+    """Demo批量更新模式"""
+    items: List[DemoBatchUpdateItem] = Field(
+        ..., min_length=1, max_length=settings.BATCH_MAX_ITEMS, description="要更新的Demo列表"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {"id": 1, "status": "inactive"},
+                    {"id": 2, "priority": 5, "is_featured": True}
+                ]
+            }
+        }
+
+
+class DemoBatchDelete(BaseModel):
+    """Demo批量删除模式"""
+    ids: List[int] = Field(
+        ..., min_length=1, max_length=settings.BATCH_MAX_ITEMS, description="要删除的Demo ID列表"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "ids": [1, 2, 3]
+            }
+        }
+
+
 # === Demo状态更新模式 ===
 
 class DemoStatusUpdate(BaseModel):
@@ -133,6 +179,10 @@ class Demo(DemoBase):
         }
 
 
+# 列表批量转换：对整页行映射（CRUDBase.get_multi_rows）一次性校验，代替逐条 model_validate
+DemoListAdapter = TypeAdapter(List[Demo])
+
+
 # === Demo详细信息模式 ===
 
 class DemoDetail(Demo):
@@ -3,10 +3,10 @@
 定义用户的输入输出数据结构
 """
 
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
 
 
 # === 用户基础模式 ===
@@ -116,6 +116,10 @@ class User(UserBase):
         }
 
 
+# 列表批量转换：对整页行映射（CRUDBase.get_page_rows）一次性校验，代替逐条 model_validate
+UserListAdapter = TypeAdapter(List[User])
+
+
 # === 用户简要信息模式 ===
 
 class UserBrief(BaseModel):
@@ -5,9 +5,13 @@ Services 包初始化文件
 
 from app.services.user_service import user_service
 from app.services.demo_service import demo_service
+from app.services.async_user_service import async_user_service
+from app.services.async_demo_service import async_demo_service
 
 # 导出所有服务实例
 __all__ = [
     "user_service",
     "demo_service",
+    "async_user_service",
+    "async_demo_service",
 ]
@@ -0,0 +1,701 @@
+"""
+Demo异步业务逻辑服务
+基于 AsyncSession 实现与 DemoService 相同的业务规则
+"""
+
+import logging
+from typing import Any, Dict, List, NoReturn, Optional, Tuple, Union
+
+from sqlalchemy import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import async_demo as demo_crud, async_user as user_crud
+from app.schemas.batch import BatchFailure
+from app.schemas.demo import DemoBatchUpdateItem, DemoCreate, DemoUpdate, DemoSearch
+from app.models.demo import Demo
+from app.core.conditional import Validators, build_validators
+from app.core.config import settings
+from app.core.singleflight import JSON_CODEC, single_flight
+from app.services.demo_service import (
+    DemoService,
+    build_search_filters,
+    check_batch_create,
+    check_batch_delete,
+    check_batch_update,
+    check_demo_found,
+    check_demo_owner,
+    check_name_available,
+    check_user_found,
+    demo_not_found,
+    featured_page_data,
+    flight_params,
+    get_search_term,
+    invalidate_demo_cache_async,
+    owner_required,
+    validate_demo_status,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDemoService:
+    """Demo异步业务逻辑服务类"""
+
+    # 搜索列表排序（与同步版本保持一致，保证游标可互用）
+    SEARCH_ORDER = DemoService.SEARCH_ORDER
+
+    async def create_demo(
+        self,
+        db: AsyncSession,
+        *,
+        demo_in: DemoCreate,
+        current_user_id: int
+    ) -> Demo:
+        """
+        创建新Demo
+
+        Args:
+            db: 异步数据库会话
+            demo_in: Demo创建数据
+            current_user_id: 当前用户ID
+
+        Returns:
+            Demo: 创建的Demo实例
+
+        Raises:
+            BusinessException: 业务逻辑错误
+            NotFoundException: 用户不存在
+        """
+        # 验证用户是否存在
+        check_user_found(await user_crud.exists(db, id=current_user_id), current_user_id)
+
+        # 检查Demo名称是否已存在
+        check_name_available(await demo_crud.get_by_name(db, name=demo_in.name), demo_in.name)
+
+        # 验证状态值
+        validate_demo_status(demo_in.status)
+
+        # 设置所有者为当前用户
+        demo_in.owner_id = current_user_id
+
+        demo = await demo_crud.create(db, obj_in=demo_in)
+        await invalidate_demo_cache_async([demo], statistics=True)
+        return demo
+
+    async def get_demo_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        demo_id: int,
+        include_owner: bool = False
+    ) -> Demo:
+        """
+        通过ID获取Demo
+
+        Args:
+            db: 异步数据库会话
+            demo_id: Demo ID
+            include_owner: 是否在同一条查询中加载所有者
+
+        Returns:
+            Demo: Demo实例
+
+        Raises:
+            NotFoundException: Demo不存在
+        """
+        demo = await demo_crud.get(
+            db, id=demo_id, options=demo_crud.OWNER_OPTIONS if include_owner else None
+        )
+        return check_demo_found(demo, demo_id)
+
+    async def get_demo_validators(self, db: AsyncSession, *, demo_id: int) -> Validators:
+        """
+        只读取 updated_at 生成Demo的条件请求校验器，不加载整行
+
+        Args:
+            db: 异步数据库会话
+            demo_id: Demo ID
+
+        Returns:
+            Validators: Demo校验器
+
+        Raises:
+            NotFoundException: Demo不存在
+        """
+        updated_at = await demo_crud.get_updated_at(db, id=demo_id)
+        if updated_at is None:
+            raise demo_not_found(demo_id)
+        return build_validators("demo", demo_id, updated_at, last_modified=updated_at)
+
+    async def _raise_not_updated(
+        self, db: AsyncSession, *, demo_id: int, action: str
+    ) -> NoReturn:
+        """
+        条件更新未命中任何行时区分原因
+
+        Raises:
+            NotFoundException: Demo不存在或已删除
+            PermissionException: 当前用户不是所有者
+        """
+        await self.get_demo_by_id(db, demo_id=demo_id)
+        raise owner_required(action)
+
+    async def update_demo(
+        self,
+        db: AsyncSession,
+        *,
+        demo_id: int,
+        demo_in: DemoUpdate,
+        current_user_id: int
+    ) -> Demo:
+        """
+        更新Demo信息
+
+        Args:
+            db: 异步数据库会话
+            demo_id: Demo ID
+            demo_in: 更新数据
+            current_user_id: 当前用户ID
+
+        Returns:
+            Demo: 更新后的Demo实例
+
+        Raises:
+            NotFoundException: Demo不存在
+            PermissionException: 权限不足
+            BusinessException: 业务逻辑错误
+        """
+        # 检查权限（只有所有者可以更新）
+        demo = check_demo_owner(
+            await self.get_demo_by_id(db, demo_id=demo_id), current_user_id, "更新Demo"
+        )
+
+        # 检查名称是否被其他Demo使用
+        if demo_in.name and demo_in.name != demo.name:
+            check_name_available(
+                await demo_crud.get_by_name(db, name=demo_in.name), demo_in.name, demo_id
+            )
+
+        # 验证状态值
+        if demo_in.status:
+            validate_demo_status(demo_in.status)
+
+        was_featured = demo.is_featured
+        demo = await demo_crud.update(db, db_obj=demo, obj_in=demo_in)
+        await invalidate_demo_cache_async(
+            [demo],
+            featured=was_featured,
+            statistics=demo_in.status is not None or demo_in.is_featured is not None
+        )
+        return demo
+
+    async def delete_demo(
+        self,
+        db: AsyncSession,
+        *,
+        demo_id: int,
+        current_user_id: int
+    ) -> Demo:
+        """
+        删除Demo（软删除）
+
+        Args:
+            db: 异步数据库会话
+            demo_id: Demo ID
+            current_user_id: 当前用户ID
+
+        Returns:
+            Demo: 被删除的Demo实例
+
+        Raises:
+            NotFoundException: Demo不存在
+            PermissionException: 权限不足
+        """
+        # 检查权限（只有所有者可以删除）
+        demo = check_demo_owner(
+            await self.get_demo_by_id(db, demo_id=demo_id), current_user_id, "删除Demo"
+        )
+
+        deleted = await demo_crud.soft_delete(db, id=demo_id)
+        await invalidate_demo_cache_async([demo], featured=demo.is_featured, statistics=True)
+        return deleted
+
+    async def create_demos(
+        self,
+        db: AsyncSession,
+        *,
+        demos_in: List[DemoCreate],
+        current_user_id: int
+    ) -> Tuple[List[Demo], List[BatchFailure]]:
+        """
+        批量创建Demo，校验未通过的记录不影响其他记录
+
+        Args:
+            db: 异步数据库会话
+            demos_in: Demo创建数据列表
+            current_user_id: 当前用户ID
+
+        Returns:
+            Tuple[List[Demo], List[BatchFailure]]: (创建的Demo列表, 失败明细)
+
+        Raises:
+            NotFoundException: 用户不存在
+        """
+        check_user_found(await user_crud.exists(db, id=current_user_id), current_user_id)
+
+        taken_names = await demo_crud.get_ids_by_names(db, names=[d.name for d in demos_in])
+        accepted, failures = check_batch_create(demos_in, taken_names)
+
+        # 设置所有者为当前用户
+        for demo_in in accepted:
+            demo_in.owner_id = current_user_id
+
+        created = await demo_crud.create_many(db, objs_in=accepted) if accepted else []
+        await invalidate_demo_cache_async(created, statistics=True)
+        return created, failures
+
+    async def update_demos(
+        self,
+        db: AsyncSession,
+        *,
+        items: List[DemoBatchUpdateItem],
+        current_user_id: int
+    ) -> Tuple[List[Demo], List[BatchFailure]]:
+        """
+        批量更新Demo，校验未通过的记录不影响其他记录
+
+        Args:
+            db: 异步数据库会话
+            items: 批量更新项
+            current_user_id: 当前用户ID
+
+        Returns:
+            Tuple[List[Demo], List[BatchFailure]]: (更新后的Demo列表, 失败明细)
+        """
+        demos = {
+            demo.id: demo
+            for demo in await demo_crud.get_many(db, ids=[item.id for item in items])
+        }
+        taken_names = await demo_crud.get_ids_by_names(
+            db, names=[item.name for item in items if item.name]
+        )
+        updates, failures = check_batch_update(items, demos, taken_names, current_user_id)
+
+        updated = await demo_crud.update_many(db, updates=updates) if updates else []
+        await invalidate_demo_cache_async(updated, featured=True, statistics=True)
+        return updated, failures
+
+    async def delete_demos(
+        self,
+        db: AsyncSession,
+        *,
+        ids: List[int],
+        current_user_id: int
+    ) -> Tuple[List[Demo], List[BatchFailure]]:
+        """
+        批量删除Demo（软删除），校验未通过的记录不影响其他记录
+
+        Args:
+            db: 异步数据库会话
+            ids: Demo ID列表
+            current_user_id: 当前用户ID
+
+        Returns:
+            Tuple[List[Demo], List[BatchFailure]]: (被删除的Demo列表, 失败明细)
+        """
+        demos = {demo.id: demo for demo in await demo_crud.get_many(db, ids=ids)}
+        accepted, failures = check_batch_delete(ids, demos, current_user_id)
+
+        deleted = await demo_crud.soft_delete_many(db, ids=accepted) if accepted else []
+        await invalidate_demo_cache_async(deleted, featured=True, statistics=True)
+        return deleted, failures
+
+    async def search_demos(
+        self,
+        db: AsyncSession,
+        *,
+        search_params: DemoSearch,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[Demo]:
+        """
+        搜索Demo（指定关键词时按相关度排序）
+
+        Args:
+            db: 异步数据库会话
+            search_params: 搜索参数
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            List[Demo]: Demo列表
+        """
+        filters = build_search_filters(search_params)
+        term = get_search_term(search_params, cursor)
+        if term:
+            return await demo_crud.search(
+                db, term=term, skip=skip, limit=limit, filters=filters
+            )
+
+        return await demo_crud.get_multi(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=self.SEARCH_ORDER,
+            cursor=cursor
+        )
+
+    async def search_demos_page(
+        self,
+        db: AsyncSession,
+        *,
+        search_params: DemoSearch,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_owner: bool = False
+    ) -> Tuple[List[Union[Demo, RowMapping]], int]:
+        """
+        搜索Demo并在同一条查询中返回总数
+
+        Args:
+            db: 异步数据库会话
+            search_params: 搜索参数
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+            include_owner: 是否批量加载所有者（整页只多一条查询）
+
+        Returns:
+            Tuple[List[Union[Demo, RowMapping]], int]: (Demo列表, 总数)，
+            无搜索词且不附带所有者时为行映射列表
+        """
+        filters = build_search_filters(search_params)
+        term = get_search_term(search_params, cursor)
+        options = demo_crud.OWNER_LIST_OPTIONS if include_owner else None
+        if term:
+            return await demo_crud.search_page(
+                db, term=term, skip=skip, limit=limit, filters=filters, options=options
+            )
+
+        if not include_owner:
+            # 普通列表不构造ORM实例，行映射由 DemoListAdapter 整页校验
+            return await demo_crud.get_page_rows(
+                db,
+                skip=skip,
+                limit=limit,
+                filters=filters,
+                order_by=self.SEARCH_ORDER,
+                cursor=cursor,
+                estimate_total=not filters  # 无筛选条件时允许使用估算总数
+            )
+
+        return await demo_crud.get_page(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=self.SEARCH_ORDER,
+            cursor=cursor,
+            estimate_total=not filters,  # 无筛选条件时允许使用估算总数
+            options=options
+        )
+
+    async def get_user_demos(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[Demo]:
+        """
+        获取用户的Demo列表
+
+        Args:
+            db: 异步数据库会话
+            user_id: 用户ID
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            List[Demo]: Demo列表
+        """
+        return await demo_crud.get_by_owner(
+            db, owner_id=user_id, skip=skip, limit=limit, cursor=cursor
+        )
+
+    async def get_user_demos_page(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[RowMapping], int]:
+        """
+        以行映射形式获取用户的Demo列表及总数（单条查询）
+
+        Args:
+            db: 异步数据库会话
+            user_id: 用户ID
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            Tuple[List[RowMapping], int]: (Demo行映射列表, 总数)
+        """
+        return await demo_crud.get_page_rows(
+            db, skip=skip, limit=limit, filters={"owner_id": user_id}, cursor=cursor
+        )
+
+    async def get_featured_demos(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[Demo]:
+        """
+        获取推荐Demo列表
+
+        Args:
+            db: 异步数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            List[Demo]: 推荐Demo列表
+        """
+        return await demo_crud.get_featured(db, skip=skip, limit=limit, cursor=cursor)
+
+    async def get_featured_demos_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[RowMapping], int]:
+        """
+        以行映射形式获取推荐Demo列表及总数（单条查询）
+
+        Args:
+            db: 异步数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            Tuple[List[RowMapping], int]: (推荐Demo行映射列表, 总数)
+        """
+        return await demo_crud.get_page_rows(
+            db,
+            skip=skip,
+            limit=limit,
+            filters={"is_featured": True},
+            order_by=demo_crud.FEATURED_ORDER,
+            cursor=cursor
+        )
+
+    async def get_featured_demos_data(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        获取推荐列表当前页的JSON数据，并发的相同请求合并为一次查询
+
+        Args:
+            db: 异步数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            Dict[str, Any]: items、total、next_cursor，并发请求共享，只读使用
+        """
+        async def load() -> Dict[str, Any]:
+            demos, total = await self.get_featured_demos_page(
+                db, skip=skip, limit=limit, cursor=cursor
+            )
+            return featured_page_data(demos, total, limit=limit)
+
+        return await single_flight.do_async(
+            "demos:featured",
+            load,
+            params=flight_params(skip=skip, limit=limit, cursor=cursor),
+            codec=JSON_CODEC
+        )
+
+    async def get_featured_demos_validators(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Validators:
+        """
+        通过 max(updated_at) + count 探测生成推荐列表的条件请求校验器
+
+        Args:
+            db: 异步数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            Validators: 推荐列表校验器
+        """
+        latest, total = await single_flight.do_async(
+            "demos:featured:version",
+            lambda: demo_crud.get_version(db, filters={"is_featured": True}),
+            params=flight_params()
+        )
+        return build_validators(
+            "demos:featured", skip, limit, cursor, latest, total, last_modified=latest
+        )
+
+    async def update_demo_status(
+        self,
+        db: AsyncSession,
+        *,
+        demo_id: int,
+        new_status: str,
+        current_user_id: int
+    ) -> Demo:
+        """
+        更新Demo状态
+
+        Args:
+            db: 异步数据库会话
+            demo_id: Demo ID
+            new_status: 新状态
+            current_user_id: 当前用户ID
+
+        Returns:
+            Demo: 更新后的Demo实例
+
+        Raises:
+            NotFoundException: Demo不存在
+            PermissionException: 权限不足
+            BusinessException: 业务逻辑错误
+        """
+        # 验证状态值
+        validate_demo_status(new_status)
+
+        demo = await demo_crud.update_status(
+            db, demo_id=demo_id, new_status=new_status, owner_id=current_user_id
+        )
+        if demo is None:
+            await self._raise_not_updated(db, demo_id=demo_id, action="更新状态")
+        await invalidate_demo_cache_async([demo], statistics=True)
+        return demo
+
+    async def set_demo_featured(
+        self,
+        db: AsyncSession,
+        *,
+        demo_id: int,
+        is_featured: bool,
+        current_user_id: int
+    ) -> Demo:
+        """
+        设置Demo推荐状态
+
+        Args:
+            db: 异步数据库会话
+            demo_id: Demo ID
+            is_featured: 是否推荐
+            current_user_id: 当前用户ID
+
+        Returns:
+            Demo: 更新后的Demo实例
+
+        Raises:
+            NotFoundException: Demo不存在
+            PermissionException: 权限不足
+        """
+        demo = await demo_crud.set_featured(
+            db, demo_id=demo_id, is_featured=is_featured, owner_id=current_user_id
+        )
+        if demo is None:
+            await self._raise_not_updated(db, demo_id=demo_id, action="设置推荐状态")
+        await invalidate_demo_cache_async([demo], featured=True, statistics=True)
+        return demo
+
+    async def update_demo_priority(
+        self,
+        db: AsyncSession,
+        *,
+        demo_id: int,
+        priority: int,
+        current_user_id: int
+    ) -> Demo:
+        """
+        更新Demo优先级
+
+        Args:
+            db: 异步数据库会话
+            demo_id: Demo ID
+            priority: 优先级
+            current_user_id: 当前用户ID
+
+        Returns:
+            Demo: 更新后的Demo实例
+
+        Raises:
+            NotFoundException: Demo不存在
+            PermissionException: 权限不足
+        """
+        demo = await demo_crud.update_priority(
+            db, demo_id=demo_id, priority=priority, owner_id=current_user_id
+        )
+        if demo is None:
+            await self._raise_not_updated(db, demo_id=demo_id, action="更新优先级")
+        await invalidate_demo_cache_async([demo])
+        return demo
+
+    async def get_demo_statistics(self, db: AsyncSession) -> Dict[str, Any]:
+        """
+        获取Demo统计信息（并发请求合并为一次查询，说明见 DemoService）
+
+        Args:
+            db: 异步数据库会话
+
+        Returns:
+            Dict[str, Any]: 统计信息（并发请求共享，只读使用）
+        """
+        return await single_flight.do_async(
+            "demos:statistics",
+            lambda: self._load_statistics(db),
+            params=flight_params(),
+            codec=JSON_CODEC
+        )
+
+    async def _load_statistics(self, db: AsyncSession) -> Dict[str, Any]:
+        """读取计数器（未初始化时退回扫描统计，见 DemoService._load_statistics）"""
+        if settings.DEMO_COUNTERS_ENABLED:
+            counters = await demo_crud.get_counters(db)
+            if counters is not None:
+                return counters
+            logger.warning("Demo计数器未初始化，退回扫描统计；请执行 make counters")
+
+        return await demo_crud.get_statistics(db)
+
+
+# 创建全局服务实例
+async_demo_service = AsyncDemoService()
@@ -0,0 +1,329 @@
+"""
+用户异步业务逻辑服务
+基于 AsyncSession 实现与 UserService 相同的业务规则
+"""
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import async_user as user_crud
+from app.schemas.user import UserCreate, UserUpdate, UserPasswordUpdate
+from app.models.user import User
+from app.core.response import BusinessException, NotFoundException
+from app.services.login_stats import login_stats
+from app.core.response_cache import response_cache
+from app.services.demo_service import DEMOS_OWNERS_TAG
+from app.services.user_cache import user_cache
+from app.core.hashing import password_hasher
+
+
+class AsyncUserService:
+    """用户异步业务逻辑服务类"""
+
+    async def create_user(self, db: AsyncSession, *, user_in: UserCreate) -> User:
+        """
+        创建新用户
+
+        Args:
+            db: 异步数据库会话
+            user_in: 用户创建数据
+
+        Returns:
+            User: 创建的用户实例
+
+        Raises:
+            BusinessException: 业务逻辑错误
+        """
+        # 检查邮箱是否已存在
+        if await user_crud.get_by_email(db, email=user_in.email):
+            raise BusinessException(
+                error="邮箱已被注册",
+                message="该邮箱地址已被其他用户使用"
+            )
+
+        # 检查用户名是否已存在（如果提供）
+        if user_in.username:
+            if await user_crud.get_by_username(db, username=user_in.username):
+                raise BusinessException(
+                    error="用户名已被占用",
+                    message="该用户名已被其他用户使用"
+                )
+
+        # 创建用户
+        return await user_crud.create(db, obj_in=user_in)
+
+    async def get_user_by_id(self, db: AsyncSession, *, user_id: int) -> User:
+        """
+        通过ID获取用户
+
+        Args:
+            db: 异步数据库会话
+            user_id: 用户ID
+
+        Returns:
+            User: 用户实例
+
+        Raises:
+            NotFoundException: 用户不存在
+        """
+        user = await user_crud.get(db, id=user_id)
+        if not user:
+            raise NotFoundException(
+                error="用户不存在",
+                message=f"ID为 {user_id} 的用户不存在"
+            )
+        return user
+
+    async def get_user_by_email(self, db: AsyncSession, *, email: str) -> User:
+        """
+        通过邮箱获取用户
+
+        Args:
+            db: 异步数据库会话
+            email: 邮箱地址
+
+        Returns:
+            User: 用户实例
+
+        Raises:
+            NotFoundException: 用户不存在
+        """
+        user = await user_crud.get_by_email(db, email=email)
+        if not user:
+            raise NotFoundException(
+                error="用户不存在",
+                message=f"邮箱为 {email} 的用户不存在"
+            )
+        return user
+
+    async def update_user(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        user_in: UserUpdate
+    ) -> User:
+        """
+        更新用户信息
+
+        Args:
+            db: 异步数据库会话
+            user_id: 用户ID
+            user_in: 更新数据
+
+        Returns:
+            User: 更新后的用户实例
+
+        Raises:
+            NotFoundException: 用户不存在
+            BusinessException: 业务逻辑错误
+        """
+        user = await self.get_user_by_id(db, user_id=user_id)
+
+        # 检查邮箱是否被其他用户使用
+        if user_in.email and user_in.email != user.email:
+            if await user_crud.get_by_email(db, email=user_in.email):
+                raise BusinessException(
+                    error="邮箱已被注册",
+                    message="该邮箱地址已被其他用户使用"
+                )
+
+        # 检查用户名是否被其他用户使用
+        if user_in.username and user_in.username != user.username:
+            if await user_crud.get_by_username(db, username=user_in.username):
+                raise BusinessException(
+                    error="用户名已被占用",
+                    message="该用户名已被其他用户使用"
+                )
+
+        user = await user_crud.update(db, db_obj=user, obj_in=user_in)
+        await user_cache.invalidate_async(user_id)
+        # 包含所有者信息的Demo响应随之失效
+        await response_cache.invalidate_async(DEMOS_OWNERS_TAG)
+        return user
+
+    async def update_password(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        password_update: UserPasswordUpdate
+    ) -> User:
+        """
+        更新用户密码
+
+        Args:
+            db: 异步数据库会话
+            user_id: 用户ID
+            password_update: 密码更新数据
+
+        Returns:
+            User: 更新后的用户实例
+
+        Raises:
+            NotFoundException: 用户不存在
+            BusinessException: 业务逻辑错误
+        """
+        user = await self.get_user_by_id(db, user_id=user_id)
+
+        # 验证当前密码
+        if not await password_hasher.verify_async(
+            password_update.current_password, user.hashed_password
+        ):
+            raise BusinessException(
+                error="当前密码错误",
+                message="请输入正确的当前密码"
+            )
+
+        # 验证新密码确认
+        if password_update.new_password != password_update.confirm_password:
+            raise BusinessException(
+                error="密码确认不匹配",
+                message="新密码和确认密码不一致"
+            )
+
+        # 检查新密码是否与当前密码相同
+        if await password_hasher.verify_async(
+            password_update.new_password, user.hashed_password
+        ):
+            raise BusinessException(
+                error="新密码与当前密码相同",
+                message="新密码不能与当前密码相同"
+            )
+
+        user = await user_crud.update_password(
+            db, db_obj=user, new_password=password_update.new_password
+        )
+        await user_cache.invalidate_async(user_id)
+        return user
+
+    async def authenticate_user(
+        self,
+        db: AsyncSession,
+        *,
+        email: str,
+        password: str
+    ) -> Optional[User]:
+        """
+        用户认证
+
+        Args:
+            db: 异步数据库会话
+            email: 邮箱
+            password: 密码
+
+        Returns:
+            Optional[User]: 认证成功返回用户实例，失败返回None
+        """
+        user = await user_crud.authenticate(db, email=email, password=password)
+        if user and user_crud.is_active(user):
+            if login_stats.write_behind:
+                return await login_stats.apply_async(user)
+
+            # 更新登录信息
+            user = await user_crud.record_login(db, user_id=user.id)
+            await user_cache.invalidate_async(user.id)
+            return user
+        return None
+
+    async def deactivate_user(self, db: AsyncSession, *, user_id: int) -> User:
+        """
+        停用用户
+
+        Args:
+            db: 异步数据库会话
+            user_id: 用户ID
+
+        Returns:
+            User: 更新后的用户实例
+
+        Raises:
+            NotFoundException: 用户不存在
+        """
+        await self.get_user_by_id(db, user_id=user_id)
+        user = await user_crud.deactivate(db, user_id=user_id)
+        await user_cache.invalidate_async(user_id)
+        return user
+
+    async def activate_user(self, db: AsyncSession, *, user_id: int) -> User:
+        """
+        激活用户
+
+        Args:
+            db: 异步数据库会话
+            user_id: 用户ID
+
+        Returns:
+            User: 更新后的用户实例
+
+        Raises:
+            NotFoundException: 用户不存在
+        """
+        await self.get_user_by_id(db, user_id=user_id)
+        user = await user_crud.activate(db, user_id=user_id)
+        await user_cache.invalidate_async(user_id)
+        return user
+
+    async def get_users(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[User]:
+        """
+        获取用户列表
+
+        Args:
+            db: 异步数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            List[User]: 用户列表
+        """
+        return await user_crud.get_multi(db, skip=skip, limit=limit, cursor=cursor)
+
+    async def get_users_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[RowMapping], int]:
+        """
+        以行映射形式获取用户列表及总数（单条查询，大表使用估算总数）
+
+        Args:
+            db: 异步数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+
+        Returns:
+            Tuple[List[RowMapping], int]: (用户行映射列表, 总数)
+        """
+        return await user_crud.get_page_rows(
+            db, skip=skip, limit=limit, cursor=cursor, estimate_total=True
+        )
+
+    async def count_users(self, db: AsyncSession) -> int:
+        """
+        获取用户总数
+
+        Args:
+            db: 异步数据库会话
+
+        Returns:
+            int: 用户总数
+        """
+        return await user_crud.count(db)
+
+
+# 创建全局服务实例
+async_user_service = AsyncUserService()
@@ -3,18 +3,517 @@ Demo业务逻辑服务
 处理Demo相关的业务逻辑
 """
 
-from typing import List, Optional, Dict, Any
+import logging
+from typing import FrozenSet, Iterable, List, NoReturn, Optional, Dict, Any, Tuple, Union
+from sqlalchemy import RowMapping
 from sqlalchemy.orm import Session
 
 from app.crud import demo as demo_crud, user as user_crud
-from app.schemas.demo import DemoCreate, DemoUpdate, DemoSearch
+from app.schemas.batch import BatchFailure
+from app.schemas.demo import (
+    DemoBatchUpdateItem,
+    DemoCreate,
+    DemoListAdapter,
+    DemoSearch,
+    DemoUpdate,
+)
 from app.models.demo import Demo
-from app.core.response import BusinessException, NotFoundException, PermissionException
+from app.core.conditional import Validators, build_validators
+from app.core.config import settings
+from app.core.response import (
+    APIException,
+    BusinessException,
+    NotFoundException,
+    PermissionException,
+    ValidationException,
+)
+from app.core.response_cache import response_cache
+from app.core.singleflight import JSON_CODEC, single_flight
+from app.db import replicas
+
+logger = logging.getLogger(__name__)
+
+
+# 合法的Demo状态值
+VALID_STATUSES = ["active", "inactive", "pending"]
+
+# include 参数支持的关联数据
+VALID_INCLUDES = ["owner"]
+
+# 响应缓存标签：不按所有者筛选的列表、推荐列表、统计、包含所有者信息的响应
+DEMOS_LIST_TAG = "demos:list"
+DEMOS_FEATURED_TAG = "demos:featured"
+DEMOS_STATISTICS_TAG = "demos:statistics"
+DEMOS_OWNERS_TAG = "demos:owners"
+
+
+def demo_tag(demo_id: int) -> str:
+    """单个Demo的响应缓存标签"""
+    return f"demo:{demo_id}"
+
+
+def owner_tag(owner_id: int) -> str:
+    """按所有者筛选的Demo列表的响应缓存标签"""
+    return f"demos:owner:{owner_id}"
+
+
+def list_cache_tags(owner_id: Optional[int], include_owner: bool = False) -> List[str]:
+    """
+    Demo列表响应的缓存标签
+    
+    Args:
+        owner_id: 按所有者筛选时的所有者ID
+        include_owner: 响应是否包含所有者信息
+    """
+    tags = [owner_tag(owner_id) if owner_id is not None else DEMOS_LIST_TAG]
+    if include_owner:
+        tags.append(DEMOS_OWNERS_TAG)
+    return tags
+
+
+def detail_cache_tags(demo_id: int, include_owner: bool = False) -> List[str]:
+    """
+    Demo详情响应的缓存标签
+    
+    Args:
+        demo_id: Demo ID
+        include_owner: 响应是否包含所有者信息
+    """
+    tags = [demo_tag(demo_id)]
+    if include_owner:
+        tags.append(DEMOS_OWNERS_TAG)
+    return tags
+
+
+def _demo_cache_targets(
+    demos: Iterable[Demo], featured: bool, statistics: bool
+) -> Tuple[List[str], List[str]]:
+    """
+    写操作影响的缓存标签和热点查询名称（参数同 invalidate_demo_cache）
+    
+    Returns:
+        Tuple[List[str], List[str]]: (响应缓存标签, 热点查询名称)，没有Demo时都为空
+    """
+    tags = []
+    for demo in demos:
+        tags.extend((demo_tag(demo.id), owner_tag(demo.owner_id)))
+        featured = featured or bool(demo.is_featured)
+    if not tags:
+        return [], []
+    tags.append(DEMOS_LIST_TAG)
+    flights = []
+    if featured:
+        tags.append(DEMOS_FEATURED_TAG)
+        flights.extend(("demos:featured", "demos:featured:version"))
+    if statistics:
+        tags.append(DEMOS_STATISTICS_TAG)
+        flights.append("demos:statistics")
+    return tags, flights
+
+
+def invalidate_demo_cache(
+    demos: Iterable[Demo], *, featured: bool = False, statistics: bool = False
+) -> None:
+    """
+    写操作提交后使受影响的响应缓存失效
+    
+    每个Demo使其详情、所属用户的列表和不按所有者筛选的列表失效；
+    Demo处于推荐状态时同时使推荐列表失效。推荐列表和统计的热点查询合并同时遗忘
+    写入前开始的执行，之后的请求不会拿到写入前的结果
+    
+    Args:
+        demos: 被写入的Demo（写入后的状态）
+        featured: 推荐列表是否受影响（推荐状态可能变化或Demo被删除）
+        statistics: 统计是否受影响（条数、状态或推荐状态可能变化）
+    """
+    tags, flights = _demo_cache_targets(demos, featured, statistics)
+    if tags:
+        response_cache.invalidate(*tags)
+    if flights:
+        single_flight.forget(*flights)
+
+
+async def invalidate_demo_cache_async(
+    demos: Iterable[Demo], *, featured: bool = False, statistics: bool = False
+) -> None:
+    """写操作提交后使受影响的响应缓存失效（异步版本，参数同 invalidate_demo_cache）"""
+    tags, flights = _demo_cache_targets(demos, featured, statistics)
+    if tags:
+        await response_cache.invalidate_async(*tags)
+    if flights:
+        await single_flight.forget_async(*flights)
+
+
+def validate_demo_status(status: str) -> None:
+    """
+    校验Demo状态值
+    
+    Args:
+        status: 状态值
+        
+    Raises:
+        BusinessException: 状态值无效
+    """
+    if status not in VALID_STATUSES:
+        raise BusinessException(
+            error="无效的状态值",
+            message=f"状态必须为以下值之一: {', '.join(VALID_STATUSES)}"
+        )
+
+
+def demo_not_found(demo_id: int) -> NotFoundException:
+    """Demo不存在或已删除时抛出的异常"""
+    return NotFoundException(
+        error="Demo不存在",
+        message=f"ID为 {demo_id} 的Demo不存在"
+    )
+
+
+def owner_required(action: str) -> PermissionException:
+    """
+    当前用户不是Demo所有者时抛出的异常
+    
+    Args:
+        action: 操作描述，如 "更新Demo"
+    """
+    return PermissionException(
+        error="权限不足",
+        message=f"只有Demo的所有者可以{action}"
+    )
+
+
+def check_demo_found(demo: Optional[Demo], demo_id: int) -> Demo:
+    """
+    校验Demo存在且未删除
+    
+    Args:
+        demo: 按ID读取到的Demo，不存在时为None
+        demo_id: Demo ID
+        
+    Returns:
+        Demo: 同一个Demo实例
+        
+    Raises:
+        NotFoundException: Demo不存在或已删除
+    """
+    if not demo or demo.is_deleted:
+        raise demo_not_found(demo_id)
+    return demo
+
+
+def check_demo_owner(demo: Demo, current_user_id: int, action: str) -> Demo:
+    """
+    校验当前用户为Demo所有者
+    
+    Args:
+        demo: Demo实例
+        current_user_id: 当前用户ID
+        action: 操作描述，用于错误信息
+        
+    Returns:
+        Demo: 同一个Demo实例
+        
+    Raises:
+        PermissionException: 当前用户不是所有者
+    """
+    if demo.owner_id != current_user_id:
+        raise owner_required(action)
+    return demo
+
+
+def check_name_available(existing: Optional[Demo], name: str, demo_id: Optional[int] = None) -> None:
+    """
+    校验Demo名称未被其他Demo使用
+    
+    Args:
+        existing: 按名称读取到的Demo，不存在时为None
+        name: 名称
+        demo_id: 正在更新的Demo ID（名称属于它自己时不算冲突）
+        
+    Raises:
+        BusinessException: 名称已被其他Demo使用
+    """
+    if existing and existing.id != demo_id:
+        raise BusinessException(
+            error="Demo名称已存在",
+            message=f"名称为 '{name}' 的Demo已存在"
+        )
+
+
+def check_user_found(found: bool, user_id: int) -> None:
+    """
+    校验Demo所有者存在
+    
+    Args:
+        found: 用户是否存在
+        user_id: 用户ID
+        
+    Raises:
+        NotFoundException: 用户不存在
+    """
+    if not found:
+        raise NotFoundException(
+            error="用户不存在",
+            message=f"ID为 {user_id} 的用户不存在"
+        )
+
+
+def parse_include(include: Optional[str]) -> FrozenSet[str]:
+    """
+    解析逗号分隔的 include 参数
+    
+    Args:
+        include: 要附加的关联数据，如 "owner"
+        
+    Returns:
+        FrozenSet[str]: 关联数据名称集合
+        
+    Raises:
+        ValidationException: 包含不支持的关联数据
+    """
+    names = frozenset(name.strip() for name in (include or "").split(",") if name.strip())
+    unknown = sorted(names.difference(VALID_INCLUDES))
+    if unknown:
+        raise ValidationException(
+            error="无效的include参数",
+            message=f"include 只支持以下值: {', '.join(VALID_INCLUDES)}，收到: {', '.join(unknown)}"
+        )
+    return names
+
+
+def demo_validators(demo: Demo, include_owner: bool = False) -> Validators:
+    """
+    由已加载的Demo生成条件请求校验器（ETag / Last-Modified）
+    
+    Args:
+        demo: Demo实例
+        include_owner: 响应是否包含所有者信息（所有者需已预加载），
+            包含时所有者的修改也会使校验器失效
+        
+    Returns:
+        Validators: 不含所有者时与 DemoService.get_demo_validators 探测结果一致的校验器
+    """
+    if not include_owner:
+        return build_validators("demo", demo.id, demo.updated_at, last_modified=demo.updated_at)
+    
+    owner = demo.owner
+    return build_validators(
+        "demo", demo.id, demo.updated_at, "owner", owner.id, owner.updated_at,
+        last_modified=max(demo.updated_at, owner.updated_at)
+    )
+
+
+def flight_params(**params: Any) -> Dict[str, Any]:
+    """
+    热点查询的合并参数
+    
+    要求读主库的请求（写后固定窗口内）只与同样读主库的请求合并，
+    避免拿到副本上不含自己写入的结果
+    
+    Returns:
+        Dict[str, Any]: 查询参数及读取偏好
+    """
+    preference = replicas.current_preference()
+    return {**params, "primary": bool(preference and preference.primary)}
+
+
+def featured_page_data(rows: List[RowMapping], total: int, *, limit: int) -> Dict[str, Any]:
+    """
+    推荐列表当前页的JSON数据，在合并的查询内生成
+    
+    并发请求共享的是普通数据而不是首个请求会话中的ORM实例，可以跨进程发布，
+    也不会在其他请求中触发懒加载
+    
+    Args:
+        rows: 当前页的Demo行映射（get_page_rows 的结果）
+        total: 总数
+        limit: 每页大小
+        
+    Returns:
+        Dict[str, Any]: items（Demo模式的JSON数据）、total、next_cursor
+    """
+    return {
+        "items": DemoListAdapter.dump_python(DemoListAdapter.validate_python(rows), mode="json"),
+        "total": total,
+        "next_cursor": demo_crud.next_cursor(
+            rows, limit=limit, order_by=demo_crud.FEATURED_ORDER
+        ),
+    }
+
+
+def build_search_filters(search_params: DemoSearch) -> Dict[str, Any]:
+    """
+    根据搜索参数构建过滤条件
+    
+    Args:
+        search_params: 搜索参数
+        
+    Returns:
+        Dict[str, Any]: 过滤条件字典
+    """
+    filters: Dict[str, Any] = {}
+    
+    if search_params.status:
+        filters["status"] = search_params.status
+        
+    if search_params.is_featured is not None:
+        filters["is_featured"] = search_params.is_featured
+        
+    if search_params.owner_id:
+        filters["owner_id"] = search_params.owner_id
+    
+    # 关键词搜索由 get_search_term 单独处理，按相关度排序
+    return filters
+
+
+def get_search_term(search_params: DemoSearch, cursor: Optional[str] = None) -> Optional[str]:
+    """
+    获取搜索关键词
+    
+    Args:
+        search_params: 搜索参数
+        cursor: 分页游标
+        
+    Returns:
+        Optional[str]: 去除首尾空白后的关键词，未指定时为None
+        
+    Raises:
+        ValidationException: 关键词搜索同时使用了游标分页
+    """
+    term = (search_params.name or "").strip()
+    if not term:
+        return None
+    
+    # 相关度不是稳定的排序键，关键词搜索只支持 skip/limit 分页
+    if cursor:
+        raise ValidationException(
+            error="搜索结果不支持游标分页",
+            message="按关键词搜索时请使用 skip/limit 分页"
+        )
+    return term
+
+
+def check_batch_create(
+    demos_in: List[DemoCreate], 
+    taken_names: Dict[str, int]
+) -> Tuple[List[DemoCreate], List[BatchFailure]]:
+    """
+    校验批量创建数据（状态值、名称唯一性）
+    
+    Args:
+        demos_in: Demo创建数据列表
+        taken_names: 已被占用的名称
+        
+    Returns:
+        Tuple[List[DemoCreate], List[BatchFailure]]: (通过校验的数据, 失败明细)，
+        失败项以请求中的序号标识
+    """
+    accepted: List[DemoCreate] = []
+    failures: List[BatchFailure] = []
+    names = set(taken_names)
+    
+    for index, demo_in in enumerate(demos_in):
+        try:
+            if demo_in.name in names:
+                raise BusinessException(
+                    error="Demo名称已存在",
+                    message=f"名称为 '{demo_in.name}' 的Demo已存在"
+                )
+            validate_demo_status(demo_in.status)
+        except APIException as e:
+            failures.append(BatchFailure(id=index, error=e.message))
+            continue
+        names.add(demo_in.name)
+        accepted.append(demo_in)
+    
+    return accepted, failures
+
+
+def check_batch_update(
+    items: List[DemoBatchUpdateItem],
+    demos: Dict[int, Demo],
+    taken_names: Dict[str, int],
+    current_user_id: int
+) -> Tuple[Dict[int, DemoUpdate], List[BatchFailure]]:
+    """
+    校验批量更新数据（存在性、所有权、名称唯一性、状态值）
+    
+    Args:
+        items: 批量更新项
+        demos: {Demo ID: Demo实例}
+        taken_names: 已被占用的名称 {名称: Demo ID}
+        current_user_id: 当前用户ID
+        
+    Returns:
+        Tuple[Dict[int, DemoUpdate], List[BatchFailure]]: ({Demo ID: 更新数据}, 失败明细)
+    """
+    updates: Dict[int, DemoUpdate] = {}
+    failures: List[BatchFailure] = []
+    names = dict(taken_names)
+    
+    for item in items:
+        try:
+            demo = check_demo_found(demos.get(item.id), item.id)
+            check_demo_owner(demo, current_user_id, "更新Demo")
+            if item.id in updates:
+                raise BusinessException(
+                    error="重复的Demo",
+                    message=f"ID为 {item.id} 的Demo在请求中重复出现"
+                )
+            if item.name and item.name != demo.name and names.get(item.name, item.id) != item.id:
+                raise BusinessException(
+                    error="Demo名称已存在",
+                    message=f"名称为 '{item.name}' 的Demo已存在"
+                )
+            if item.status:
+                validate_demo_status(item.status)
+        except APIException as e:
+            failures.append(BatchFailure(id=item.id, error=e.message))
+            continue
+        if item.name:
+            names[item.name] = item.id
+        updates[item.id] = DemoUpdate(**item.model_dump(exclude_unset=True, exclude={"id"}))
+    
+    return updates, failures
+
+
+def check_batch_delete(
+    ids: List[int],
+    demos: Dict[int, Demo],
+    current_user_id: int
+) -> Tuple[List[int], List[BatchFailure]]:
+    """
+    校验批量删除（存在性、所有权）
+    
+    Args:
+        ids: Demo ID列表
+        demos: {Demo ID: Demo实例}
+        current_user_id: 当前用户ID
+        
+    Returns:
+        Tuple[List[int], List[BatchFailure]]: (可删除的ID, 失败明细)
+    """
+    accepted: List[int] = []
+    failures: List[BatchFailure] = []
+    
+    for demo_id in dict.fromkeys(ids):
+        demo = demos.get(demo_id)
+        if not demo or demo.is_deleted:
+            failures.append(BatchFailure(id=demo_id, error=f"ID为 {demo_id} 的Demo不存在"))
+        elif demo.owner_id != current_user_id:
+            failures.append(BatchFailure(id=demo_id, error="只有Demo的所有者可以删除Demo"))
+        else:
+            accepted.append(demo_id)
+    
+    return accepted, failures
 
 
 class DemoService:
     """Demo业务逻辑服务类"""
     
+    # 搜索列表排序（优先级降序）
+    SEARCH_ORDER = "-priority"
+    
     def create_demo(
         self, 
         db: Session, 
@@ -38,41 +537,35 @@ class DemoService:
             NotFoundException: 用户不存在
         """
         # 验证用户是否存在
-        user = user_crud.get(db, id=current_user_id)
-        if not user:
-            raise NotFoundException(
-                error="用户不存在",
-                message=f"ID为 {current_user_id} 的用户不存在"
-            )
+        check_user_found(user_crud.exists(db, id=current_user_id), current_user_id)
         
         # 检查Demo名称是否已存在
-        existing_demo = demo_crud.get_by_name(db, name=demo_in.name)
-        if existing_demo:
-            raise BusinessException(
-                error="Demo名称已存在",
-                message=f"名称为 '{demo_in.name}' 的Demo已存在"
-            )
+        check_name_available(demo_crud.get_by_name(db, name=demo_in.name), demo_in.name)
         
         # 验证状态值
-        valid_statuses = ["active", "inactive", "pending"]
-        if demo_in.status not in valid_statuses:
-            raise BusinessException(
-                error="无效的状态值",
-                message=f"状态必须为以下值之一: {', '.join(valid_statuses)}"
-            )
+        validate_demo_status(demo_in.status)
         
         # 设置所有者为当前用户
         demo_in.owner_id = current_user_id
         
-        return demo_crud.create(db, obj_in=demo_in)
+        demo = demo_crud.create(db, obj_in=demo_in)
+        invalidate_demo_cache([demo], statistics=True)
+        return demo
     
-    def get_demo_by_id(self, db: Session, *, demo_id: int) -> Demo:
+    def get_demo_by_id(
+        self, 
+        db: Session, 
+        *, 
+        demo_id: int,
+        include_owner: bool = False
+    ) -> Demo:
         """
         通过ID获取Demo
         
         Args:
             db: 数据库会话
             demo_id: Demo ID
+            include_owner: 是否在同一条查询中加载所有者
             
         Returns:
             Demo: Demo实例
@@ -80,13 +573,29 @@ class DemoService:
         Raises:
             NotFoundException: Demo不存在
         """
-        demo = demo_crud.get(db, id=demo_id)
-        if not demo or demo.is_deleted:
-            raise NotFoundException(
-                error="Demo不存在",
-                message=f"ID为 {demo_id} 的Demo不存在"
-            )
-        return demo
+        demo = demo_crud.get(
+            db, id=demo_id, options=demo_crud.OWNER_OPTIONS if include_owner else None
+        )
+        return check_demo_found(demo, demo_id)
+    
+    def get_demo_validators(self, db: Session, *, demo_id: int) -> Validators:
+        """
+        只读取 updated_at 生成Demo的条件请求校验器，不加载整行
+        
+        Args:
+            db: 数据库会话
+            demo_id: Demo ID
+            
+        Returns:
+            Validators: Demo校验器
+            
+        Raises:
+            NotFoundException: Demo不存在
+        """
+        updated_at = demo_crud.get_updated_at(db, id=demo_id)
+        if updated_at is None:
+            raise demo_not_found(demo_id)
+        return build_validators("demo", demo_id, updated_at, last_modified=updated_at)
     
     def update_demo(
         self, 
@@ -113,34 +622,29 @@ class DemoService:
             PermissionException: 权限不足
             BusinessException: 业务逻辑错误
         """
-        demo = self.get_demo_by_id(db, demo_id=demo_id)
-        
         # 检查权限（只有所有者可以更新）
-        if demo.owner_id != current_user_id:
-            raise PermissionException(
-                error="权限不足",
-                message="只有Demo的所有者可以更新Demo"
-            )
+        demo = check_demo_owner(
+            self.get_demo_by_id(db, demo_id=demo_id), current_user_id, "更新Demo"
+        )
         
         # 检查名称是否被其他Demo使用
         if demo_in.name and demo_in.name != demo.name:
-            existing_demo = demo_crud.get_by_name(db, name=demo_in.name)
-            if existing_demo and existing_demo.id != demo_id:
-                raise BusinessException(
-                    error="Demo名称已存在",
-                    message=f"名称为 '{demo_in.name}' 的Demo已存在"
-                )
+            check_name_available(
+                demo_crud.get_by_name(db, name=demo_in.name), demo_in.name, demo_id
+            )
         
         # 验证状态值
         if demo_in.status:
-            valid_statuses = ["active", "inactive", "pending"]
-            if demo_in.status not in valid_statuses:
-                raise BusinessException(
-                    error="无效的状态值",
-                    message=f"状态必须为以下值之一: {', '.join(valid_statuses)}"
-                )
+            validate_demo_status(demo_in.status)
         
-        return demo_crud.update(db, db_obj=demo, obj_in=demo_in)
+        was_featured = demo.is_featured
+        demo = demo_crud.update(db, db_obj=demo, obj_in=demo_in)
+        invalidate_demo_cache(
+            [demo],
+            featured=was_featured,
+            statistics=demo_in.status is not None or demo_in.is_featured is not None
+        )
+        return demo
     
     def delete_demo(
         self, 
@@ -164,16 +668,101 @@ class DemoService:
             NotFoundException: Demo不存在
             PermissionException: 权限不足
         """
-        demo = self.get_demo_by_id(db, demo_id=demo_id)
-        
         # 检查权限（只有所有者可以删除）
-        if demo.owner_id != current_user_id:
-            raise PermissionException(
-                error="权限不足",
-                message="只有Demo的所有者可以删除Demo"
-            )
+        demo = check_demo_owner(
+            self.get_demo_by_id(db, demo_id=demo_id), current_user_id, "删除Demo"
+        )
+        
+        deleted = demo_crud.soft_delete(db, id=demo_id)
+        invalidate_demo_cache([demo], featured=demo.is_featured, statistics=True)
+        return deleted
+    
+    def create_demos(
+        self, 
+        db: Session, 
+        *, 
+        demos_in: List[DemoCreate], 
+        current_user_id: int
+    ) -> Tuple[List[Demo], List[BatchFailure]]:
+        """
+        批量创建Demo，校验未通过的记录不影响其他记录
+        
+        Args:
+            db: 数据库会话
+            demos_in: Demo创建数据列表
+            current_user_id: 当前用户ID
+            
+        Returns:
+            Tuple[List[Demo], List[BatchFailure]]: (创建的Demo列表, 失败明细)
+            
+        Raises:
+            NotFoundException: 用户不存在
+        """
+        check_user_found(user_crud.exists(db, id=current_user_id), current_user_id)
+        
+        taken_names = demo_crud.get_ids_by_names(db, names=[d.name for d in demos_in])
+        accepted, failures = check_batch_create(demos_in, taken_names)
+        
+        # 设置所有者为当前用户
+        for demo_in in accepted:
+            demo_in.owner_id = current_user_id
+        
+        created = demo_crud.create_many(db, objs_in=accepted) if accepted else []
+        invalidate_demo_cache(created, statistics=True)
+        return created, failures
+    
+    def update_demos(
+        self, 
+        db: Session, 
+        *, 
+        items: List[DemoBatchUpdateItem], 
+        current_user_id: int
+    ) -> Tuple[List[Demo], List[BatchFailure]]:
+        """
+        批量更新Demo，校验未通过的记录不影响其他记录
+        
+        Args:
+            db: 数据库会话
+            items: 批量更新项
+            current_user_id: 当前用户ID
+            
+        Returns:
+            Tuple[List[Demo], List[BatchFailure]]: (更新后的Demo列表, 失败明细)
+        """
+        demos = {demo.id: demo for demo in demo_crud.get_many(db, ids=[i.id for i in items])}
+        taken_names = demo_crud.get_ids_by_names(
+            db, names=[item.name for item in items if item.name]
+        )
+        updates, failures = check_batch_update(items, demos, taken_names, current_user_id)
         
-        return demo_crud.soft_delete(db, id=demo_id)
+        updated = demo_crud.update_many(db, updates=updates) if updates else []
+        invalidate_demo_cache(updated, featured=True, statistics=True)
+        return updated, failures
+    
+    def delete_demos(
+        self, 
+        db: Session, 
+        *, 
+        ids: List[int], 
+        current_user_id: int
+    ) -> Tuple[List[Demo], List[BatchFailure]]:
+        """
+        批量删除Demo（软删除），校验未通过的记录不影响其他记录
+        
+        Args:
+            db: 数据库会话
+            ids: Demo ID列表
+            current_user_id: 当前用户ID
+            
+        Returns:
+            Tuple[List[Demo], List[BatchFailure]]: (被删除的Demo列表, 失败明细)
+        """
+        demos = {demo.id: demo for demo in demo_crud.get_many(db, ids=ids)}
+        accepted, failures = check_batch_delete(ids, demos, current_user_id)
+        
+        deleted = demo_crud.soft_delete_many(db, ids=accepted) if accepted else []
+        invalidate_demo_cache(deleted, featured=True, statistics=True)
+        return deleted, failures
     
     def search_demos(
         self, 
@@ -181,45 +770,93 @@ class DemoService:
         *, 
         search_params: DemoSearch,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Demo]:
         """
-        搜索Demo
+        搜索Demo（指定关键词时按相关度排序）
         
         Args:
             db: 数据库会话
             search_params: 搜索参数
             skip: 跳过记录数
             limit: 限制记录数
+            cursor: 分页游标
             
         Returns:
             List[Demo]: Demo列表
         """
-        filters = {}
-        
-        # 构建过滤条件
-        if search_params.status:
-            filters["status"] = search_params.status
-            
-        if search_params.is_featured is not None:
-            filters["is_featured"] = search_params.is_featured
-            
-        if search_params.owner_id:
-            filters["owner_id"] = search_params.owner_id
+        filters = build_search_filters(search_params)
+        term = get_search_term(search_params, cursor)
+        if term:
+            return demo_crud.search(db, term=term, skip=skip, limit=limit, filters=filters)
         
         # 默认不包含已删除的记录
         filters["is_deleted"] = False
         
-        # 如果有名称搜索，使用模糊搜索
-        if search_params.name:
-            filters["name"] = {"like": search_params.name}
-        
         return demo_crud.get_multi(
             db, 
             skip=skip, 
             limit=limit, 
             filters=filters,
-            order_by="-priority"  # 按优先级降序排列
+            order_by=self.SEARCH_ORDER,
+            cursor=cursor
+        )
+    
+    def search_demos_page(
+        self, 
+        db: Session, 
+        *, 
+        search_params: DemoSearch,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_owner: bool = False
+    ) -> Tuple[List[Union[Demo, RowMapping]], int]:
+        """
+        搜索Demo并在同一条查询中返回总数
+        
+        Args:
+            db: 数据库会话
+            search_params: 搜索参数
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+            include_owner: 是否批量加载所有者（整页只多一条查询）
+            
+        Returns:
+            Tuple[List[Union[Demo, RowMapping]], int]: (Demo列表, 总数)，
+            无搜索词且不附带所有者时为行映射列表
+        """
+        filters = build_search_filters(search_params)
+        term = get_search_term(search_params, cursor)
+        options = demo_crud.OWNER_LIST_OPTIONS if include_owner else None
+        if term:
+            return demo_crud.search_page(
+                db, term=term, skip=skip, limit=limit, filters=filters, options=options
+            )
+        
+        if not include_owner:
+            # 普通列表不构造ORM实例，行映射由 DemoListAdapter 整页校验
+            return demo_crud.get_page_rows(
+                db,
+                skip=skip,
+                limit=limit,
+                filters=filters,
+                order_by=self.SEARCH_ORDER,
+                cursor=cursor,
+                estimate_total=not filters  # 无筛选条件时允许使用估算总数
+            )
+        
+        return demo_crud.get_page(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=self.SEARCH_ORDER,
+            cursor=cursor,
+            estimate_total=not filters,  # 无筛选条件时允许使用估算总数
+            options=options
         )
     
     def get_user_demos(
@@ -228,7 +865,8 @@ class DemoService:
         *, 
         user_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Demo]:
         """
         获取用户的Demo列表
@@ -238,18 +876,48 @@ class DemoService:
             user_id: 用户ID
             skip: 跳过记录数
             limit: 限制记录数
+            cursor: 分页游标
             
         Returns:
             List[Demo]: Demo列表
         """
-        return demo_crud.get_by_owner(db, owner_id=user_id, skip=skip, limit=limit)
+        return demo_crud.get_by_owner(
+            db, owner_id=user_id, skip=skip, limit=limit, cursor=cursor
+        )
+    
+    def get_user_demos_page(
+        self, 
+        db: Session, 
+        *, 
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[RowMapping], int]:
+        """
+        以行映射形式获取用户的Demo列表及总数（单条查询）
+        
+        Args:
+            db: 数据库会话
+            user_id: 用户ID
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+            
+        Returns:
+            Tuple[List[RowMapping], int]: (Demo行映射列表, 总数)
+        """
+        return demo_crud.get_page_rows(
+            db, skip=skip, limit=limit, filters={"owner_id": user_id}, cursor=cursor
+        )
     
     def get_featured_demos(
         self, 
         db: Session, 
         *, 
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Demo]:
         """
         获取推荐Demo列表
@@ -258,11 +926,105 @@ class DemoService:
             db: 数据库会话
             skip: 跳过记录数
             limit: 限制记录数
+            cursor: 分页游标
             
         Returns:
             List[Demo]: 推荐Demo列表
         """
-        return demo_crud.get_featured(db, skip=skip, limit=limit)
+        return demo_crud.get_featured(db, skip=skip, limit=limit, cursor=cursor)
+    
+    def get_featured_demos_page(
+        self, 
+        db: Session, 
+        *, 
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[RowMapping], int]:
+        """
+        以行映射形式获取推荐Demo列表及总数（单条查询）
+        
+        Args:
+            db: 数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+            
+        Returns:
+            Tuple[List[RowMapping], int]: (推荐Demo行映射列表, 总数)
+        """
+        return demo_crud.get_page_rows(
+            db,
+            skip=skip,
+            limit=limit,
+            filters={"is_featured": True},
+            order_by=demo_crud.FEATURED_ORDER,
+            cursor=cursor
+        )
+    
+    def get_featured_demos_data(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        获取推荐列表当前页的JSON数据（见 featured_page_data），并发的相同请求合并为一次查询
+        
+        Args:
+            db: 数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+            
+        Returns:
+            Dict[str, Any]: items、total、next_cursor，并发请求共享，只读使用
+        """
+        def load() -> Dict[str, Any]:
+            demos, total = self.get_featured_demos_page(
+                db, skip=skip, limit=limit, cursor=cursor
+            )
+            return featured_page_data(demos, total, limit=limit)
+        
+        return single_flight.do(
+            "demos:featured",
+            load,
+            params=flight_params(skip=skip, limit=limit, cursor=cursor),
+            codec=JSON_CODEC
+        )
+    
+    def get_featured_demos_validators(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Validators:
+        """
+        通过 max(updated_at) + count 探测生成推荐列表的条件请求校验器
+        
+        推荐状态变化、编辑、删除都会改变最后更新时间或条数，分页参数参与 ETag 计算
+        
+        Args:
+            db: 数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+            
+        Returns:
+            Validators: 推荐列表校验器
+        """
+        latest, total = single_flight.do(
+            "demos:featured:version",
+            lambda: demo_crud.get_version(db, filters={"is_featured": True}),
+            params=flight_params()
+        )
+        return build_validators(
+            "demos:featured", skip, limit, cursor, latest, total, last_modified=latest
+        )
     
     def update_demo_status(
         self, 
@@ -289,24 +1051,16 @@ class DemoService:
             PermissionException: 权限不足
             BusinessException: 业务逻辑错误
         """
-        demo = self.get_demo_by_id(db, demo_id=demo_id)
-        
-        # 检查权限
-        if demo.owner_id != current_user_id:
-            raise PermissionException(
-                error="权限不足",
-                message="只有Demo的所有者可以更新状态"
-            )
-        
         # 验证状态值
-        valid_statuses = ["active", "inactive", "pending"]
-        if new_status not in valid_statuses:
-            raise BusinessException(
-                error="无效的状态值",
-                message=f"状态必须为以下值之一: {', '.join(valid_statuses)}"
-            )
+        validate_demo_status(new_status)
         
-        return demo_crud.update_status(db, demo_id=demo_id, new_status=new_status)
+        demo = demo_crud.update_status(
+            db, demo_id=demo_id, new_status=new_status, owner_id=current_user_id
+        )
+        if demo is None:
+            self._raise_not_updated(db, demo_id=demo_id, action="更新状态")
+        invalidate_demo_cache([demo], statistics=True)
+        return demo
     
     def set_demo_featured(
         self, 
@@ -332,34 +1086,90 @@ class DemoService:
             NotFoundException: Demo不存在
             PermissionException: 权限不足
         """
-        demo = self.get_demo_by_id(db, demo_id=demo_id)
+        demo = demo_crud.set_featured(
+            db, demo_id=demo_id, is_featured=is_featured, owner_id=current_user_id
+        )
+        if demo is None:
+            self._raise_not_updated(db, demo_id=demo_id, action="设置推荐状态")
+        invalidate_demo_cache([demo], featured=True, statistics=True)
+        return demo
+    
+    def update_demo_priority(
+        self, 
+        db: Session, 
+        *, 
+        demo_id: int, 
+        priority: int,
+        current_user_id: int
+    ) -> Demo:
+        """
+        更新Demo优先级
         
-        # 检查权限
-        if demo.owner_id != current_user_id:
-            raise PermissionException(
-                error="权限不足",
-                message="只有Demo的所有者可以设置推荐状态"
-            )
+        Args:
+            db: 数据库会话
+            demo_id: Demo ID
+            priority: 优先级
+            current_user_id: 当前用户ID
+            
+        Returns:
+            Demo: 更新后的Demo实例
+            
+        Raises:
+            NotFoundException: Demo不存在
+            PermissionException: 权限不足
+        """
+        demo = demo_crud.update_priority(
+            db, demo_id=demo_id, priority=priority, owner_id=current_user_id
+        )
+        if demo is None:
+            self._raise_not_updated(db, demo_id=demo_id, action="更新优先级")
+        invalidate_demo_cache([demo])
+        return demo
+    
+    def _raise_not_updated(self, db: Session, *, demo_id: int, action: str) -> NoReturn:
+        """
+        条件更新未命中任何行时区分原因
         
-        return demo_crud.set_featured(db, demo_id=demo_id, is_featured=is_featured)
+        Raises:
+            NotFoundException: Demo不存在或已删除
+            PermissionException: 当前用户不是所有者
+        """
+        self.get_demo_by_id(db, demo_id=demo_id)
+        raise owner_required(action)
     
     def get_demo_statistics(self, db: Session) -> Dict[str, Any]:
         """
         获取Demo统计信息
         
+        并发请求合并为一次查询；SINGLE_FLIGHT_BACKEND=redis 时跨进程合并
+        
         Args:
             db: 数据库会话
             
         Returns:
-            Dict[str, Any]: 统计信息
-        """
-        return {
-            "total": demo_crud.count(db, filters={"is_deleted": False}),
-            "active": demo_crud.count_by_status(db, status="active"),
-            "inactive": demo_crud.count_by_status(db, status="inactive"),
-            "pending": demo_crud.count_by_status(db, status="pending"),
-            "featured": demo_crud.count(db, filters={"is_featured": True, "is_deleted": False})
-        }
+            Dict[str, Any]: 统计信息（并发请求共享，只读使用）
+        """
+        return single_flight.do(
+            "demos:statistics",
+            lambda: self._load_statistics(db),
+            params=flight_params(),
+            codec=JSON_CODEC
+        )
+    
+    def _load_statistics(self, db: Session) -> Dict[str, Any]:
+        """
+        读取计数器或扫描统计
+        
+        计数器未初始化时退回扫描统计而不是在读请求中重建：
+        初始化由 scripts/rebuild_demo_counters.py 显式执行
+        """
+        if settings.DEMO_COUNTERS_ENABLED:
+            counters = demo_crud.get_counters(db)
+            if counters is not None:
+                return counters
+            logger.warning("Demo计数器未初始化，退回扫描统计；请执行 make counters")
+        
+        return demo_crud.get_statistics(db)
 
 
 # 创建全局服务实例
@@ -0,0 +1,245 @@
+"""
+登录统计记录器
+支持同步写入和延迟批量写入（write-behind）两种模式
+write-behind 模式下登录请求只在内存中累计，由后台任务定期批量写回数据库；
+缓冲区写满时唤醒后台任务提前刷新，登录请求本身不等待写回
+"""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import DateTime, Integer, bindparam, column, update, values
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.attributes import set_committed_value
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import writer_engine as default_engine
+from app.models.user import User
+from app.services.user_cache import user_cache
+
+logger = logging.getLogger(__name__)
+
+
+class LoginStatsRecorder:
+    """
+    登录统计记录器
+    按用户累计登录次数和最后登录时间，刷新时合并为一条 UPDATE 语句
+    """
+
+    def __init__(
+        self,
+        mode: str = settings.LOGIN_STATS_MODE,
+        flush_interval: float = settings.LOGIN_STATS_FLUSH_INTERVAL,
+        max_buffer: int = settings.LOGIN_STATS_MAX_BUFFER,
+        engine: Optional[Engine] = None
+    ):
+        self.mode = mode
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.engine = engine if engine is not None else default_engine
+        self._buffer: Dict[int, Tuple[int, datetime]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    @property
+    def write_behind(self) -> bool:
+        """是否为延迟批量写入模式"""
+        return self.mode == "write_behind"
+
+    @property
+    def pending(self) -> int:
+        """尚未写回数据库的用户数"""
+        return len(self._buffer)
+
+    def record(self, user_id: int, login_at: Optional[datetime] = None) -> int:
+        """
+        记录一次登录
+
+        Args:
+            user_id: 用户ID
+            login_at: 登录时间，默认为当前时间
+
+        Returns:
+            int: 该用户尚未写回数据库的登录次数（含本次）
+        """
+        login_at = login_at or datetime.utcnow()
+        with self._lock:
+            count, last_login_at = self._buffer.get(user_id, (0, login_at))
+            self._buffer[user_id] = (count + 1, max(last_login_at, login_at))
+            full = len(self._buffer) >= self.max_buffer
+
+        if full:
+            self._request_flush()
+        return count + 1
+
+    def _request_flush(self) -> None:
+        """
+        缓冲区已满时请求提前刷新，限制内存占用
+
+        后台任务运行时只唤醒它（可从任意线程调用）；未运行时（如脚本中直接使用）
+        在当前线程刷新，失败不影响登录请求
+        """
+        loop, wake = self._loop, self._wake
+        if loop is not None and wake is not None:
+            if wake.is_set():
+                return
+            try:
+                loop.call_soon_threadsafe(wake.set)
+                return
+            except RuntimeError:
+                # 应用关闭过程中事件循环已停止
+                pass
+        try:
+            self.flush()
+        except Exception:
+            logger.warning("登录统计缓冲区已满，写回失败，数据保留在缓冲区中", exc_info=True)
+
+    def apply(self, user: User) -> User:
+        """
+        记录一次登录，并在不标记为待提交的前提下更新实例上的登录信息
+
+        同时以更新后的值覆盖用户缓存：数据库中的值要到刷新时才写回，
+        在此之前 get_current_user 读取缓存，与登录响应中的登录信息一致
+
+        Args:
+            user: 已通过认证的用户实例
+
+        Returns:
+            User: 登录信息已更新的用户实例（数据库中的值由后续刷新写回）
+        """
+        self._apply(user)
+        user_cache.set(user)
+        return user
+
+    async def apply_async(self, user: User) -> User:
+        """记录一次登录（异步版本，参数和返回值同 apply，写缓存时不阻塞事件循环）"""
+        self._apply(user)
+        await user_cache.set_async(user)
+        return user
+
+    def _apply(self, user: User) -> None:
+        login_at = datetime.utcnow()
+        # 实例来自数据库，需加上此前尚未写回的登录次数
+        pending = self.record(user.id, login_at)
+        set_committed_value(user, "last_login_at", login_at)
+        set_committed_value(user, "login_count", (user.login_count or 0) + pending)
+
+    def flush(self) -> int:
+        """
+        将缓冲的登录统计写回数据库
+
+        Returns:
+            int: 写回的用户数
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, {}
+            if not batch:
+                return 0
+
+            rows = [
+                {"user_id": user_id, "increment": count, "login_at": login_at}
+                for user_id, (count, login_at) in batch.items()
+            ]
+            try:
+                with self.engine.begin() as conn:
+                    if conn.dialect.name == "postgresql":
+                        conn.execute(self._values_update(rows))
+                    else:
+                        conn.execute(self._executemany_update(), rows)
+            except Exception:
+                # 写回失败时把数据放回缓冲区，等待下次刷新
+                logger.exception("登录统计写回失败，%d 个用户的数据将在下次刷新时重试", len(rows))
+                self._restore(batch)
+                raise
+
+        # 刷新期间又有新登录的用户保留 apply 写入的缓存，等下次刷新后再失效
+        with self._lock:
+            written = [user_id for user_id in batch if user_id not in self._buffer]
+        for user_id in written:
+            user_cache.invalidate(user_id)
+        return len(rows)
+
+    def start(self) -> None:
+        """启动定期刷新任务（仅 write-behind 模式，需在事件循环中调用）"""
+        if self.write_behind and self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """停止定期刷新任务并写回剩余数据"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._loop = self._wake = None
+        try:
+            await run_in_threadpool(self.flush)
+        except Exception:
+            # 已记录日志，不阻塞应用关闭
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            # 每隔 flush_interval 刷新一次，缓冲区写满时被提前唤醒
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await run_in_threadpool(self.flush)
+            except Exception:
+                # 已记录日志，数据保留在缓冲区中
+                pass
+
+    def _restore(self, batch: Dict[int, Tuple[int, datetime]]) -> None:
+        with self._lock:
+            for user_id, (count, login_at) in batch.items():
+                pending_count, pending_at = self._buffer.get(user_id, (0, login_at))
+                self._buffer[user_id] = (count + pending_count, max(login_at, pending_at))
+
+    @staticmethod
+    def _values_update(rows):
+        """PostgreSQL: UPDATE users ... FROM (VALUES ...) 一条语句更新全部用户"""
+        batch = values(
+            column("user_id", Integer),
+            column("increment", Integer),
+            column("login_at", DateTime),
+            name="batch"
+        ).data([(row["user_id"], row["increment"], row["login_at"]) for row in rows])
+        return (
+            update(User)
+            .where(User.id == batch.c.user_id)
+            .values(
+                login_count=User.login_count + batch.c.increment,
+                last_login_at=batch.c.login_at
+            )
+        )
+
+    @staticmethod
+    def _executemany_update():
+        """其他数据库不支持带列名的 VALUES 派生表，使用 executemany 批量执行"""
+        return (
+            update(User)
+            .where(User.id == bindparam("user_id"))
+            .values(
+                login_count=User.login_count + bindparam("increment"),
+                last_login_at=bindparam("login_at")
+            )
+        )
+
+
+# 全局登录统计记录器实例
+login_stats = LoginStatsRecorder()
@@ -0,0 +1,171 @@
+"""
+认证用户缓存
+为 get_current_user 缓存用户快照，避免每个认证请求都查询数据库
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import DateTime
+
+from app.core.cache import CacheBackend, MemoryCacheBackend, get_shared_cache
+from app.core.config import settings
+from app.models.user import User
+
+# 不进入缓存的敏感字段
+_EXCLUDED_COLUMNS = {"hashed_password"}
+
+
+class UserCache:
+    """
+    两级用户缓存
+    一级为进程内LRU（短TTL，限制多进程间的失效延迟），二级为可选的共享缓存（Redis）
+
+    缓存的是列值快照，命中时构造一个未绑定会话的 User 实例返回，
+    因此调用方不能依赖其关系属性或密码哈希；
+    异步代码使用 *_async 方法，访问共享缓存时不阻塞事件循环
+    """
+
+    def __init__(
+        self,
+        local: Optional[CacheBackend] = None,
+        shared: Optional[CacheBackend] = None,
+        ttl: int = settings.CACHE_TTL,
+        local_ttl: int = settings.USER_CACHE_LOCAL_TTL,
+        enabled: bool = settings.USER_CACHE_ENABLED
+    ):
+        self.local = local if local is not None else MemoryCacheBackend(
+            max_size=settings.USER_CACHE_MAX_SIZE
+        )
+        self.shared = shared
+        self.ttl = ttl
+        self.local_ttl = min(local_ttl, ttl)
+        self.enabled = enabled
+        self._columns = [
+            column for column in User.__table__.columns
+            if column.key not in _EXCLUDED_COLUMNS
+        ]
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"user:{user_id}"
+
+    def get(self, user_id: int) -> Optional[User]:
+        """
+        获取缓存的用户
+
+        Args:
+            user_id: 用户ID
+
+        Returns:
+            Optional[User]: 未绑定会话的用户实例，未命中返回None
+        """
+        if not self.enabled:
+            return None
+
+        key = self._key(user_id)
+        raw = self.local.get(key)
+        if raw is None and self.shared is not None:
+            raw = self.shared.get(key)
+            if raw is not None:
+                self.local.set(key, raw, self.local_ttl)
+        if raw is None:
+            return None
+        return self._load(raw)
+
+    async def get_async(self, user_id: int) -> Optional[User]:
+        """
+        获取缓存的用户（异步版本，参数和返回值同 get）
+        """
+        if not self.enabled:
+            return None
+
+        key = self._key(user_id)
+        raw = self.local.get(key)
+        if raw is None and self.shared is not None:
+            raw = await self.shared.get_async(key)
+            if raw is not None:
+                self.local.set(key, raw, self.local_ttl)
+        if raw is None:
+            return None
+        return self._load(raw)
+
+    def set(self, user: User) -> None:
+        """
+        写入用户快照
+
+        Args:
+            user: 用户实例
+        """
+        if not self.enabled:
+            return
+
+        key = self._key(user.id)
+        raw = self._dump(user)
+        self.local.set(key, raw, self.local_ttl)
+        if self.shared is not None:
+            self.shared.set(key, raw, self.ttl)
+
+    async def set_async(self, user: User) -> None:
+        """
+        写入用户快照（异步版本）
+
+        Args:
+            user: 用户实例
+        """
+        if not self.enabled:
+            return
+
+        key = self._key(user.id)
+        raw = self._dump(user)
+        self.local.set(key, raw, self.local_ttl)
+        if self.shared is not None:
+            await self.shared.set_async(key, raw, self.ttl)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        使用户缓存失效（用户信息、状态或密码变更后调用）
+
+        Args:
+            user_id: 用户ID
+        """
+        key = self._key(user_id)
+        self.local.delete(key)
+        if self.shared is not None:
+            self.shared.delete(key)
+
+    async def invalidate_async(self, user_id: int) -> None:
+        """
+        使用户缓存失效（异步版本）
+
+        Args:
+            user_id: 用户ID
+        """
+        key = self._key(user_id)
+        self.local.delete(key)
+        if self.shared is not None:
+            await self.shared.delete_async(key)
+
+    def clear(self) -> None:
+        """清空所有用户缓存"""
+        self.local.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def _dump(self, user: User) -> str:
+        data = {column.key: getattr(user, column.key) for column in self._columns}
+        return json.dumps(jsonable_encoder(data), separators=(",", ":"))
+
+    def _load(self, raw: str) -> User:
+        data: Dict[str, Any] = json.loads(raw)
+        for column in self._columns:
+            value = data.get(column.key)
+            if isinstance(column.type, DateTime) and isinstance(value, str):
+                data[column.key] = datetime.fromisoformat(value)
+        return User(**data)
+
+
+# 全局用户缓存实例
+user_cache = UserCache(shared=get_shared_cache(settings.USER_CACHE_BACKEND))
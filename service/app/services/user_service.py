@@ -3,15 +3,33 @@
 处理用户相关的业务逻辑
 """
 
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import RowMapping
 from sqlalchemy.orm import Session
 
 from app.crud import user as user_crud
 from app.schemas.user import UserCreate, UserUpdate, UserPasswordUpdate
 from app.models.user import User
+from app.core.conditional import Validators, build_validators
 from app.core.response import BusinessException, NotFoundException
-from app.core.security import verify_password, get_password_hash
+from app.services.login_stats import login_stats
+from app.core.response_cache import response_cache
+from app.services.demo_service import DEMOS_OWNERS_TAG
+from app.services.user_cache import user_cache
+from app.core.hashing import password_hasher
+
+
+def user_validators(user: User) -> Validators:
+    """
+    由已加载的用户生成条件请求校验器（ETag / Last-Modified）
+    
+    Args:
+        user: 用户实例
+        
+    Returns:
+        Validators: 用户校验器
+    """
+    return build_validators("user", user.id, user.updated_at, last_modified=user.updated_at)
 
 
 class UserService:
@@ -30,6 +48,19 @@ class UserService:
             
         Raises:
             BusinessException: 业务逻辑错误
+            ServiceUnavailableException: 哈希任务排队已满
+        """
+        self._check_user_unique(db, user_in=user_in)
+        
+        # 创建用户
+        return user_crud.create(db, obj_in=user_in)
+    
+    def _check_user_unique(self, db: Session, *, user_in: UserCreate) -> None:
+        """
+        检查邮箱和用户名是否已被占用
+        
+        Raises:
+            BusinessException: 邮箱或用户名已存在
         """
         # 检查邮箱是否已存在
         existing_user = user_crud.get_by_email(db, email=user_in.email)
@@ -47,9 +78,6 @@ class UserService:
                     error="用户名已被占用",
                     message="该用户名已被其他用户使用"
                 )
-        
-        # 创建用户
-        return user_crud.create(db, obj_in=user_in)
     
     def get_user_by_id(self, db: Session, *, user_id: int) -> User:
         """
@@ -137,7 +165,11 @@ class UserService:
                     message="该用户名已被其他用户使用"
                 )
         
-        return user_crud.update(db, db_obj=user, obj_in=user_in)
+        user = user_crud.update(db, db_obj=user, obj_in=user_in)
+        user_cache.invalidate(user_id)
+        # 包含所有者信息的Demo响应随之失效
+        response_cache.invalidate(DEMOS_OWNERS_TAG)
+        return user
     
     def update_password(
         self, 
@@ -160,11 +192,12 @@ class UserService:
         Raises:
             NotFoundException: 用户不存在
             BusinessException: 业务逻辑错误
+            ServiceUnavailableException: 哈希任务排队已满
         """
         user = self.get_user_by_id(db, user_id=user_id)
         
         # 验证当前密码
-        if not verify_password(password_update.current_password, user.hashed_password):
+        if not password_hasher.verify(password_update.current_password, user.hashed_password):
             raise BusinessException(
                 error="当前密码错误",
                 message="请输入正确的当前密码"
@@ -178,13 +211,15 @@ class UserService:
             )
         
         # 检查新密码是否与当前密码相同
-        if verify_password(password_update.new_password, user.hashed_password):
+        if password_hasher.verify(password_update.new_password, user.hashed_password):
             raise BusinessException(
                 error="新密码与当前密码相同",
                 message="新密码不能与当前密码相同"
             )
         
-        return user_crud.update_password(db, db_obj=user, new_password=password_update.new_password)
+        user = user_crud.update_password(db, db_obj=user, new_password=password_update.new_password)
+        user_cache.invalidate(user_id)
+        return user
     
     def authenticate_user(
         self, 
@@ -203,18 +238,33 @@ class UserService:
             
         Returns:
             Optional[User]: 认证成功返回用户实例，失败返回None
+            
+        Raises:
+            ServiceUnavailableException: 哈希任务排队已满
         """
         user = user_crud.authenticate(db, email=email, password=password)
         if user and user_crud.is_active(user):
-            # 更新登录信息
-            user.last_login_at = datetime.utcnow()
-            user.login_count += 1
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-            return user
+            return self._record_login(db, user=user)
         return None
     
+    def _record_login(self, db: Session, *, user: User) -> User:
+        """
+        更新登录信息
+        
+        Args:
+            db: 数据库会话
+            user: 用户实例
+            
+        Returns:
+            User: 更新后的用户实例
+        """
+        if login_stats.write_behind:
+            return login_stats.apply(user)
+        
+        user = user_crud.record_login(db, user_id=user.id)
+        user_cache.invalidate(user.id)
+        return user
+    
     def deactivate_user(self, db: Session, *, user_id: int) -> User:
         """
         停用用户
@@ -230,7 +280,9 @@ class UserService:
             NotFoundException: 用户不存在
         """
         user = self.get_user_by_id(db, user_id=user_id)
-        return user_crud.deactivate(db, user_id=user_id)
+        user = user_crud.deactivate(db, user_id=user_id)
+        user_cache.invalidate(user_id)
+        return user
     
     def activate_user(self, db: Session, *, user_id: int) -> User:
         """
@@ -247,14 +299,17 @@ class UserService:
             NotFoundException: 用户不存在
         """
         user = self.get_user_by_id(db, user_id=user_id)
-        return user_crud.activate(db, user_id=user_id)
+        user = user_crud.activate(db, user_id=user_id)
+        user_cache.invalidate(user_id)
+        return user
     
     def get_users(
         self, 
         db: Session, 
         *, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[User]:
         """
         获取用户列表
@@ -263,11 +318,36 @@ class UserService:
             db: 数据库会话
             skip: 跳过记录数
             limit: 限制记录数
+            cursor: 分页游标
             
         Returns:
             List[User]: 用户列表
         """
-        return user_crud.get_multi(db, skip=skip, limit=limit)
+        return user_crud.get_multi(db, skip=skip, limit=limit, cursor=cursor)
+    
+    def get_users_page(
+        self, 
+        db: Session, 
+        *, 
+        skip: int = 0, 
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[RowMapping], int]:
+        """
+        以行映射形式获取用户列表及总数（单条查询，大表使用估算总数）
+        
+        Args:
+            db: 数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            cursor: 分页游标
+            
+        Returns:
+            Tuple[List[RowMapping], int]: (用户行映射列表, 总数)
+        """
+        return user_crud.get_page_rows(
+            db, skip=skip, limit=limit, cursor=cursor, estimate_total=True
+        )
     
     def count_users(self, db: Session) -> int:
         """
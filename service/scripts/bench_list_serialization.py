@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+列表序列化基准脚本
+对比Demo列表接口的两条转换路径：
+
+    orm:  get_multi -> [Demo.model_validate(obj) ...] -> paginated_response
+    rows: get_multi_rows -> DemoListAdapter 一次校验 -> paginated_response(raw=True)
+
+用法:
+    python scripts/bench_list_serialization.py                  # 默认 100 / 1000 条
+    python scripts/bench_list_serialization.py --sizes 100 5000 --repeat 50
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.core.response import paginated_response  # noqa: E402
+from app.crud import demo as demo_crud  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.models import Demo as DemoModel  # noqa: E402
+from app.schemas.demo import Demo, DemoListAdapter  # noqa: E402
+
+
+def seed(engine, count: int) -> None:
+    """填充测试数据"""
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(insert(DemoModel), [
+            {
+                "name": f"Demo {i}",
+                "description": f"第 {i} 条基准测试数据" if i % 2 else None,
+                "status": "active",
+                "priority": i % 10,
+                "is_featured": i % 10 == 0,
+                "is_deleted": False,
+                "owner_id": 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(count)
+        ])
+
+
+def orm_page(session_factory, limit: int) -> bytes:
+    """现有路径：ORM实例逐条 model_validate"""
+    with session_factory() as db:
+        demos = demo_crud.get_multi(db, limit=limit)
+        return paginated_response(
+            items=[Demo.model_validate(demo) for demo in demos],
+            total=limit, page=1, page_size=limit
+        ).body
+
+
+def rows_page(session_factory, limit: int) -> bytes:
+    """批量路径：行映射 + TypeAdapter 一次校验"""
+    with session_factory() as db:
+        rows = demo_crud.get_multi_rows(db, limit=limit)
+        items = DemoListAdapter.dump_python(DemoListAdapter.validate_python(rows), mode="json")
+        return paginated_response(
+            items=items, total=limit, page=1, page_size=limit, raw=True
+        ).body
+
+
+def measure(func, repeat: int) -> float:
+    """返回多次运行耗时的中位数（毫秒）"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    """运行基准"""
+    parser = argparse.ArgumentParser(description="对比列表接口的ORM与行映射转换路径")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000], help="每页条数")
+    parser.add_argument("--repeat", type=int, default=30, help="每种路径的重复次数")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    seed(engine, max(args.sizes))
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    print(f"{'条数':>6}  {'orm (ms)':>10}  {'rows (ms)':>10}  {'加速':>6}")
+    for size in args.sizes:
+        # 两条路径的输出必须一致（时间戳除外）
+        orm_body = orm_page(session_factory, size)
+        rows_body = rows_page(session_factory, size)
+        if orm_body.rsplit(b',"timestamp"', 1)[0] != rows_body.rsplit(b',"timestamp"', 1)[0]:
+            print(f"❌ {size} 条时两条路径输出不一致")
+            return 1
+
+        orm_ms = measure(lambda: orm_page(session_factory, size), args.repeat)
+        rows_ms = measure(lambda: rows_page(session_factory, size), args.repeat)
+        print(f"{size:>6}  {orm_ms:>10.2f}  {rows_ms:>10.2f}  {orm_ms / rows_ms:>5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+请求中间件微基准
+对比 /health 在两种中间件实现下的每秒请求数（直接调用ASGI应用，不含网络开销）：
+
+    legacy: 两个 @app.middleware("http")（BaseHTTPMiddleware）+ f-string 日志
+    asgi:   单个 InstrumentationMiddleware
+
+用法:
+    python scripts/bench_middleware.py
+    python scripts/bench_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import sys
+import time
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi import FastAPI, Request  # noqa: E402
+
+from app.core.instrumentation import InstrumentationMiddleware  # noqa: E402
+
+logger = logging.getLogger("bench.legacy")
+
+
+async def health_check():
+    return {"status": "healthy", "version": "1.0.0", "environment": "bench", "timestamp": time.time()}
+
+
+def legacy_app() -> FastAPI:
+    """原实现：两个 BaseHTTPMiddleware"""
+    app = FastAPI()
+    app.get("/health")(health_check)
+
+    @app.middleware("http")
+    async def add_process_time_header(request: Request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        response.headers["X-Process-Time"] = str(process_time)
+        return response
+
+    @app.middleware("http")
+    async def logging_middleware(request: Request, call_next):
+        start_time = time.time()
+        logger.info(f"📥 {request.method} {request.url.path} - {request.client.host if request.client else 'unknown'}")
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        logger.info(f"📤 {request.method} {request.url.path} - {response.status_code} - {process_time:.4f}s")
+        return response
+
+    return app
+
+
+def asgi_app() -> FastAPI:
+    """新实现：单个纯ASGI中间件"""
+    app = FastAPI()
+    app.get("/health")(health_check)
+    app.add_middleware(InstrumentationMiddleware)
+    return app
+
+
+async def run(app: FastAPI, requests: int) -> float:
+    """顺序发送请求，返回每秒请求数"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/health", "raw_path": b"/health",
+        "root_path": "", "query_string": b"", "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+
+    for _ in range(200):  # 预热
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return requests / (time.perf_counter() - start)
+
+
+def main():
+    """运行基准"""
+    parser = argparse.ArgumentParser(description="对比两种请求中间件实现的吞吐量")
+    parser.add_argument("--requests", type=int, default=5000, help="每轮请求数")
+    args = parser.parse_args()
+
+    handler = logging.StreamHandler(io.StringIO())
+    for name in ("bench.legacy", "app.access"):
+        logging.getLogger(name).addHandler(handler)
+        logging.getLogger(name).propagate = False
+
+    print(f"{'日志级别':<10}{'legacy (req/s)':>16}{'asgi (req/s)':>16}{'提升':>8}")
+    for level in (logging.INFO, logging.WARNING):
+        for name in ("bench.legacy", "app.access"):
+            logging.getLogger(name).setLevel(level)
+        legacy = asyncio.run(run(legacy_app(), args.requests))
+        new = asyncio.run(run(asgi_app(), args.requests))
+        print(f"{logging.getLevelName(level):<10}{legacy:>16.0f}{new:>16.0f}{new / legacy:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
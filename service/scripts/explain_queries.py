@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+查询计划检查脚本
+对 CRUDDemo / CRUDUser 的每个查询执行 EXPLAIN，标记出全表扫描
+
+用法:
+    python scripts/explain_queries.py                       # 内存SQLite，自动建表并填充数据
+    python scripts/explain_queries.py --database-url URL    # 检查已有数据库（需已迁移）
+    python scripts/explain_queries.py --database-url URL --seed 5000
+
+存在未预期的全表扫描时返回非零退出码，可用于CI
+"""
+
+import argparse
+import json
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, event, insert, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.crud import demo as demo_crud, user as user_crud  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.models import Demo, User  # noqa: E402
+
+STATUSES = ("active", "inactive", "pending")
+
+# 按主键顺序分页时，SQLite 以 rowid 顺序扫描并在 LIMIT 处停止，计划中同样显示为 SCAN
+PRIMARY_KEY_PAGE = "按主键顺序分页，扫描在 LIMIT 处停止"
+
+# (名称, 调用, 允许全表扫描的原因)
+CASES = [
+    ("demo.get", lambda db, ids: demo_crud.get(db, id=ids["demo"]), None),
+    ("demo.get_multi", lambda db, ids: demo_crud.get_multi(db, limit=20), PRIMARY_KEY_PAGE),
+    ("demo.get_page", lambda db, ids: demo_crud.get_page(
+        db, limit=20, filters={"status": "active"}), None),
+    ("demo.get_by_name", lambda db, ids: demo_crud.get_by_name(db, name="Demo 7"), None),
+    ("demo.get_by_owner", lambda db, ids: demo_crud.get_by_owner(
+        db, owner_id=ids["user"], limit=20), None),
+    ("demo.get_active", lambda db, ids: demo_crud.get_active(db, limit=20), None),
+    ("demo.get_featured", lambda db, ids: demo_crud.get_featured(db, limit=20), None),
+    ("demo.count_by_status", lambda db, ids: demo_crud.count_by_status(
+        db, status="pending"), None),
+    ("demo.search_by_name", lambda db, ids: demo_crud.search_by_name(
+        db, name_pattern="Demo 7", limit=20), None),
+    ("demo.get_statistics", lambda db, ids: demo_crud.get_statistics(db),
+     "全表聚合；需要O(1)统计时启用 DEMO_COUNTERS_ENABLED"),
+    ("user.get", lambda db, ids: user_crud.get(db, id=ids["user"]), None),
+    ("user.get_by_email", lambda db, ids: user_crud.get_by_email(
+        db, email="user7@example.com"), None),
+    ("user.get_by_username", lambda db, ids: user_crud.get_by_username(
+        db, username="user7"), None),
+    ("user.get_multi", lambda db, ids: user_crud.get_multi(db, limit=20), PRIMARY_KEY_PAGE),
+    ("user.count", lambda db, ids: user_crud.count(db), "全表计数"),
+]
+
+
+def seed(engine, demos: int) -> None:
+    """填充测试数据"""
+    users = max(demos // 20, 1)
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {
+                "email": f"user{i}@example.com",
+                "username": f"user{i}",
+                "hashed_password": "x",
+                "is_active": True,
+                "is_superuser": False,
+                "is_verified": False,
+                "is_deleted": False,
+                "login_count": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(users)
+        ])
+        user_ids = conn.execute(select(User.id)).scalars().all()
+        conn.execute(insert(Demo), [
+            {
+                "name": f"Demo {i}",
+                "status": STATUSES[i % len(STATUSES)],
+                "priority": i % 10,
+                "is_featured": i % 10 == 0,
+                "is_deleted": i % 25 == 0,
+                "owner_id": user_ids[i % len(user_ids)],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(demos)
+        ])
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql("ANALYZE users")
+            conn.exec_driver_sql("ANALYZE demos")
+        else:
+            conn.exec_driver_sql("ANALYZE")
+
+
+def capture_statements(engine, db, func, ids):
+    """执行一个CRUD调用并收集其发出的SELECT语句"""
+    statements = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_execute)
+    try:
+        func(db, ids)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_execute)
+    return statements
+
+
+def sequential_scans(conn, statement, parameters):
+    """
+    获取语句的查询计划和其中的全表扫描
+
+    Returns:
+        (计划摘要行列表, 被全表扫描的表名列表)
+    """
+    if conn.dialect.name == "postgresql":
+        raw = conn.exec_driver_sql(
+            "EXPLAIN (FORMAT JSON) " + statement, parameters
+        ).scalar()
+        plan = raw if isinstance(raw, list) else json.loads(raw)
+        lines, scans = [], []
+
+        def walk(node, depth=0):
+            relation = node.get("Relation Name")
+            index = node.get("Index Name")
+            label = node["Node Type"]
+            if relation:
+                label += f" on {relation}"
+            if index:
+                label += f" using {index}"
+            lines.append("  " * depth + label)
+            if node["Node Type"] == "Seq Scan":
+                scans.append(relation)
+            for child in node.get("Plans", []):
+                walk(child, depth + 1)
+
+        walk(plan[0]["Plan"])
+        return lines, scans
+
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    lines = [row[-1] for row in rows]
+    scans = [
+        match.group(1)
+        for match in (re.fullmatch(r"SCAN (\w+)", line.strip()) for line in lines)
+        if match
+    ]
+    return lines, scans
+
+
+def main():
+    """检查查询计划"""
+    parser = argparse.ArgumentParser(description="对CRUD查询执行EXPLAIN并标记全表扫描")
+    parser.add_argument("--database-url", default="sqlite://", help="数据库URL，默认内存SQLite")
+    parser.add_argument("--seed", type=int, default=None, help="填充的Demo数量（内存SQLite默认5000）")
+    args = parser.parse_args()
+
+    in_memory = args.database_url == "sqlite://"
+    engine_kwargs = {"poolclass": StaticPool} if in_memory else {}
+    engine = create_engine(args.database_url, **engine_kwargs)
+
+    if in_memory:
+        Base.metadata.create_all(bind=engine)
+    seed_count = args.seed if args.seed is not None else (5000 if in_memory else 0)
+    if seed_count:
+        print(f"🌱 填充 {seed_count} 条Demo数据...")
+        seed(engine, seed_count)
+
+    db = sessionmaker(bind=engine, autoflush=False)()
+    ids = {
+        "user": db.execute(select(User.id).limit(1)).scalar(),
+        "demo": db.execute(select(Demo.id).limit(1)).scalar(),
+    }
+    if ids["user"] is None or ids["demo"] is None:
+        print("❌ 数据库中没有数据，请使用 --seed 填充")
+        return 1
+
+    flagged = 0
+    with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            # 小数据量下规划器倾向于全表扫描；禁用后仍出现 Seq Scan 说明没有可用索引
+            conn.exec_driver_sql("SET enable_seqscan = off")
+
+        for name, func, allowed in CASES:
+            for statement, parameters in capture_statements(engine, db, func, ids):
+                lines, scans = sequential_scans(conn, statement, parameters)
+                if scans and not allowed:
+                    flagged += 1
+                    status = f"❌ 全表扫描: {', '.join(scans)}"
+                elif scans:
+                    status = f"⚠️  全表扫描（预期: {allowed}）"
+                else:
+                    status = "✅"
+                print(f"{status}  {name}")
+                for line in lines:
+                    print(f"      {line}")
+
+    db.close()
+    if flagged:
+        print(f"\n❌ 发现 {flagged} 个未预期的全表扫描")
+        return 1
+    print("\n🎉 所有查询均使用了索引")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
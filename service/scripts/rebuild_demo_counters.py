@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Demo计数器重建脚本
+启用 DEMO_COUNTERS_ENABLED 前初始化物化计数器，或在计数漂移时按当前数据重建。
+读请求在计数器未初始化时只退回扫描统计，不会自行重建
+
+用法:
+    python scripts/rebuild_demo_counters.py
+"""
+
+import sys
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.response_cache import response_cache  # noqa: E402
+from app.crud import demo as demo_crud  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.services.demo_service import DEMOS_STATISTICS_TAG  # noqa: E402
+
+
+def main():
+    """重建计数器并使统计缓存失效"""
+    print("🔄 重建Demo计数器...")
+    db = SessionLocal()
+    try:
+        counters = demo_crud.rebuild_counters(db)
+    finally:
+        db.close()
+    response_cache.invalidate(DEMOS_STATISTICS_TAG)
+
+    for name, value in counters.items():
+        print(f"   {name}: {value}")
+    print("✅ 重建完成")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,7 @@ from app.main import app
 from app.api.deps import get_db
 from app.db.base import Base
 from app.core.config import settings
+from app.core.response_cache import response_cache
 
 
 # 创建测试数据库引擎
@@ -45,6 +46,16 @@ def db() -> Generator:
         Base.metadata.drop_all(bind=test_engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache() -> Generator:
+    """
+    每个测试后清空响应缓存
+    夹具直接通过CRUD读写数据库，不经过服务层的缓存失效
+    """
+    yield
+    response_cache.backend.clear()
+
+
 @pytest.fixture(scope="module")
 def client() -> Generator:
     """
@@ -0,0 +1,112 @@
+"""
+异步CRUD层测试
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.response_cache import response_cache
+from app.crud import async_demo as demo_crud, demo as sync_demo_crud
+from app.db.base import Base
+from app.schemas.demo import DemoCreate
+from app.services import async_demo_service
+
+
+@pytest_asyncio.fixture
+async def async_db():
+    """
+    创建基于内存SQLite的异步数据库会话
+    """
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+class TestAsyncCRUD:
+    """异步CRUD测试类"""
+
+    @pytest.mark.asyncio
+    async def test_create_and_page(self, async_db):
+        """
+        测试异步创建、分页和软删除
+        """
+        for i in range(5):
+            await demo_crud.create(
+                async_db,
+                obj_in=DemoCreate(name=f"异步Demo{i}", priority=i % 2, owner_id=1)
+            )
+
+        items, total = await demo_crud.get_page(async_db, limit=2, order_by="-priority")
+        assert total == 5
+        assert [d.priority for d in items] == [1, 1]
+
+        deleted = await demo_crud.soft_delete(async_db, id=items[0].id)
+        assert deleted.is_deleted is True
+        assert await demo_crud.count(async_db) == 4
+
+    @pytest.mark.asyncio
+    async def test_cursor_shared_with_sync_crud(self, async_db):
+        """
+        测试异步CRUD与同步CRUD生成的游标一致
+        """
+        for i in range(4):
+            await demo_crud.create(
+                async_db, obj_in=DemoCreate(name=f"游标Demo{i}", owner_id=1)
+            )
+
+        first = await demo_crud.get_multi(async_db, limit=2)
+        cursor = sync_demo_crud.next_cursor(first, limit=2)
+        second = await demo_crud.get_multi(async_db, limit=2, cursor=cursor)
+
+        assert [d.id for d in first + second] == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_batch_operations(self, async_db):
+        """
+        测试异步批量创建、更新和软删除
+        """
+        created = await demo_crud.create_many(
+            async_db,
+            objs_in=[DemoCreate(name=f"批量Demo{i}", owner_id=1) for i in range(3)]
+        )
+        assert [demo.name for demo in created] == ["批量Demo0", "批量Demo1", "批量Demo2"]
+
+        updated = await demo_crud.update_many(
+            async_db, updates={created[0].id: {"priority": 5}, -1: {"priority": 1}}
+        )
+        assert [(demo.id, demo.priority) for demo in updated] == [(created[0].id, 5)]
+
+        deleted = await demo_crud.soft_delete_many(
+            async_db, ids=[created[1].id, created[2].id]
+        )
+        assert len(deleted) == 2
+        assert await demo_crud.count(async_db) == 1
+
+    @pytest.mark.asyncio
+    async def test_service_delete_invalidates_cache(self, async_db, monkeypatch):
+        """
+        测试异步服务删除Demo后使其响应缓存失效
+        """
+        demo = await demo_crud.create(async_db, obj_in=DemoCreate(name="删除Demo", owner_id=1))
+        invalidated = []
+
+        async def invalidate_async(*tags):
+            invalidated.extend(tags)
+
+        # 异步服务通过 invalidate_async 失效，不调用阻塞的 invalidate
+        monkeypatch.setattr(response_cache, "invalidate_async", invalidate_async)
+        monkeypatch.setattr(response_cache, "invalidate", None)
+
+        deleted = await async_demo_service.delete_demo(
+            async_db, demo_id=demo.id, current_user_id=1
+        )
+        assert deleted.is_deleted is True
+        assert f"demo:{demo.id}" in invalidated
+        assert "demos:statistics" in invalidated
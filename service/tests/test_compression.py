@@ -0,0 +1,140 @@
+"""
+响应压缩中间件测试
+"""
+
+import gzip
+import threading
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, available_encoders, negotiate_encoding
+
+LARGE = {"items": [{"id": i, "name": f"Demo {i}"} for i in range(200)]}
+
+
+def make_client(**options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/large")
+    def large(response: Response):
+        response.headers["ETag"] = 'W/"v1"'
+        return LARGE
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/not-modified")
+    def not_modified():
+        return Response(status_code=304, headers={"ETag": 'W/"v1"'})
+
+    @app.get("/binary")
+    def binary():
+        return Response(b"\0" * 4096, media_type="image/png")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"a" * 2048, b"b" * 2048]), media_type="text/plain")
+
+    return TestClient(app)
+
+
+class TestNegotiation:
+    """Accept-Encoding 协商测试"""
+
+    def test_negotiate(self):
+        supported = ["br", "zstd", "gzip"]
+        assert negotiate_encoding("gzip, deflate, br", supported) == "br"
+        assert negotiate_encoding("gzip;q=1.0, br;q=0.5", supported) == "gzip"
+        assert negotiate_encoding("br;q=0, gzip", supported) == "gzip"
+        assert negotiate_encoding("*", supported) == "br"
+        assert negotiate_encoding("*;q=0.5, br;q=0", supported) == "zstd"
+        assert negotiate_encoding("identity", supported) is None
+        assert negotiate_encoding("deflate", ["gzip"]) is None
+
+    def test_gzip_always_available(self):
+        encoders = available_encoders()
+        assert "gzip" in encoders
+        assert list(encoders)[-1] == "gzip"
+
+
+class TestCompressionMiddleware:
+    """压缩中间件行为测试"""
+
+    def test_compress_large_response(self):
+        client = make_client(minimum_size=500, encoders=available_encoders())
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert response.json() == LARGE
+
+    def test_skip_small_and_ineligible(self):
+        client = make_client(minimum_size=500)
+        headers = {"Accept-Encoding": "gzip"}
+
+        response = client.get("/small", headers=headers)
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+
+        assert client.get("/not-modified", headers=headers).status_code == 304
+        assert "content-encoding" not in client.get("/binary", headers=headers).headers
+        assert "content-encoding" not in client.get("/large", headers={"Accept-Encoding": "identity"}).headers
+
+        response = client.get("/stream", headers=headers)
+        assert "content-encoding" not in response.headers
+        assert len(response.content) == 4096
+
+    def test_cache_by_etag(self):
+        calls = []
+
+        def counting_gzip(data: bytes) -> bytes:
+            calls.append(len(data))
+            return gzip.compress(data, mtime=0)
+
+        client = make_client(minimum_size=500, cache_size=8, encoders={"gzip": counting_gzip})
+        for _ in range(3):
+            response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+            assert response.json() == LARGE
+        assert len(calls) == 1
+
+        # 不同查询参数视为不同资源
+        client.get("/large?page=2", headers={"Accept-Encoding": "gzip"})
+        assert len(calls) == 2
+
+    def test_large_body_compressed_in_threadpool(self):
+        """
+        测试不小于 threadpool_size 的响应体在线程池中压缩，较小的响应在事件循环中压缩
+        """
+        threads = []
+
+        def recording_gzip(data: bytes) -> bytes:
+            threads.append(threading.get_ident())
+            return gzip.compress(data, mtime=0)
+
+        app = FastAPI()
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=500,
+            encoders={"gzip": recording_gzip},
+            threadpool_size=4096
+        )
+        loop_threads = []
+
+        @app.get("/sized/{size}")
+        async def sized(size: int):
+            loop_threads.append(threading.get_ident())
+            return Response(b"a" * size, media_type="text/plain")
+
+        client = TestClient(app)
+        response = client.get("/sized/8192", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == b"a" * 8192
+        assert threads[-1] != loop_threads[-1]
+
+        client.get("/sized/1024", headers={"Accept-Encoding": "gzip"})
+        assert threads[-1] == loop_threads[-1]
@@ -0,0 +1,109 @@
+"""
+HTTP条件请求测试
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+from app.core.conditional import build_validators, is_not_modified
+from app.crud import demo as demo_crud
+from app.models.demo import Demo
+from app.schemas.demo import DemoCreate
+from app.services.demo_service import invalidate_demo_cache
+
+
+def make_request(**headers) -> Request:
+    return Request({
+        "type": "http",
+        "headers": [(key.replace("_", "-").encode(), value.encode()) for key, value in headers.items()],
+    })
+
+
+@pytest.fixture
+def demo(db: Session):
+    created = demo_crud.create(
+        db, obj_in=DemoCreate(name="条件请求Demo", is_featured=True, owner_id=1)
+    )
+    yield created
+    db.query(Demo).filter(Demo.id == created.id).delete(synchronize_session=False)
+    db.commit()
+    db.expunge(created)
+
+
+class TestValidators:
+    """校验器匹配规则测试"""
+
+    def test_if_none_match(self):
+        validators = build_validators("demo", 1, datetime(2024, 1, 1))
+        etag = validators.etag
+
+        assert etag.startswith('W/"')
+        assert is_not_modified(make_request(if_none_match=etag), validators)
+        # 弱比较：忽略 W/ 前缀，支持列表和 *
+        assert is_not_modified(make_request(if_none_match=etag[2:]), validators)
+        assert is_not_modified(make_request(if_none_match=f'"other", {etag}'), validators)
+        assert is_not_modified(make_request(if_none_match="*"), validators)
+        assert not is_not_modified(make_request(if_none_match='W/"other"'), validators)
+        assert not is_not_modified(make_request(), validators)
+
+    def test_if_modified_since(self):
+        validators = build_validators(
+            "demo", 1, last_modified=datetime(2024, 1, 1, 8, 0, 0, 500000)
+        )
+
+        assert is_not_modified(
+            make_request(if_modified_since="Mon, 01 Jan 2024 08:00:00 GMT"), validators
+        )
+        assert not is_not_modified(
+            make_request(if_modified_since="Mon, 01 Jan 2024 07:59:59 GMT"), validators
+        )
+        assert not is_not_modified(make_request(if_modified_since="invalid"), validators)
+        # If-None-Match 优先
+        assert not is_not_modified(
+            make_request(if_none_match='W/"other"', if_modified_since="Mon, 01 Jan 2024 09:00:00 GMT"),
+            validators
+        )
+
+
+class TestConditionalEndpoints:
+    """Demo接口条件请求测试"""
+
+    def test_demo_detail(self, client: TestClient, db: Session, demo):
+        url = f"/api/v1/demos/{demo.id}"
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["last-modified"].endswith("GMT")
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        future = (datetime.utcnow() + timedelta(days=1)).strftime("%a, %d %b %Y %H:%M:%S GMT")
+        assert client.get(url, headers={"If-Modified-Since": future}).status_code == 304
+
+        # 直接通过CRUD写入，需要像服务层一样使响应缓存失效
+        invalidate_demo_cache([demo_crud.update_priority(db, demo_id=demo.id, priority=5)])
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["data"]["priority"] == 5
+
+        response = client.get("/api/v1/demos/999999", headers={"If-None-Match": etag})
+        assert response.status_code == 404
+
+    def test_featured_list(self, client: TestClient, db: Session, demo):
+        url = "/api/v1/demos/featured?limit=5"
+        etag = client.get(url).headers["etag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+        # 分页参数不同的页面使用不同的 ETag
+        assert client.get(url + "&skip=5", headers={"If-None-Match": etag}).status_code == 200
+
+        updated = demo_crud.set_featured(db, demo_id=demo.id, is_featured=False)
+        invalidate_demo_cache([updated], featured=True)
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
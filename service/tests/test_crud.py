@@ -0,0 +1,579 @@
+"""
+CRUD层测试
+"""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud import demo as demo_crud
+from app.core.response import (
+    NotFoundException,
+    PermissionException,
+    ValidationException,
+    paginated_response,
+)
+from app.models.demo import Demo
+from app.models.demo_counter import DemoCounter
+from app.schemas.demo import (
+    Demo as DemoSchema,
+    DemoBatchUpdateItem,
+    DemoCreate,
+    DemoListAdapter,
+    DemoSearch,
+    DemoUpdate,
+)
+from app.services.demo_service import check_batch_update, demo_service
+
+
+@pytest.fixture
+def demos(db: Session):
+    """
+    创建一批优先级有重复的Demo
+    """
+    created = [
+        demo_crud.create(
+            db,
+            obj_in=DemoCreate(
+                name=f"分页Demo{i}",
+                priority=i % 3,
+                is_featured=i % 2 == 0,
+                owner_id=1
+            )
+        )
+        for i in range(10)
+    ]
+    yield created
+    db.query(Demo).filter(Demo.id.in_([d.id for d in created])).delete(
+        synchronize_session=False
+    )
+    db.commit()
+    # 批量删除不同步会话，SQLite 会复用被删除的ID，清空身份映射避免与之后插入的记录冲突
+    db.expunge_all()
+
+
+class TestCursorPagination:
+    """键集分页测试类"""
+
+    def test_cursor_pages_match_offset_pages(self, db: Session, demos):
+        """
+        测试游标翻页与偏移翻页结果一致
+        """
+        offset_ids = [
+            d.id for d in demo_crud.get_multi(db, limit=100, order_by="-priority")
+        ]
+
+        cursor_ids = []
+        cursor = None
+        while True:
+            page = demo_crud.get_multi(db, limit=3, order_by="-priority", cursor=cursor)
+            cursor_ids.extend(d.id for d in page)
+            cursor = demo_crud.next_cursor(page, limit=3, order_by="-priority")
+            if cursor is None:
+                break
+
+        assert cursor_ids == offset_ids
+
+    def test_cursor_order_mismatch(self, db: Session, demos):
+        """
+        测试游标与排序方式不匹配
+        """
+        page = demo_crud.get_multi(db, limit=2, order_by="-priority")
+        cursor = demo_crud.next_cursor(page, limit=2, order_by="-priority")
+
+        with pytest.raises(ValidationException):
+            demo_crud.get_multi(db, limit=2, cursor=cursor)
+
+    def test_cursor_rejects_nullable_order(self, db: Session, demos):
+        """
+        测试可为空的排序字段不支持游标分页
+        """
+        page = demo_crud.get_multi(db, limit=2, order_by="description")
+        assert demo_crud.next_cursor(page, limit=2, order_by="description") is None
+
+        cursor = demo_crud.next_cursor(page, limit=2)
+        with pytest.raises(ValidationException, match="不支持的分页方式"):
+            demo_crud.get_multi(db, limit=2, order_by="description", cursor=cursor)
+
+    def test_invalid_cursor(self, db: Session):
+        """
+        测试无效游标
+        """
+        with pytest.raises(ValidationException):
+            demo_crud.get_multi(db, limit=2, cursor="not-a-cursor")
+
+
+class TestGetPage:
+    """单条语句分页测试类"""
+
+    def test_items_and_total_in_one_query(self, db: Session, demos):
+        """
+        测试列表和总数只产生一条查询
+        """
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", before_execute)
+        try:
+            items, total = demo_crud.get_page(
+                db, skip=2, limit=3, filters={"is_featured": True}, order_by="-priority"
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", before_execute)
+
+        assert len(statements) == 1
+        assert total == demo_crud.count(db, filters={"is_featured": True})
+        assert [d.id for d in items] == [
+            d.id
+            for d in demo_crud.get_multi(
+                db, skip=2, limit=3, filters={"is_featured": True}, order_by="-priority"
+            )
+        ]
+
+    def test_cursor_page_total_ignores_cursor(self, db: Session, demos):
+        """
+        测试游标翻页时总数仍为全部匹配记录数
+        """
+        first = demo_crud.get_multi(db, limit=4, order_by="-priority")
+        cursor = demo_crud.next_cursor(first, limit=4, order_by="-priority")
+
+        items, total = demo_crud.get_page(db, limit=4, order_by="-priority", cursor=cursor)
+
+        assert total == demo_crud.count(db)
+        assert not {d.id for d in items} & {d.id for d in first}
+
+    def test_page_past_end(self, db: Session, demos):
+        """
+        测试超出末页时仍返回正确总数
+        """
+        items, total = demo_crud.get_page(db, skip=1000, limit=5)
+
+        assert items == []
+        assert total == demo_crud.count(db)
+
+    def test_featured_data_is_plain_json(self, db: Session, demos):
+        """
+        测试合并共享的推荐列表数据为JSON数据而不是ORM实例
+        """
+        data = demo_service.get_featured_demos_data(db, limit=2)
+        items, total = demo_service.get_featured_demos_page(db, limit=2)
+
+        assert data["total"] == total
+        assert [item["id"] for item in data["items"]] == [row["id"] for row in items]
+        assert all(isinstance(item, dict) for item in data["items"])
+        assert isinstance(data["items"][0]["created_at"], str)
+        assert data["next_cursor"] == demo_crud.next_cursor(
+            items, limit=2, order_by=demo_crud.FEATURED_ORDER
+        )
+
+
+class TestDemoStatistics:
+    """Demo统计测试类"""
+
+    def test_statistics_single_query(self, db: Session, demos):
+        """
+        测试统计信息由一条聚合查询得出且与逐项计数一致
+        """
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", before_execute)
+        try:
+            statistics = demo_crud.get_statistics(db)
+        finally:
+            event.remove(engine, "before_cursor_execute", before_execute)
+
+        assert len(statements) == 1
+        assert statistics == {
+            "total": demo_crud.count(db),
+            "active": demo_crud.count_by_status(db, status="active"),
+            "inactive": demo_crud.count_by_status(db, status="inactive"),
+            "pending": demo_crud.count_by_status(db, status="pending"),
+            "featured": demo_crud.count(db, filters={"is_featured": True}),
+        }
+
+    def test_counters_follow_writes(self, db: Session, demos, monkeypatch):
+        """
+        测试写操作增量维护物化计数器
+        """
+        monkeypatch.setattr(settings, "DEMO_COUNTERS_ENABLED", True)
+        demo_crud.rebuild_counters(db)
+
+        created = demo_crud.create(
+            db, obj_in=DemoCreate(name="计数Demo", status="pending", owner_id=1)
+        )
+        demo_crud.update_status(db, demo_id=demos[0].id, new_status="inactive")
+        demo_crud.set_featured(db, demo_id=demos[1].id, is_featured=True)
+        demo_crud.update(db, db_obj=demos[2], obj_in=DemoUpdate(is_featured=False))
+        demo_crud.soft_delete(db, id=demos[3].id)
+        demo_crud.soft_delete(db, id=created.id)
+
+        assert demo_crud.get_counters(db) == demo_crud.get_statistics(db)
+
+        db.query(Demo).filter(Demo.id == created.id).delete(synchronize_session=False)
+        db.query(DemoCounter).delete(synchronize_session=False)
+        db.commit()
+
+    def test_counters_use_locked_snapshot(self, db: Session, demos, monkeypatch):
+        """
+        测试基于过期实例更新时，计数增量按加锁读取的最新值计算
+        """
+        monkeypatch.setattr(settings, "DEMO_COUNTERS_ENABLED", True)
+        demo_crud.rebuild_counters(db)
+        stale = demos[4]
+        assert stale.is_featured
+
+        # 另一个请求先取消了推荐，本会话中的实例仍是旧值
+        with Session(db.get_bind()) as other:
+            demo_crud.set_featured(other, demo_id=stale.id, is_featured=False)
+        assert stale.is_featured
+
+        demo_crud.update(db, db_obj=stale, obj_in=DemoUpdate(is_featured=False))
+        assert demo_crud.get_counters(db) == demo_crud.get_statistics(db)
+
+        db.query(DemoCounter).delete(synchronize_session=False)
+        db.commit()
+
+    def test_uninitialized_counters_fall_back_without_writing(
+        self, db: Session, demos, monkeypatch
+    ):
+        """
+        测试计数器未初始化时统计退回扫描，读请求不写入计数器
+        """
+        monkeypatch.setattr(settings, "DEMO_COUNTERS_ENABLED", True)
+        assert demo_crud.get_counters(db) is None
+
+        assert demo_service._load_statistics(db) == demo_crud.get_statistics(db)
+        assert db.query(DemoCounter).count() == 0
+
+    def test_rebuild_counters_fixes_drift(self, db: Session, demos, monkeypatch):
+        """
+        测试重建补齐缺失的计数器行并覆盖漂移的值
+        """
+        monkeypatch.setattr(settings, "DEMO_COUNTERS_ENABLED", True)
+        demo_crud.rebuild_counters(db)
+        db.query(DemoCounter).filter(DemoCounter.name == "total").update({"value": 999})
+        db.query(DemoCounter).filter(DemoCounter.name == "featured").delete()
+        db.commit()
+
+        assert demo_crud.rebuild_counters(db) == demo_crud.get_statistics(db)
+        assert demo_crud.get_counters(db) == demo_crud.get_statistics(db)
+
+        db.query(DemoCounter).delete(synchronize_session=False)
+        db.commit()
+
+
+class TestDemoSearch:
+    """关键词搜索测试"""
+
+    @pytest.fixture
+    def documents(self, db: Session):
+        created = [
+            demo_crud.create(db, obj_in=DemoCreate(name=name, description=description, owner_id=1))
+            for name, description in [
+                ("Orchard planner", "schedules harvest work"),
+                ("Harvest tracker", "tracks orchard yields"),
+                ("Budget sheet", "monthly expenses"),
+                ("Harvest archive", None),
+            ]
+        ]
+        demo_crud.soft_delete(db, id=created[3].id)
+        yield created
+        db.query(Demo).filter(Demo.id.in_([d.id for d in created])).delete(
+            synchronize_session=False
+        )
+        db.commit()
+
+    def test_matches_name_and_description(self, db: Session, documents):
+        """
+        测试名称和描述都参与匹配，已删除记录被排除
+        """
+        results = demo_crud.search(db, term="harvest")
+        assert {demo.id for demo in results} == {documents[0].id, documents[1].id}
+
+    def test_name_match_ranked_first(self, db: Session, documents, monkeypatch):
+        """
+        测试名称命中排在仅描述命中之前（LIKE 后端）
+        """
+        monkeypatch.setattr(settings, "SEARCH_BACKEND", "like")
+        results = demo_crud.search(db, term="orchard")
+        assert [demo.id for demo in results] == [documents[0].id, documents[1].id]
+
+    def test_short_term_and_wildcards(self, db: Session, documents):
+        """
+        测试短关键词退回 LIKE，通配符按字面匹配
+        """
+        assert {demo.id for demo in demo_crud.search(db, term="ud")} == {documents[2].id}
+        assert demo_crud.search(db, term="%") == []
+
+    def test_search_page_total(self, db: Session, documents):
+        """
+        测试分页结果携带匹配总数，越过末页时仍返回总数
+        """
+        items, total = demo_crud.search_page(db, term="orchard", limit=1)
+        assert len(items) == 1
+        assert total == 2
+
+        items, total = demo_crud.search_page(db, term="orchard", skip=5, limit=1)
+        assert items == []
+        assert total == 2
+
+    def test_search_rejects_cursor(self, db: Session, documents):
+        """
+        测试关键词搜索不支持游标分页
+        """
+        with pytest.raises(ValidationException):
+            demo_service.search_demos_page(
+                db, search_params=DemoSearch(name="orchard"), cursor="abc"
+            )
+
+
+class TestBatchOperations:
+    """批量写入测试"""
+
+    def test_create_many_chunked(self, db: Session, monkeypatch):
+        """
+        测试批量创建按批次执行 INSERT ... RETURNING，不逐条刷新
+        """
+        monkeypatch.setattr(settings, "CRUD_BATCH_SIZE", 2)
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.get_bind(), "before_cursor_execute", before_execute)
+        try:
+            created = demo_crud.create_many(
+                db,
+                objs_in=[DemoCreate(name=f"批量Demo{i}", owner_id=1) for i in range(5)]
+            )
+            names = [demo.name for demo in created]
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", before_execute)
+
+        assert names == [f"批量Demo{i}" for i in range(5)]
+        assert all(demo.id and demo.created_at for demo in created)
+        assert [s.split()[0] for s in statements] == ["INSERT"] * 3
+
+        demo_crud.soft_delete_many(db, ids=[demo.id for demo in created])
+        db.query(Demo).filter(Demo.id.in_([d.id for d in created])).delete(
+            synchronize_session=False
+        )
+        db.commit()
+
+    def test_update_and_soft_delete_many(self, db: Session, demos, monkeypatch):
+        """
+        测试批量更新和批量软删除，并同步维护物化计数器
+        """
+        monkeypatch.setattr(settings, "DEMO_COUNTERS_ENABLED", True)
+        demo_crud.rebuild_counters(db)
+
+        updated = demo_crud.update_many(db, updates={
+            demos[0].id: DemoUpdate(status="inactive"),
+            demos[1].id: {"priority": 9, "is_featured": False},
+            -1: DemoUpdate(status="pending"),
+        })
+        assert [demo.id for demo in updated] == [demos[0].id, demos[1].id]
+        assert updated[0].status == "inactive"
+        assert (updated[1].priority, updated[1].is_featured) == (9, False)
+
+        deleted = demo_crud.soft_delete_many(db, ids=[demos[2].id, demos[2].id, -1])
+        assert [demo.id for demo in deleted] == [demos[2].id]
+        assert deleted[0].is_deleted and deleted[0].deleted_at
+        assert demo_crud.soft_delete_many(db, ids=[demos[2].id]) == []
+
+        assert demo_crud.get_counters(db) == demo_crud.get_statistics(db)
+        db.query(DemoCounter).delete(synchronize_session=False)
+        db.commit()
+
+    def test_check_batch_update(self, demos):
+        """
+        测试批量更新校验：不存在、无权限、名称冲突和请求内重复
+        """
+        items = [
+            DemoBatchUpdateItem(id=demos[0].id, name="新名称"),
+            DemoBatchUpdateItem(id=demos[1].id, name="新名称"),
+            DemoBatchUpdateItem(id=demos[0].id, priority=1),
+            DemoBatchUpdateItem(id=demos[2].id, status="unknown"),
+            DemoBatchUpdateItem(id=-1, priority=1),
+        ]
+        updates, failures = check_batch_update(
+            items, {demo.id: demo for demo in demos}, {}, current_user_id=1
+        )
+        assert list(updates) == [demos[0].id]
+        assert updates[demos[0].id].model_dump(exclude_unset=True) == {"name": "新名称"}
+        assert [failure.id for failure in failures] == [demos[1].id, demos[0].id, demos[2].id, -1]
+
+        _, failures = check_batch_update(
+            items[:1], {demo.id: demo for demo in demos}, {}, current_user_id=2
+        )
+        assert failures[0].error == "只有Demo的所有者可以更新Demo"
+
+
+class TestWriteRoundTrips:
+    """
+    写操作往返次数测试
+    原实现每次写入为 SELECT + UPDATE + refresh SELECT 三条语句，现为一条
+    """
+
+    @staticmethod
+    def count_statements(db: Session, func):
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.get_bind(), "before_cursor_execute", before_execute)
+        try:
+            result = func()
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", before_execute)
+        return result, statements
+
+    def test_single_field_updates(self, db: Session, demos):
+        """
+        测试状态/推荐/优先级更新和软删除各只发出一条 UPDATE ... RETURNING
+        """
+        updated_at = demos[0].updated_at
+        calls = [
+            lambda: demo_crud.update_status(db, demo_id=demos[0].id, new_status="pending"),
+            lambda: demo_crud.set_featured(db, demo_id=demos[0].id, is_featured=False),
+            lambda: demo_crud.update_priority(db, demo_id=demos[0].id, priority=7),
+            lambda: demo_crud.soft_delete(db, id=demos[1].id),
+        ]
+        for call in calls:
+            demo, statements = self.count_statements(db, call)
+            assert len(statements) == 1
+            assert statements[0].lstrip().startswith("UPDATE")
+
+        demo = demos[0]
+        assert (demo.status, demo.is_featured, demo.priority) == ("pending", False, 7)
+        assert demo.updated_at > updated_at
+        assert demos[1].is_deleted and demos[1].deleted_at
+        assert demo_crud.update_priority(db, demo_id=-1, priority=1) is None
+
+    def test_create_and_update_without_refresh(self, db: Session):
+        """
+        测试创建和更新后不再发出 refresh 查询，实例在提交后仍可直接读取
+        """
+        demo, statements = self.count_statements(
+            db, lambda: demo_crud.create(db, obj_in=DemoCreate(name="往返Demo", owner_id=1))
+        )
+        assert len(statements) == 1
+
+        _, statements = self.count_statements(
+            db, lambda: demo_crud.update(db, db_obj=demo, obj_in=DemoUpdate(priority=3))
+        )
+        assert len(statements) == 1
+
+        # 读取属性不触发重新加载
+        _, statements = self.count_statements(
+            db, lambda: (demo.id, demo.priority, demo.created_at, demo.updated_at)
+        )
+        assert statements == []
+
+        db.query(Demo).filter(Demo.id == demo.id).delete(synchronize_session=False)
+        db.commit()
+        # SQLite 会复用被删除的最大 rowid，移除残留实例以免身份映射冲突
+        db.expunge(demo)
+
+
+class TestConditionalUpdates:
+    """带所有权条件的单语句更新测试"""
+
+    def test_owner_update_single_statement(self, db: Session, demos):
+        """
+        测试所有者更新只发出一条带所有权条件的 UPDATE
+        """
+        demo, statements = TestWriteRoundTrips.count_statements(
+            db,
+            lambda: demo_service.update_demo_priority(
+                db, demo_id=demos[0].id, priority=8, current_user_id=1
+            )
+        )
+        assert demo.priority == 8
+        assert len(statements) == 1
+        assert "owner_id" in statements[0] and "is_deleted" in statements[0]
+
+    def test_not_found_and_forbidden(self, db: Session, demos):
+        """
+        测试未命中时区分Demo不存在（含已删除）和权限不足
+        """
+        with pytest.raises(PermissionException):
+            demo_service.update_demo_status(
+                db, demo_id=demos[0].id, new_status="pending", current_user_id=2
+            )
+        with pytest.raises(NotFoundException):
+            demo_service.set_demo_featured(
+                db, demo_id=-1, is_featured=True, current_user_id=1
+            )
+
+        demo_crud.soft_delete(db, id=demos[1].id)
+        with pytest.raises(NotFoundException):
+            demo_service.update_demo_priority(
+                db, demo_id=demos[1].id, priority=1, current_user_id=1
+            )
+        assert demo_crud.get(db, id=demos[0].id).status == "active"
+
+
+class TestMultiRows:
+    """行映射批量转换测试"""
+
+    def test_rows_match_orm_path(self, db: Session, demos):
+        """
+        测试 get_multi_rows + TypeAdapter + raw 输出与逐条 model_validate 一致
+        """
+        demo_crud.soft_delete(db, id=demos[0].id)
+        filters = {"owner_id": 1}
+        orm_items = demo_crud.get_multi(db, limit=5, filters=dict(filters))
+        rows = demo_crud.get_multi_rows(db, limit=5, filters=dict(filters))
+
+        assert [row["id"] for row in rows] == [demo.id for demo in orm_items]
+        assert demos[0].id not in [row["id"] for row in rows]
+
+        expected = paginated_response(
+            items=[DemoSchema.model_validate(demo) for demo in orm_items],
+            total=5, page=1, page_size=5
+        ).body
+        items = DemoListAdapter.dump_python(DemoListAdapter.validate_python(rows), mode="json")
+        body = paginated_response(items=items, total=5, page=1, page_size=5, raw=True).body
+        assert body.rsplit(b',"timestamp"', 1)[0] == expected.rsplit(b',"timestamp"', 1)[0]
+
+    def test_cursor_from_rows(self, db: Session, demos):
+        """
+        测试行映射可生成与模型实例相同的游标
+        """
+        rows = demo_crud.get_multi_rows(db, limit=3, order_by="priority")
+        orm_items = demo_crud.get_multi(db, limit=3, order_by="priority")
+        cursor = demo_crud.next_cursor(rows, limit=3, order_by="priority")
+        assert cursor == demo_crud.next_cursor(orm_items, limit=3, order_by="priority")
+
+        next_rows = demo_crud.get_multi_rows(db, limit=3, order_by="priority", cursor=cursor)
+        next_items = demo_crud.get_multi(db, limit=3, order_by="priority", cursor=cursor)
+        assert [row["id"] for row in next_rows] == [demo.id for demo in next_items]
+
+    def test_page_rows_match_get_page(self, db: Session, demos):
+        """
+        测试 get_page_rows 与 get_page 的当前页、总数一致，越过末页时仍返回总数
+        """
+        demo_crud.soft_delete(db, id=demos[0].id)
+        items, total = demo_crud.get_page(db, limit=3, order_by="priority")
+        rows, rows_total = demo_crud.get_page_rows(db, limit=3, order_by="priority")
+
+        assert rows_total == total
+        assert [row["id"] for row in rows] == [demo.id for demo in items]
+
+        cursor = demo_crud.next_cursor(rows, limit=3, order_by="priority")
+        items, total = demo_crud.get_page(db, limit=3, order_by="priority", cursor=cursor)
+        rows, rows_total = demo_crud.get_page_rows(db, limit=3, order_by="priority", cursor=cursor)
+        assert rows_total == total
+        assert [row["id"] for row in rows] == [demo.id for demo in items]
+
+        assert demo_crud.get_page_rows(db, skip=1000, limit=3) == ([], total)
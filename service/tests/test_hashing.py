@@ -0,0 +1,58 @@
+"""
+密码哈希服务测试
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.hashing import PasswordHasher
+from app.core.response import ServiceUnavailableException
+
+
+class TestPasswordHasher:
+    """密码哈希服务测试类"""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self):
+        """
+        测试哈希结果可以被验证
+        """
+        hasher = PasswordHasher(max_workers=0, max_pending=4)
+
+        hashed = await hasher.hash_async("secret123")
+
+        assert await hasher.verify_async("secret123", hashed) is True
+        assert await hasher.verify_async("wrong", hashed) is False
+        assert hasher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """
+        测试排队已满时返回503
+        """
+        hasher = PasswordHasher(max_workers=0, max_pending=1)
+
+        results = await asyncio.gather(
+            hasher.hash_async("first"), hasher.hash_async("second"), return_exceptions=True
+        )
+
+        assert isinstance(results[0], str)
+        assert isinstance(results[1], ServiceUnavailableException)
+        assert results[1].status_code == 503
+        assert hasher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self):
+        """
+        测试在进程池中计算哈希
+        """
+        hasher = PasswordHasher(max_workers=1, max_pending=4)
+        try:
+            hashed = await hasher.hash_async("secret123")
+            assert await hasher.verify_async("secret123", hashed) is True
+            # 同步方法在调用线程中等待同一进程池的结果
+            assert hasher.verify("secret123", hashed) is True
+            assert hasher.pending == 0
+        finally:
+            hasher.shutdown()
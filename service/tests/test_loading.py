@@ -0,0 +1,141 @@
+"""
+关系预加载测试
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud import demo as demo_crud
+from app.models.demo import Demo
+from app.models.user import User
+from app.schemas.demo import DemoCreate
+
+
+class StatementCounter:
+    """统计引擎上执行的SQL语句数"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self)
+
+
+@pytest.fixture
+def owned_demos(db: Session):
+    """
+    创建两个用户，各拥有三个Demo
+    """
+    owners = [
+        User(email=f"loader{i}@example.com", username=f"loader{i}", hashed_password="x")
+        for i in range(2)
+    ]
+    db.add_all(owners)
+    db.commit()
+    demos = [
+        demo_crud.create(
+            db, obj_in=DemoCreate(name=f"预加载Demo{i}", priority=100, owner_id=owners[i % 2].id)
+        )
+        for i in range(6)
+    ]
+    yield owners, demos
+    db.query(Demo).filter(Demo.id.in_([d.id for d in demos])).delete(synchronize_session=False)
+    db.query(User).filter(User.id.in_([u.id for u in owners])).delete(synchronize_session=False)
+    db.commit()
+    for obj in [*demos, *owners]:
+        db.expunge(obj)
+
+
+class TestLoaderOptions:
+    """CRUD加载选项测试"""
+
+    def test_list_owners_in_constant_queries(self, db: Session, owned_demos):
+        owners, demos = owned_demos
+        ids = [d.id for d in demos]
+
+        for limit in (2, 6):
+            with Session(bind=db.get_bind()) as session:
+                with StatementCounter(db.get_bind()) as counter:
+                    items, total = demo_crud.get_page(
+                        session,
+                        limit=limit,
+                        filters={"id": ids},
+                        options=demo_crud.OWNER_LIST_OPTIONS
+                    )
+                    names = {item.owner.username for item in items}
+                assert counter.count == 2
+                assert len(items) == limit and total == 6
+                assert names <= {owner.username for owner in owners}
+
+    def test_detail_owner_joined(self, db: Session, owned_demos):
+        owners, demos = owned_demos
+        with Session(bind=db.get_bind()) as session:
+            with StatementCounter(db.get_bind()) as counter:
+                demo = demo_crud.get(session, id=demos[1].id, options=demo_crud.OWNER_OPTIONS)
+                assert demo.owner.id == owners[1].id
+            assert counter.count == 1
+
+    def test_strict_loading_raises_on_lazy_access(self, db: Session, owned_demos, monkeypatch):
+        _, demos = owned_demos
+        monkeypatch.setattr(settings, "STRICT_LOADING", True)
+        with Session(bind=db.get_bind()) as session:
+            demo = demo_crud.get(session, id=demos[0].id)
+            with pytest.raises(InvalidRequestError):
+                demo.owner
+            # 显式预加载的关系不受影响
+            listed = demo_crud.get_multi(
+                session, filters={"id": demos[2].id}, options=demo_crud.OWNER_LIST_OPTIONS
+            )
+            assert listed[0].owner.username
+
+
+class TestIncludeOwner:
+    """include=owner 接口测试"""
+
+    def test_list_include_owner(self, client: TestClient, db: Session, owned_demos):
+        owners, _ = owned_demos
+        counts = []
+        for limit in (1, 3):
+            with StatementCounter(db.get_bind()) as counter:
+                response = client.get(
+                    "/api/v1/demos/",
+                    params={"owner_id": owners[0].id, "limit": limit, "include": "owner"}
+                )
+            counts.append(counter.count)
+            assert response.status_code == 200
+            items = response.json()["data"]["items"]
+            assert len(items) == limit
+            assert items[0]["owner"]["username"] == owners[0].username
+        assert counts[0] == counts[1]
+
+        plain = client.get("/api/v1/demos/", params={"owner_id": owners[0].id})
+        assert "owner" not in plain.json()["data"]["items"][0]
+
+    def test_detail_include_owner(self, client: TestClient, owned_demos):
+        owners, demos = owned_demos
+        url = f"/api/v1/demos/{demos[0].id}"
+        response = client.get(url, params={"include": "owner"})
+        assert response.status_code == 200
+        assert response.json()["data"]["owner"]["email"] == owners[0].email
+
+        etag = response.headers["etag"]
+        assert etag != client.get(url).headers["etag"]
+        cached = client.get(url, params={"include": "owner"}, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+    def test_unknown_include(self, client: TestClient, owned_demos):
+        _, demos = owned_demos
+        response = client.get(f"/api/v1/demos/{demos[0].id}", params={"include": "secrets"})
+        assert response.status_code == 422
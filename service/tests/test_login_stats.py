@@ -0,0 +1,144 @@
+"""
+登录统计记录器测试
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+from app.services.login_stats import LoginStatsRecorder
+from app.services.user_cache import user_cache
+
+
+@pytest.fixture
+def user(db: Session):
+    """
+    创建一个测试用户
+    """
+    obj = User(
+        email="login-stats@example.com",
+        username="login_stats",
+        hashed_password="x",
+        is_active=True,
+        is_superuser=False,
+        is_verified=False,
+        login_count=3,
+    )
+    db.add(obj)
+    db.commit()
+    db.refresh(obj)
+    yield obj
+    db.delete(obj)
+    db.commit()
+
+
+class TestLoginStatsRecorder:
+    """登录统计记录器测试类"""
+
+    def test_flush_applies_increments(self, db: Session, user):
+        """
+        测试多次登录合并为一次写回
+        """
+        recorder = LoginStatsRecorder(mode="write_behind", max_buffer=100, engine=db.get_bind())
+        first = datetime(2024, 5, 1, 8, 0, 0)
+        last = datetime(2024, 5, 1, 9, 0, 0)
+
+        recorder.record(user.id, last)
+        recorder.record(user.id, first)
+        assert recorder.pending == 1
+
+        assert recorder.flush() == 1
+        assert recorder.pending == 0
+
+        db.refresh(user)
+        assert user.login_count == 5
+        assert user.last_login_at == last
+
+    def test_apply_does_not_dirty_session(self, db: Session, user):
+        """
+        测试 apply 只更新实例上的值，不会在会话提交时重复写入
+        """
+        recorder = LoginStatsRecorder(mode="write_behind", max_buffer=100, engine=db.get_bind())
+
+        recorder.apply(user)
+
+        assert user.login_count == 4
+        assert user not in db.dirty
+        recorder.flush()
+        db.refresh(user)
+        assert user.login_count == 4
+
+    def test_apply_updates_user_cache(self, db: Session, user, monkeypatch):
+        """
+        测试写回前缓存中的用户已是登录后的值，写回后缓存失效
+        """
+        monkeypatch.setattr(user_cache, "enabled", True)
+        recorder = LoginStatsRecorder(mode="write_behind", max_buffer=100, engine=db.get_bind())
+
+        recorder.apply(user)
+
+        cached = user_cache.get(user.id)
+        assert cached.login_count == 4
+        assert cached.last_login_at == user.last_login_at
+
+        # 写回前再次登录：实例重新从数据库加载，缓存中应累计两次登录
+        db.expire(user)
+        recorder.apply(user)
+        assert user_cache.get(user.id).login_count == 5
+
+        recorder.flush()
+        assert user_cache.get(user.id) is None
+
+    def test_flush_buffer_full(self, db: Session, user):
+        """
+        测试后台任务未运行时，缓冲区满时立即写回
+        """
+        recorder = LoginStatsRecorder(mode="write_behind", max_buffer=1, engine=db.get_bind())
+
+        recorder.record(user.id)
+
+        assert recorder.pending == 0
+        db.refresh(user)
+        assert user.login_count == 4
+
+    @pytest.mark.asyncio
+    async def test_buffer_full_wakes_background_task(self, db: Session, user):
+        """
+        测试缓冲区满时唤醒后台任务写回，记录登录的调用方不等待
+        """
+        recorder = LoginStatsRecorder(
+            mode="write_behind", flush_interval=60, max_buffer=1, engine=db.get_bind()
+        )
+        recorder.start()
+        try:
+            recorder.record(user.id)
+            assert recorder.pending == 1
+
+            for _ in range(200):
+                if recorder.pending == 0:
+                    break
+                await asyncio.sleep(0.01)
+            assert recorder.pending == 0
+        finally:
+            await recorder.stop()
+
+        db.refresh(user)
+        assert user.login_count == 4
+
+    def test_postgresql_single_statement(self):
+        """
+        测试PostgreSQL下生成 UPDATE ... FROM (VALUES ...) 语句
+        """
+        statement = LoginStatsRecorder._values_update([
+            {"user_id": 1, "increment": 2, "login_at": datetime.utcnow()},
+            {"user_id": 2, "increment": 1, "login_at": datetime.utcnow()},
+        ])
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "FROM (VALUES" in sql
+        assert sql.count("UPDATE") == 1
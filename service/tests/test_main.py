@@ -3,6 +3,8 @@
 测试应用基础功能
 """
 
+import logging
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -44,3 +46,16 @@ def test_404_error(client: TestClient):
     assert data["success"] is False
     assert "error" in data
     assert "message" in data
+
+
+def test_process_time_and_access_log(client: TestClient, caplog):
+    """
+    测试计时响应头和结构化访问日志
+    """
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        response = client.get("/health")
+    
+    assert float(response.headers["x-process-time"]) >= 0
+    record = next(r for r in caplog.records if r.name == "app.access")
+    assert (record.method, record.path, record.status_code) == ("GET", "/health", 200)
+    assert record.duration_ms >= 0
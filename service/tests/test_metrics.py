@@ -0,0 +1,93 @@
+"""
+Prometheus 指标测试
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.core import metrics
+from app.core.hashing import PasswordHasher
+from app.core.response import ServiceUnavailableException
+from app.db import query_stats
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestRequestMetrics:
+    """HTTP请求指标测试"""
+
+    def test_route_labels_are_templated(self, client: TestClient):
+        before = sample(
+            "http_requests_total", method="GET", route="/api/v1/demos/{demo_id}", status="404"
+        )
+        client.get("/api/v1/demos/987654")
+        client.get("/api/v1/demos/987655")
+        client.get("/no/such/path")
+
+        assert sample(
+            "http_requests_total", method="GET", route="/api/v1/demos/{demo_id}", status="404"
+        ) == before + 2
+        assert sample("http_requests_total", method="GET", route="unmatched", status="404") >= 1
+        assert sample(
+            "http_request_duration_seconds_count", method="GET", route="/api/v1/demos/{demo_id}"
+        ) >= 2
+
+    def test_metrics_endpoint(self, client: TestClient):
+        client.get("/health")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        assert 'http_requests_total{method="GET",route="/health",status="200"}' in body
+        assert "db_pool_checked_out" in body
+        assert "password_hash_duration_seconds" in body
+
+
+class TestDatabaseMetrics:
+    """连接池与查询计数指标测试"""
+
+    def test_pool_gauges_and_query_count(self):
+        engine = create_engine(
+            "sqlite://", poolclass=metrics.TimedQueuePool, pool_size=1, max_overflow=2
+        )
+        metrics.instrument_engine(engine, "test")
+        query_stats.instrument_queries(engine)
+        assert isinstance(engine.pool, QueuePool)
+
+        stats = query_stats.start_request()
+        first, second = engine.connect(), engine.connect()
+        assert sample("db_pool_checked_out", engine="test") == 2
+        assert sample("db_pool_overflow", engine="test") == 1
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 2"))
+        assert stats.count == 2
+
+        first.close()
+        second.close()
+        assert sample("db_pool_checked_out", engine="test") == 0
+        assert sample("db_pool_overflow", engine="test") == 0
+        assert sample("db_pool_wait_seconds_count", engine="test") == 2
+        assert sample("db_connection_held_seconds_count", engine="test") == 2
+        engine.dispose()
+
+
+def test_password_hash_metrics():
+    """
+    测试哈希耗时和被拒绝次数写入 Prometheus
+    """
+    before = sample("password_hash_duration_seconds_count", operation="verify")
+    rejected = sample("password_hash_rejected_total")
+    hasher = PasswordHasher(max_workers=0, max_pending=1)
+    assert hasher.verify("secret", hasher.hash("secret")) is True
+
+    hasher.max_pending = 0
+    with pytest.raises(ServiceUnavailableException):
+        hasher.verify("secret", "x")
+
+    assert sample("password_hash_duration_seconds_count", operation="verify") == before + 1
+    assert sample("password_hash_rejected_total") == rejected + 1
@@ -0,0 +1,106 @@
+"""
+SQL查询统计测试
+"""
+
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.core.instrumentation import InstrumentationMiddleware
+from app.db import query_stats
+
+
+def make_engine():
+    engine = create_engine("sqlite://")
+    query_stats.instrument_queries(engine)
+    return engine
+
+
+class TestFingerprint:
+    """语句指纹测试"""
+
+    def test_literals_and_parameters_are_normalized(self):
+        assert query_stats.fingerprint(
+            "SELECT * FROM demos WHERE id = 1 AND title = 'a''b'"
+        ) == query_stats.fingerprint("SELECT *  FROM demos\nWHERE id = 42 AND title = 'x'")
+        assert query_stats.fingerprint(
+            "SELECT * FROM users WHERE id = %(id_1)s"
+        ) == "SELECT * FROM users WHERE id = ?"
+
+    def test_in_lists_collapse(self):
+        assert query_stats.fingerprint(
+            "SELECT * FROM users WHERE id IN (?, ?, ?)"
+        ) == query_stats.fingerprint("SELECT * FROM users WHERE id IN (?,?)")
+
+    def test_casts_are_kept(self):
+        assert query_stats.fingerprint("SELECT x::text FROM t") == "SELECT x::text FROM t"
+
+
+class TestRequestQueryStats:
+    """请求内查询统计测试"""
+
+    def test_counts_time_and_repeats(self):
+        engine = make_engine()
+        stats = query_stats.start_request()
+        with engine.connect() as conn:
+            for user_id in range(6):
+                conn.execute(text("SELECT :id"), {"id": user_id})
+            conn.execute(text("SELECT 1"))
+
+        assert stats.count == 7
+        assert stats.duration > 0
+        assert stats.repeated(5) == [("SELECT ?", 7)]
+        assert stats.repeated(8) == []
+        engine.dispose()
+
+    def test_failed_statement_does_not_leak_start_time(self):
+        engine = make_engine()
+        stats = query_stats.start_request()
+        with engine.connect() as conn:
+            try:
+                conn.execute(text("SELECT * FROM missing_table"))
+            except Exception:
+                pass
+            assert not conn.info.get("query_start_time")
+            conn.execute(text("SELECT 1"))
+        assert stats.count == 1
+        engine.dispose()
+
+    def test_slow_query_logged(self, monkeypatch, caplog):
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+        engine = make_engine()
+        with caplog.at_level(logging.WARNING, logger="app.db.query_stats"):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 'secret'"))
+        assert any("慢查询" in r.getMessage() and "SELECT ?" in r.getMessage() for r in caplog.records)
+        assert not any("secret" in r.getMessage() for r in caplog.records)
+        engine.dispose()
+
+
+def test_middleware_headers_and_n_plus_one_warning(caplog):
+    """
+    测试调试响应头和疑似 N+1 警告
+    """
+    engine = make_engine()
+    app = FastAPI()
+
+    @app.get("/items")
+    def items():
+        with engine.connect() as conn:
+            for item_id in range(3):
+                conn.execute(text("SELECT :id"), {"id": item_id})
+        return {"ok": True}
+
+    app.add_middleware(
+        InstrumentationMiddleware, expose_db_headers=True, n_plus_one_threshold=3
+    )
+    with caplog.at_level(logging.WARNING, logger="app.access"):
+        response = TestClient(app).get("/items")
+
+    assert response.headers["x-db-queries"] == "3"
+    assert float(response.headers["x-db-time"]) > 0
+    assert any("疑似N+1查询" in r.getMessage() for r in caplog.records)
+    engine.dispose()
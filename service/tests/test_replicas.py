@@ -0,0 +1,144 @@
+"""
+只读副本路由测试
+"""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from app.core.read_your_writes import ReadYourWritesMiddleware
+from app.db import replicas
+from app.db.replicas import ReplicaRoutingSession, ReplicaSet
+
+LocalBase = declarative_base()
+
+
+class Note(LocalBase):
+    __tablename__ = "notes"
+
+    id = Column(Integer, primary_key=True)
+    body = Column(String(50), nullable=False)
+
+
+def make_engine(path):
+    engine = create_engine(f"sqlite:///{path}")
+    LocalBase.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """
+    主库和一个落后的副本：副本中缺少主库的记录
+    """
+    primary = make_engine(tmp_path / "primary.db")
+    replica = make_engine(tmp_path / "replica.db")
+    with primary.begin() as conn:
+        conn.execute(Note.__table__.insert(), [{"body": "primary"}])
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def make_factory(primary, replica_set):
+    return sessionmaker(
+        class_=ReplicaRoutingSession, reader=primary, writer=primary, replicas=replica_set
+    )
+
+
+def bodies(session):
+    return session.scalars(select(Note.body)).all()
+
+
+class TestReplicaRouting:
+    """会话路由测试"""
+
+    def test_reads_use_replica_until_write(self, databases):
+        primary, replica = databases
+        factory = make_factory(primary, ReplicaSet([replica]))
+        preference = replicas.start_request()
+
+        with factory() as session:
+            assert bodies(session) == []
+            session.add(Note(body="edited"))
+            session.commit()
+            # 提交写入后本会话改读主库，并通知请求下发固定令牌
+            assert bodies(session) == ["primary", "edited"]
+        assert preference.wrote
+
+    def test_primary_preference(self, databases):
+        primary, replica = databases
+        factory = make_factory(primary, ReplicaSet([replica]))
+
+        replicas.start_request(primary=True)
+        with factory() as session:
+            assert bodies(session) == ["primary"]
+
+        preference = replicas.start_request()
+        with factory() as session:
+            assert bodies(session) == []
+        assert not preference.wrote
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_replicas_are_skipped(self, databases, tmp_path):
+        primary, replica = databases
+        missing = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        replica_set = ReplicaSet([missing, replica])
+        replicas.start_request()
+
+        await replica_set.check()
+        assert [r.healthy for r in replica_set.replicas] == [False, True]
+        assert all(replica_set.choose() is replica for _ in range(3))
+
+        # 延迟超过阈值的副本同样摘除，全部不可用时回退到主库
+        replica_set.max_lag = -1
+        await replica_set.check()
+        assert replica_set.choose() is None
+        with make_factory(primary, replica_set)() as session:
+            assert bodies(session) == ["primary"]
+        missing.dispose()
+
+
+def test_read_your_writes_middleware():
+    """
+    测试写入后固定令牌的下发和识别
+    """
+    app = FastAPI()
+
+    @app.get("/read")
+    def read():
+        return {"primary": replicas.current_preference().primary}
+
+    @app.post("/write")
+    def write():
+        replicas.current_preference().wrote = True
+        return {"primary": replicas.current_preference().primary}
+
+    app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=30)
+    client = TestClient(app)
+
+    assert client.get("/read").json() == {"primary": False}
+
+    response = client.post("/write")
+    assert response.json() == {"primary": True}
+    until = float(response.headers["x-primary-until"])
+    assert until > time.time()
+    assert "primary_until=" in response.headers["set-cookie"]
+
+    # Cookie 和请求头都可以携带令牌，过期令牌不再生效
+    assert client.get("/read").json() == {"primary": True}
+    client.cookies.clear()
+    assert client.get("/read", headers={"X-Primary-Until": str(until)}).json() == {"primary": True}
+    assert client.get("/read", headers={"X-Primary-Until": "1"}).json() == {"primary": False}
+    assert client.get("/read", headers={"X-Primary-Until": "bad"}).json() == {"primary": False}
+
+    # 远期令牌的截止时间不超过 sticky_seconds
+    middleware = ReadYourWritesMiddleware(app, sticky_seconds=30)
+    scope = {"headers": [(b"x-primary-until", b"99999999999")]}
+    assert middleware._sticky_until(scope) <= time.time() + 30
+    scope = {"headers": [(b"x-primary-until", b"inf")]}
+    assert middleware._sticky_until(scope) <= time.time() + 30
@@ -0,0 +1,110 @@
+"""
+响应格式测试
+"""
+
+import enum
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from app.core.response import (
+    APIResponse,
+    FastJSONResponse,
+    PaginatedResponse,
+    dump_json,
+    error_response,
+    paginated_response,
+    render_envelope,
+    success_response,
+)
+from app.schemas.demo import Demo
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+
+
+def legacy_body(**fields) -> bytes:
+    """原实现：APIResponse 模型 + model_dump(mode="json") + JSONResponse"""
+    response = APIResponse(**fields)
+    return JSONResponse(content=response.model_dump(mode="json", exclude_none=True)).body
+
+
+def make_demo(i: int) -> Demo:
+    now = datetime(2024, 5, 1, 12, 0, i, 123456)
+    return Demo(
+        id=i, name=f"Demo{i}", description=None if i % 2 else "描述\"引号\"\n换行",
+        status="active", is_featured=bool(i % 2), priority=i, owner_id=1,
+        is_deleted=False, deleted_at=None, created_at=now, updated_at=now,
+    )
+
+
+TIMESTAMP = datetime(2024, 5, 1, 12, 0, 0, 654321)
+
+PAYLOADS = [
+    None,
+    {"a": None, "nested": [{"b": None}], 1: "int key"},
+    {"text": "中文 emoji 😀   \x1f", "float": 0.1, "big": 2 ** 60, "neg": -1.5e-10},
+    {"aware": datetime(2024, 1, 1, tzinfo=timezone.utc), "date": date(2024, 1, 1),
+     "delta": timedelta(seconds=90), "decimal": Decimal("1.50"), "uuid": uuid.UUID(int=1),
+     "enum": Color.RED, "tuple": (1, 2), "naive": datetime(2024, 1, 1)},
+    [make_demo(1), make_demo(2)],
+    "plain string",
+]
+
+
+class TestFastEnvelope:
+    """orjson 信封序列化与原 APIResponse 输出逐字节一致"""
+
+    @pytest.mark.parametrize("data", PAYLOADS)
+    def test_success_envelope_identical(self, data):
+        expected = legacy_body(success=True, message="操作成功", data=data, timestamp=TIMESTAMP)
+        assert render_envelope(True, "操作成功", data=data, timestamp=TIMESTAMP) == expected
+
+    @pytest.mark.parametrize("data", [None, {"field": "name"}])
+    def test_error_envelope_identical(self, data):
+        expected = legacy_body(
+            success=False, message="操作失败", error="错误", data=data, timestamp=TIMESTAMP
+        )
+        assert render_envelope(
+            False, "操作失败", data=data, error="错误", timestamp=TIMESTAMP
+        ) == expected
+
+    def test_paginated_identical(self, monkeypatch):
+        """分页数据不再经过 PaginatedResponse 模型，输出保持不变"""
+        items = [make_demo(i) for i in range(3)]
+        pagination = PaginatedResponse(
+            items=items, total=7, page=1, page_size=3, total_pages=3,
+            has_next=True, has_prev=False, next_cursor=None
+        )
+        expected = legacy_body(
+            success=True, message="获取数据成功", data=pagination.model_dump(), timestamp=TIMESTAMP
+        )
+
+        monkeypatch.setattr(
+            "app.core.response.render_envelope",
+            lambda *args, **kwargs: render_envelope(*args, timestamp=TIMESTAMP, **kwargs)
+        )
+        response = paginated_response(items=items, total=7, page=1, page_size=3)
+        assert response.body == expected
+
+    def test_response_helpers(self):
+        response = success_response({"id": 1}, status_code=201)
+        assert isinstance(response, FastJSONResponse)
+        assert response.status_code == 201
+        assert response.headers["content-type"] == "application/json"
+        assert response.body.startswith(b'{"success":true,"message":"\xe6\x93\x8d')
+
+        response = error_response("错误", status_code=404)
+        assert response.status_code == 404
+        body = response.body
+        assert body.startswith(b'{"success":false,') and b'"error":"\xe9\x94\x99\xe8\xaf\xaf"' in body
+
+    def test_default_response_class(self):
+        """未经 success_response 的普通返回值也使用 orjson 且格式与 JSONResponse 一致"""
+        content = {"status": "ok", "items": [1, 2.5, "中文", None, True]}
+        assert FastJSONResponse(content).body == JSONResponse(content).body
+        assert dump_json(content) == JSONResponse(content).body
@@ -0,0 +1,180 @@
+"""
+响应缓存测试
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core import response_cache as response_cache_module
+from app.core.cache import MemoryCacheBackend
+from app.core.conditional import build_validators
+from app.core.response import success_response
+from app.core.response_cache import PUBLIC_SCOPE, ResponseCache, auth_scope
+from app.models.demo import Demo
+from app.models.user import User
+from app.schemas.demo import DemoCreate
+from app.services.demo_service import demo_service
+
+
+def make_cache(**kwargs) -> ResponseCache:
+    return ResponseCache(backend=MemoryCacheBackend(), ttl=60, enabled=True, **kwargs)
+
+
+def cache_response(cache: ResponseCache, key: str, tags, data, validators=None):
+    pending = cache.start(key, tags)
+    return cache.store(pending, success_response(data=data), validators)
+
+
+class TestResponseCache:
+    """缓存与标签失效测试"""
+
+    def test_key_is_normalized(self):
+        assert ResponseCache.key("demos:list", {"limit": 20, "skip": 0, "name": None}) == (
+            ResponseCache.key("demos:list", {"skip": 0, "limit": 20})
+        )
+        assert ResponseCache.key("demos:list", scope="user") != ResponseCache.key("demos:list")
+        assert auth_scope(None) == PUBLIC_SCOPE
+        assert auth_scope(User(is_superuser=True)) == "superuser"
+
+    def test_hit_and_tag_invalidation(self):
+        cache = make_cache()
+        response = cache_response(cache, "a", ["demo:1", "demos:list"], {"id": 1})
+        assert response.headers["x-cache"] == "miss"
+
+        cached = cache.get("a")
+        assert cached is not None
+        assert cached.body == response.body
+
+        cache.invalidate("demo:2")
+        assert cache.get("a") is not None
+        cache.invalidate("demos:list")
+        assert cache.get("a") is None
+
+    def test_write_during_generation_is_not_served(self):
+        cache = make_cache()
+        pending = cache.start("a", ["demo:1"])
+        # 查询进行期间发生写入：写入的条目已基于旧版本，读取时视为未命中
+        cache.invalidate("demo:1")
+        cache.store(pending, success_response(data={"id": 1}))
+        assert cache.get("a") is None
+
+    def test_only_ok_responses_are_cached(self):
+        cache = make_cache()
+        pending = cache.start("a", [])
+        cache.store(pending, success_response(data={"id": 1}, status_code=201))
+        assert cache.get("a") is None
+
+    def test_validators_are_kept(self):
+        cache = make_cache()
+        validators = build_validators("demo", 1, last_modified=datetime(2024, 1, 1, 8))
+        cache_response(cache, "a", [], {"id": 1}, validators)
+        assert cache.get("a").validators == validators
+
+    def test_early_refresh(self, monkeypatch):
+        cache = make_cache(beta=1.0)
+        pending = cache.start("a", [])
+        # 生成耗时 10 秒的条目在有效期（60 秒）内就可能被选中提前刷新
+        cache.store(pending._replace(started=pending.started - 10), success_response(data=1))
+
+        monkeypatch.setattr(response_cache_module.random, "random", lambda: 0.0)
+        assert cache.get("a") is not None
+        monkeypatch.setattr(response_cache_module.random, "random", lambda: 0.999)
+        assert cache.get("a") is None
+        cache.beta = 0
+        assert cache.get("a") is not None
+
+    def test_settle_window_after_invalidation(self):
+        cache = make_cache(settle_seconds=30)
+        cache_response(cache, "a", ["demo:1"], {"id": 1})
+        assert cache.get("a") is not None
+
+        # 失效后的复制延迟窗口内，副本上可能仍是旧数据，生成的响应不写入缓存
+        cache.invalidate("demo:1")
+        cache_response(cache, "a", ["demo:1"], {"id": 1})
+        assert cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_async_api(self):
+        cache = make_cache()
+        pending = await cache.start_async("a", ["demo:1"])
+        response = await cache.store_async(pending, success_response(data={"id": 1}))
+        assert response.headers["x-cache"] == "miss"
+
+        # 与同步方法读写同一份条目和标签版本
+        cached = await cache.get_async("a")
+        assert cached is not None
+        assert cached.body == cache.get("a").body
+
+        await cache.invalidate_async("demo:1")
+        assert await cache.get_async("a") is None
+        assert cache.get("a") is None
+
+    def test_disabled(self):
+        cache = ResponseCache(backend=MemoryCacheBackend(), enabled=False)
+        assert cache.start("a", ["demo:1"]) is None
+        assert cache_response(cache, "a", ["demo:1"], 1).headers.get("x-cache") is None
+        assert cache.get("a") is None
+
+
+@pytest.fixture
+def owner(db: Session):
+    user = User(email="cache@example.com", username="cache", hashed_password="x")
+    db.add(user)
+    db.commit()
+    yield user
+    db.query(Demo).filter(Demo.owner_id == user.id).delete(synchronize_session=False)
+    db.query(User).filter(User.id == user.id).delete(synchronize_session=False)
+    db.commit()
+    db.expunge_all()
+
+
+class TestCachedEndpoints:
+    """Demo读接口缓存测试"""
+
+    def test_statistics_invalidated_by_service_writes(self, client: TestClient, db: Session, owner):
+        url = "/api/v1/demos/statistics"
+        first = client.get(url)
+        assert first.headers["x-cache"] == "miss"
+        assert client.get(url).headers["x-cache"] == "hit"
+
+        demo_service.create_demo(
+            db, demo_in=DemoCreate(name="缓存Demo", owner_id=owner.id), current_user_id=owner.id
+        )
+        response = client.get(url)
+        assert response.headers["x-cache"] == "miss"
+        assert response.json()["data"]["total"] == first.json()["data"]["total"] + 1
+
+    def test_detail_and_featured_tags(self, client: TestClient, db: Session, owner):
+        demo = demo_service.create_demo(
+            db,
+            demo_in=DemoCreate(name="推荐缓存Demo", is_featured=True, owner_id=owner.id),
+            current_user_id=owner.id
+        )
+        detail_url = f"/api/v1/demos/{demo.id}"
+        featured_url = "/api/v1/demos/featured"
+        mine_url = f"/api/v1/demos/?owner_id={owner.id}"
+        for url in (detail_url, featured_url, mine_url):
+            assert client.get(url).headers["x-cache"] == "miss"
+
+        # 命中的缓存同样支持条件请求
+        cached = client.get(detail_url)
+        assert cached.headers["x-cache"] == "hit"
+        not_modified = client.get(detail_url, headers={"If-None-Match": cached.headers["etag"]})
+        assert not_modified.status_code == 304
+
+        demo_service.update_demo_priority(
+            db, demo_id=demo.id, priority=7, current_user_id=owner.id
+        )
+        for url in (detail_url, featured_url, mine_url):
+            assert client.get(url).headers["x-cache"] == "miss"
+        assert client.get(detail_url).json()["data"]["priority"] == 7
+
+        # 不相关的标签失效不影响其他条目
+        assert client.get("/api/v1/demos/statistics").headers["x-cache"] == "miss"
+        demo_service.update_demo_priority(
+            db, demo_id=demo.id, priority=8, current_user_id=owner.id
+        )
+        assert client.get("/api/v1/demos/statistics").headers["x-cache"] == "hit"
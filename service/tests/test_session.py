@@ -0,0 +1,79 @@
+"""
+数据库连接提前归还测试
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from app.db.session import release_async_connection, release_connection
+
+LocalBase = declarative_base()
+
+
+class Note(LocalBase):
+    __tablename__ = "notes"
+
+    id = Column(Integer, primary_key=True)
+    body = Column(String(50), nullable=False)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'release.db'}")
+    LocalBase.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(Note.__table__.insert(), [{"body": "first"}])
+    yield engine
+    engine.dispose()
+
+
+def test_release_returns_connection(engine):
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        # 创建会话不借出连接，第一次查询时才借出
+        assert engine.pool.checkedout() == 0
+        note = session.scalars(select(Note)).one()
+        assert engine.pool.checkedout() == 1
+
+        release_connection(session)
+        assert engine.pool.checkedout() == 0
+        # 已加载的实例没有过期，读取属性不会再次借出连接
+        assert note.body == "first"
+        assert engine.pool.checkedout() == 0
+
+        # 之后的查询重新借出连接
+        assert session.scalars(select(Note.body)).all() == ["first"]
+        assert engine.pool.checkedout() == 1
+        assert session.expire_on_commit
+
+
+def test_release_keeps_pending_changes(engine):
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        session.scalars(select(Note)).one().body = "edited"
+        release_connection(session)
+        # 有未提交的修改时不会替调用方提交
+        assert engine.pool.checkedout() == 1
+        session.rollback()
+    with engine.connect() as conn:
+        assert conn.execute(select(Note.body)).scalars().all() == ["first"]
+
+
+@pytest.mark.asyncio
+async def test_release_async_connection(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'release.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(LocalBase.metadata.create_all)
+        await conn.execute(Note.__table__.insert(), [{"body": "first"}])
+
+    factory = async_sessionmaker(bind=engine)
+    async with factory() as session:
+        note = (await session.scalars(select(Note))).one()
+        assert engine.pool.checkedout() == 1
+        await release_async_connection(session)
+        assert engine.pool.checkedout() == 0
+        assert note.body == "first"
+        assert session.sync_session.expire_on_commit
+    await engine.dispose()
@@ -0,0 +1,294 @@
+"""
+热点查询合并测试
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.cache import MemoryCacheBackend
+from app.core.singleflight import JSON_CODEC, SingleFlight, flight_key
+
+
+def shared_count(name: str) -> float:
+    return REGISTRY.get_sample_value("single_flight_shared_total", {"name": name}) or 0
+
+
+def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "等待超时"
+        time.sleep(0.005)
+
+
+def test_flight_key_normalizes_params():
+    assert flight_key("demos:featured", {"limit": 20, "skip": 0}) == flight_key(
+        "demos:featured", {"skip": 0, "limit": 20}
+    )
+    assert flight_key("demos:featured", {"skip": 0}) != flight_key("demos:featured", {"skip": 20})
+    assert flight_key("demos:statistics") == "demos:statistics"
+
+
+class TestSingleFlight:
+    """进程内合并测试"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight(enabled=True)
+        name = "test:sync"
+        before = shared_count(name)
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def query():
+            calls.append(1)
+            release.wait(2)
+            return {"total": 3}
+
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do(name, query, params={"skip": 0})))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        # 五个调用加入进行中的查询后再放行
+        wait_for(lambda: shared_count(name) - before == 5)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"total": 3}] * 6
+        # 查询完成后不再合并，下一次调用重新执行
+        flight.do(name, query, params={"skip": 0})
+        assert len(calls) == 2
+
+    def test_errors_are_shared(self):
+        flight = SingleFlight(enabled=True)
+        name = "test:error"
+        before = shared_count(name)
+        release = threading.Event()
+        errors = []
+
+        def query():
+            release.wait(2)
+            raise RuntimeError("数据库不可用")
+
+        def call():
+            try:
+                flight.do(name, query)
+            except RuntimeError as exc:
+                errors.append(str(exc))
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: shared_count(name) - before == 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert errors == ["数据库不可用"] * 3
+
+    @pytest.mark.asyncio
+    async def test_async_calls_share_one_execution(self):
+        flight = SingleFlight(enabled=True)
+        calls = []
+
+        def query(limit):
+            async def run():
+                calls.append(limit)
+                await asyncio.sleep(0.05)
+                return [limit]
+            return run
+
+        results = await asyncio.gather(
+            *(flight.do_async("test:async", query(20), params={"limit": 20}) for _ in range(5)),
+            flight.do_async("test:async", query(50), params={"limit": 50}),
+        )
+        assert results == [[20]] * 5 + [[50]]
+        # 等待者拿到的是同一个结果对象
+        assert all(result is results[0] for result in results[:5])
+        assert len(calls) == 2
+
+    def test_forget_starts_new_execution(self):
+        flight = SingleFlight(enabled=True)
+        release = threading.Event()
+        results = []
+
+        def stale_query():
+            release.wait(2)
+            return "写入前"
+
+        leader = threading.Thread(target=lambda: results.append(flight.do("test:forget", stale_query)))
+        leader.start()
+        wait_for(lambda: flight._calls)
+        # 写入提交后遗忘进行中的执行，之后的调用不再加入
+        flight.forget("test:forget")
+        assert flight.do("test:forget", lambda: "写入后") == "写入后"
+        release.set()
+        leader.join()
+        assert results == ["写入前"]
+        assert not flight._calls
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over(self):
+        flight = SingleFlight(enabled=True)
+        calls = []
+
+        async def query():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        leader = asyncio.ensure_future(flight.do_async("test:cancel", query))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do_async("test:cancel", query))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        # 首个调用被取消后，等待中的调用自行执行而不是一起失败
+        assert await follower == "ok"
+        assert len(calls) == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+
+class PollingBackend(MemoryCacheBackend):
+    """记录是否有进程在轮询共享结果"""
+
+    def __init__(self):
+        super().__init__()
+        self.polled = threading.Event()
+
+    def get(self, key):
+        if key.startswith("singleflight:result:"):
+            self.polled.set()
+        return super().get(key)
+
+
+class AsyncOnlyBackend(MemoryCacheBackend):
+    """异步路径只允许使用 *_async 方法"""
+
+    def _blocking(self, *args):
+        raise AssertionError("异步合并调用了阻塞的后端方法")
+
+    get = set = acquire_lock = release_lock = _blocking
+
+    async def get_async(self, key):
+        return MemoryCacheBackend.get(self, key)
+
+    async def set_async(self, key, value, ttl):
+        MemoryCacheBackend.set(self, key, value, ttl)
+
+    async def acquire_lock_async(self, key, token, ttl):
+        return MemoryCacheBackend.acquire_lock(self, key, token, ttl)
+
+    async def release_lock_async(self, key, token):
+        MemoryCacheBackend.release_lock(self, key, token)
+
+
+class TestSharedSingleFlight:
+    """跨进程合并测试（两个合并器共用同一缓存后端，模拟两个进程）"""
+
+    def test_waiting_worker_reads_published_result(self):
+        backend = PollingBackend()
+        first = SingleFlight(shared=backend, lock_timeout=2, result_ttl=1, enabled=True)
+        second = SingleFlight(shared=backend, lock_timeout=2, result_ttl=1, enabled=True)
+        release = threading.Event()
+        results = {}
+
+        def slow_query():
+            release.wait(2)
+            return {"total": 7}
+
+        def other_query():
+            raise AssertionError("另一进程不应重复查询")
+
+        leader = threading.Thread(
+            target=lambda: results.update(first=first.do("test:shared", slow_query, codec=JSON_CODEC))
+        )
+        leader.start()
+        wait_for(lambda: backend.get("singleflight:lock:test:shared") is not None)
+        follower = threading.Thread(
+            target=lambda: results.update(second=second.do("test:shared", other_query, codec=JSON_CODEC))
+        )
+        follower.start()
+        # 另一进程未获得锁、开始轮询结果后再完成查询
+        assert backend.polled.wait(2)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert results == {"first": {"total": 7}, "second": {"total": 7}}
+        assert backend.get("singleflight:lock:test:shared") is None
+
+    def test_forget_skips_earlier_shared_flight(self):
+        backend = MemoryCacheBackend()
+        first = SingleFlight(shared=backend, lock_timeout=2, result_ttl=1, enabled=True)
+        second = SingleFlight(shared=backend, lock_timeout=2, result_ttl=1, enabled=True)
+        release = threading.Event()
+        results = {}
+
+        def stale_query():
+            release.wait(2)
+            return {"total": 1}
+
+        leader = threading.Thread(
+            target=lambda: results.update(first=first.do("test:gen", stale_query, codec=JSON_CODEC))
+        )
+        leader.start()
+        wait_for(lambda: backend.get("singleflight:lock:test:gen") is not None)
+        # 另一进程写入后遗忘：之后的调用使用新的锁自行执行，不等待写入前开始的执行
+        second.forget("test:gen")
+        results["second"] = second.do("test:gen", lambda: {"total": 2}, codec=JSON_CODEC)
+        release.set()
+        leader.join()
+
+        assert results == {"first": {"total": 1}, "second": {"total": 2}}
+
+    def test_follower_ignores_result_of_earlier_flight(self):
+        backend = MemoryCacheBackend()
+        flight = SingleFlight(shared=backend, lock_timeout=2, result_ttl=60, enabled=True)
+        assert flight.do("test:token", lambda: {"total": 1}, codec=JSON_CODEC) == {"total": 1}
+        # 上一次执行发布的结果仍在有效期内，新的调用获得锁后重新执行
+        assert flight.do("test:token", lambda: {"total": 2}, codec=JSON_CODEC) == {"total": 2}
+
+    @pytest.mark.asyncio
+    async def test_async_uses_async_backend(self):
+        backend = AsyncOnlyBackend()
+        first = SingleFlight(shared=backend, lock_timeout=2, result_ttl=1, enabled=True)
+        second = SingleFlight(shared=backend, lock_timeout=2, result_ttl=1, enabled=True)
+        calls = []
+
+        async def query():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"total": 7}
+
+        results = await asyncio.gather(
+            first.do_async("test:async-shared", query, codec=JSON_CODEC),
+            second.do_async("test:async-shared", query, codec=JSON_CODEC),
+        )
+        assert results == [{"total": 7}] * 2
+        assert len(calls) == 1
+        await first.forget_async("test:async-shared")
+
+    def test_without_codec_stays_in_process(self):
+        backend = MemoryCacheBackend()
+        flight = SingleFlight(shared=backend, enabled=True)
+        assert flight.do("test:local", lambda: 1) == 1
+        assert len(backend) == 0
+
+    def test_memory_lock(self):
+        backend = MemoryCacheBackend()
+        assert backend.acquire_lock("lock", "a", 10)
+        assert not backend.acquire_lock("lock", "b", 10)
+        backend.release_lock("lock", "b")
+        assert not backend.acquire_lock("lock", "b", 10)
+        backend.release_lock("lock", "a")
+        assert backend.acquire_lock("lock", "b", 0.01)
+        time.sleep(0.02)
+        assert backend.acquire_lock("lock", "c", 10)
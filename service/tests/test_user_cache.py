@@ -0,0 +1,112 @@
+"""
+用户缓存测试
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.core.cache import MemoryCacheBackend
+from app.models.user import User
+from app.services.user_cache import UserCache
+
+
+def make_user() -> User:
+    """
+    构造一个未入库的用户实例
+    """
+    return User(
+        id=42,
+        email="cached@example.com",
+        username="cached",
+        hashed_password="secret-hash",
+        is_active=True,
+        is_superuser=False,
+        is_verified=False,
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+
+
+class TestUserCache:
+    """用户缓存测试类"""
+
+    def test_round_trip(self):
+        """
+        测试写入后可以读回用户快照
+        """
+        cache = UserCache(local=MemoryCacheBackend(), shared=MemoryCacheBackend(), enabled=True)
+        cache.set(make_user())
+
+        cached = cache.get(42)
+
+        assert cached is not None
+        assert cached.email == "cached@example.com"
+        assert cached.is_active is True
+        assert cached.created_at == datetime(2024, 1, 1, 12, 0, 0)
+
+    def test_password_hash_not_cached(self):
+        """
+        测试密码哈希不进入缓存
+        """
+        shared = MemoryCacheBackend()
+        cache = UserCache(local=MemoryCacheBackend(), shared=shared, enabled=True)
+        cache.set(make_user())
+
+        assert "secret-hash" not in shared.get("user:42")
+        assert cache.get(42).hashed_password is None
+
+    def test_shared_tier_fills_local(self):
+        """
+        测试本地未命中时从共享缓存回填
+        """
+        shared = MemoryCacheBackend()
+        UserCache(local=MemoryCacheBackend(), shared=shared, enabled=True).set(make_user())
+
+        local = MemoryCacheBackend()
+        cache = UserCache(local=local, shared=shared, enabled=True)
+
+        assert cache.get(42) is not None
+        assert local.get("user:42") is not None
+
+    def test_invalidate(self):
+        """
+        测试失效后两级缓存均未命中
+        """
+        shared = MemoryCacheBackend()
+        cache = UserCache(local=MemoryCacheBackend(), shared=shared, enabled=True)
+        cache.set(make_user())
+
+        cache.invalidate(42)
+
+        assert cache.get(42) is None
+        assert shared.get("user:42") is None
+
+    @pytest.mark.asyncio
+    async def test_async_api(self):
+        """
+        测试异步接口与同步接口读写同一份快照
+        """
+        shared = MemoryCacheBackend()
+        await UserCache(local=MemoryCacheBackend(), shared=shared, enabled=True).set_async(
+            make_user()
+        )
+
+        local = MemoryCacheBackend()
+        cache = UserCache(local=local, shared=shared, enabled=True)
+        cached = await cache.get_async(42)
+        assert cached.email == "cached@example.com"
+        assert local.get("user:42") is not None
+        assert cache.get(42).username == "cached"
+
+        await cache.invalidate_async(42)
+        assert await cache.get_async(42) is None
+        assert shared.get("user:42") is None
+
+    def test_disabled(self):
+        """
+        测试关闭缓存时不读写
+        """
+        cache = UserCache(local=MemoryCacheBackend(), enabled=False)
+        cache.set(make_user())
+
+        assert cache.get(42) is None